@@ -14,12 +14,17 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QDate, pyqtSignal, QObject, QByteArray
 from PyQt6.QtGui import QPixmap
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
+
+from driver_pool import acquire_driver, release_driver, get_pool
+from tender_store import TenderStore, new_run_id
+from waits import Waits
+from run_timing import (
+    RunTimer, DRIVER_STARTUP, NAVIGATION, FORM_SETUP, CAPTCHA_WAIT, SEARCH_TRIGGER, PAGE_WAIT, EXTRACTION, EXPORT
+)
 
 class ScraperSignals(QObject):
     """Signals emitted by the scraper worker thread."""
@@ -44,6 +49,10 @@ class ScraperThread(threading.Thread):
         self.tenders = []
         self.captcha_text = None      # Will be set by GUI
         self.captcha_ready_event = threading.Event()  # Signaled by GUI when user enters CAPTCHA
+        self.waits = Waits()
+        self.timer = RunTimer("cppp", params={
+            "url": url, "start_date": start_date.strftime("%Y-%m-%d"), "keywords": list(keywords)
+        })
 
     def run(self):
         """Main worker function for scraping."""
@@ -53,7 +62,14 @@ class ScraperThread(threading.Thread):
             self.signals.error.emit(str(e))
         finally:
             if self.driver:
-                self.driver.quit()
+                release_driver(self.driver, headless=False)
+            try:
+                self.waits.save()
+                report_path = self.timer.save(os.path.join(os.path.dirname(os.path.abspath(__file__)), "run-reports"))
+                self.log(self.timer.summary())
+                self.log(f"Run timing report saved to '{report_path}'")
+            except OSError as e:
+                self.log(f"Could not save the run timing report: {e}")
             self.signals.finished.emit()
 
     def log(self, msg):
@@ -65,22 +81,25 @@ class ScraperThread(threading.Thread):
         domain = self.url.split("//")[-1].split("/")[0]
         csv_filename = f"{domain}_{self.start_date.strftime('%Y-%m-%d')}.csv"
 
-        # Setup Selenium WebDriver
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install())
-        )
+        # Setup Selenium WebDriver (warm browser from the shared pool)
+        with self.timer.span(DRIVER_STARTUP):
+            self.driver = acquire_driver(headless=False)
 
         self.log("Navigating to the page...")
-        self.driver.get(self.url)
-        time.sleep(5)  # Allow the page to load
+        with self.timer.span(NAVIGATION):
+            self.driver.get(self.url)  # returns once the page has loaded
         self.log("Website loaded in Chrome.")
 
         # ---------------------------------------------------------------------
         # 1. Locate CAPTCHA IMAGE using the selector "#captchaImage"
         try:
-            captcha_img = WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#captchaImage"))
-            )
+            with self.timer.span(FORM_SETUP):
+                # Optional: gives up after the learned load time, not a flat 15s, when there is no CAPTCHA
+                captcha_img = self.waits.until(
+                    self.driver, "cppp captcha",
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "#captchaImage")),
+                    default=15, required=False,
+                )
         except Exception:
             self.log("No CAPTCHA image found or timed out waiting. Proceeding without CAPTCHA.")
             captcha_img = None
@@ -93,20 +112,26 @@ class ScraperThread(threading.Thread):
 
             self.log("Waiting for user to input CAPTCHA text in the GUI...")
             # Wait for the user to set self.captcha_text and signal that it's ready
-            self.captcha_ready_event.wait()  # Blocking wait
+            with self.timer.span(CAPTCHA_WAIT):
+                self.captcha_ready_event.wait()  # Blocking wait
 
             if self.captcha_text:
                 # Locate the CAPTCHA input field using its id "captchaText"
-                captcha_input = self.driver.find_element(By.CSS_SELECTOR, "input#captchaText")
-                captcha_input.clear()
-                captcha_input.send_keys(self.captcha_text)
+                with self.timer.span(FORM_SETUP):
+                    captcha_input = self.driver.find_element(By.CSS_SELECTOR, "input#captchaText")
+                    captcha_input.clear()
+                    captcha_input.send_keys(self.captcha_text)
 
                 try:
                     # Locate and click the submit button using its id "Submit"
-                    submit_button = self.driver.find_element(By.CSS_SELECTOR, "input#Submit")
-                    submit_button.click()
-                    self.log("Search submit button clicked. Waiting 10 seconds for page refresh...")
-                    time.sleep(10)  # Wait for the page to refresh
+                    with self.timer.span(SEARCH_TRIGGER):
+                        submit_button = self.driver.find_element(By.CSS_SELECTOR, "input#Submit")
+                        submit_button.click()
+                        self.log("Search submit button clicked. Waiting for the page to refresh...")
+                        try:
+                            self.waits.until(self.driver, "cppp submit", EC.staleness_of(submit_button), default=10)
+                        except TimeoutException:
+                            self.log("Page did not refresh after submit; continuing.")
                 except Exception as e:
                     self.log("Could not locate or click the submit button: " + str(e))
             else:
@@ -116,76 +141,97 @@ class ScraperThread(threading.Thread):
         # Now proceed with scraping the table data.
         self.log("Starting table extraction...")
 
+        page = 1
         while True:
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.XPATH, '//*[@id="table"]/tbody'))
-            )
-            table_body = self.driver.find_element(By.XPATH, '//*[@id="table"]/tbody')
-            rows = table_body.find_elements(By.TAG_NAME, "tr")
-            self.log(f"Found {len(rows)} rows on this page.")
-
-            stop_scraping = False
-
-            for row in rows[1:]:  # Skip header row
-                columns = row.find_elements(By.TAG_NAME, "td")
-                if len(columns) >= 7:
-                    s_no = columns[0].text.strip()
-                    published_date_str = columns[1].text.strip()
-                    closing_date = columns[2].text.strip()
-                    opening_date = columns[3].text.strip()
-                    tender_title = columns[4].text.strip()
-                    try:
-                        tender_link = columns[4].find_element(By.TAG_NAME, "a").get_attribute("href")
-                    except Exception:
-                        tender_link = "No Link"
-                    organisation_chain = columns[5].text.strip()
-                    tender_value = columns[6].text.strip()
-
-                    try:
-                        published_date = datetime.strptime(published_date_str, "%d-%b-%Y %I:%M %p")
-                    except ValueError as e:
-                        self.log(f"Date parsing error: {e}, skipping row.")
-                        continue
-
-                    if published_date < self.start_date:
-                        self.log(f"Published date {published_date_str} < start date. Stopping.")
-                        stop_scraping = True
-                        break
-
-                    matched = any(kw.lower() in tender_title.lower() for kw in self.keywords)
-                    if matched:
-                        self.tenders.append({
-                            "S.No": s_no,
-                            "Published Date": published_date_str,
-                            "Closing Date": closing_date,
-                            "Opening Date": opening_date,
-                            "Title": tender_title,
-                            "Link": tender_link,
-                            "Organisation Chain": organisation_chain,
-                            "Tender Value": tender_value
-                        })
+            with self.timer.span(PAGE_WAIT, page):
+                WebDriverWait(self.driver, 30).until(
+                    EC.presence_of_element_located((By.XPATH, '//*[@id="table"]/tbody'))
+                )
+            # Keyword matching happens inline, so it is counted as extraction
+            with self.timer.span(EXTRACTION, page):
+                stop_scraping = self.extract_rows()
 
             if stop_scraping:
                 break
 
             try:
-                next_button = self.driver.find_element(By.ID, "loadNext")
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                next_button.click()
-                time.sleep(5)
+                with self.timer.span(PAGE_WAIT, page + 1):
+                    next_button = self.driver.find_element(By.ID, "loadNext")
+                    old_body = self.driver.find_element(By.XPATH, '//*[@id="table"]/tbody')
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
+                    next_button.click()
+                    # The next page is in once the old table body has been replaced
+                    try:
+                        self.waits.until(self.driver, "cppp next page", EC.staleness_of(old_body), default=15)
+                    except TimeoutException:
+                        self.log(f"Page {page + 1} did not replace the previous table in time.")
+                page += 1
             except Exception as e:
                 self.log(f"No Next button found or clickable: {e}")
                 break
 
         if self.tenders:
-            df = pd.DataFrame(self.tenders)
-            df.to_csv(csv_filename, index=False)
+            # Save to the local store first; the CSV is exported from it
+            store = TenderStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), "tenders.db"))
+            try:
+                with self.timer.span(EXPORT):
+                    run_id = new_run_id()
+                    store.save_cppp_run(self.tenders, self.keywords, run_id)
+                    store.export_run(run_id, csv_filename, source="cppp")
+                self.timer.run_id = run_id
+            finally:
+                store.close()
             self.log(f"Scraping completed! Results saved to '{csv_filename}'.")
             self.signals.results_saved.emit(csv_filename)
         else:
             self.log("No matching tenders found.")
             self.signals.results_saved.emit("")
 
+    def extract_rows(self):
+        """Read the current results table into self.tenders; True once rows are older than start_date."""
+        table_body = self.driver.find_element(By.XPATH, '//*[@id="table"]/tbody')
+        rows = table_body.find_elements(By.TAG_NAME, "tr")
+        self.log(f"Found {len(rows)} rows on this page.")
+
+        for row in rows[1:]:  # Skip header row
+            columns = row.find_elements(By.TAG_NAME, "td")
+            if len(columns) >= 7:
+                s_no = columns[0].text.strip()
+                published_date_str = columns[1].text.strip()
+                closing_date = columns[2].text.strip()
+                opening_date = columns[3].text.strip()
+                tender_title = columns[4].text.strip()
+                try:
+                    tender_link = columns[4].find_element(By.TAG_NAME, "a").get_attribute("href")
+                except Exception:
+                    tender_link = "No Link"
+                organisation_chain = columns[5].text.strip()
+                tender_value = columns[6].text.strip()
+
+                try:
+                    published_date = datetime.strptime(published_date_str, "%d-%b-%Y %I:%M %p")
+                except ValueError as e:
+                    self.log(f"Date parsing error: {e}, skipping row.")
+                    continue
+
+                if published_date < self.start_date:
+                    self.log(f"Published date {published_date_str} < start date. Stopping.")
+                    return True
+
+                matched = any(kw.lower() in tender_title.lower() for kw in self.keywords)
+                if matched:
+                    self.tenders.append({
+                        "S.No": s_no,
+                        "Published Date": published_date_str,
+                        "Closing Date": closing_date,
+                        "Opening Date": opening_date,
+                        "Title": tender_title,
+                        "Link": tender_link,
+                        "Organisation Chain": organisation_chain,
+                        "Tender Value": tender_value
+                    })
+        return False
+
 class ScraperGUI(QMainWindow):
     """Main Window for the PyQt6 Web Scraping Application with CAPTCHA handling."""
     def __init__(self):
@@ -252,6 +298,9 @@ class ScraperGUI(QMainWindow):
         self.scraper_thread = None
         self.scraper_signals = None
 
+        # Launch a browser in the background while the user fills in the form
+        get_pool(headless=False).prewarm(1)
+
     def load_keywords_file(self):
         """Load keywords from a file."""
         file_dialog = QFileDialog()
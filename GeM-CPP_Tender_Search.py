@@ -6,8 +6,12 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+from chromedriver_cache import resolve_chromedriver, last_resolution
+from waits import Waits, document_ready
+from run_timing import RunTimer, DRIVER_STARTUP, NAVIGATION, CAPTCHA_WAIT, PAGE_WAIT, EXTRACTION, EXPORT
 
 # Function to load keywords
 def load_keywords():
@@ -65,89 +69,105 @@ url = "https://etenders.gov.in/eprocure/app?page=FrontEndLatestActiveTenders&ser
 domain = url.split("//")[-1].split("/")[0]  # Extract domain (e.g., "etenders.gov.in")
 csv_filename = f"{domain}_{start_date.strftime('%Y-%m-%d')}.csv"
 
+waits = Waits()
+timer = RunTimer("cppp", params={"url": url, "start_date": start_date.strftime("%Y-%m-%d"), "keywords": keywords})
+
 # Setup Selenium WebDriver
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+with timer.span(DRIVER_STARTUP):
+    driver = webdriver.Chrome(service=Service(resolve_chromedriver()))
+print(f"chromedriver resolved from {last_resolution['source']} in {last_resolution['ms']:.0f} ms.")
 
 # Initialize results list
 tenders = []
 
 def scrape_tenders():
     try:
-        driver.get(url)
-        time.sleep(15)  # Allow the page to load
+        with timer.span(NAVIGATION):
+            driver.get(url)
+            waits.until(driver, "cppp page load", document_ready, default=15)
 
         # Prompt user for Yes/No input
-        user_input = input("Please solve the CAPTCHA manually. Type 'yes' to continue or 'no' to cancel: ").strip().lower()
+        with timer.span(CAPTCHA_WAIT):
+            user_input = input("Please solve the CAPTCHA manually. Type 'yes' to continue or 'no' to cancel: ").strip().lower()
         if user_input != "yes":
             print("Exiting the scraper as per user input.")
             return  # Exit the function
 
+        page = 1
         while True:
             # Locate the table body
-            WebDriverWait(driver, 30).until(
-                EC.presence_of_element_located((By.XPATH, '//*[@id="table"]/tbody'))
-            )
+            with timer.span(PAGE_WAIT, page):
+                WebDriverWait(driver, 30).until(
+                    EC.presence_of_element_located((By.XPATH, '//*[@id="table"]/tbody'))
+                )
             table_body = driver.find_element(By.XPATH, '//*[@id="table"]/tbody')
 
-            # Find all rows in the table
-            rows = table_body.find_elements(By.TAG_NAME, "tr")
-            print(f"Found {len(rows)} rows on this page.")
-
-            stop_scraping = False
-
-            for row in rows[1:]:  # Skip the header row
-                columns = row.find_elements(By.TAG_NAME, "td")
-                if len(columns) >= 7:
-                    # Extract tender details
-                    s_no = columns[0].text.strip()
-                    published_date_str = columns[1].text.strip()
-                    closing_date = columns[2].text.strip()
-                    opening_date = columns[3].text.strip()
-                    tender_title = columns[4].text.strip()
-                    try:
-                        tender_link = columns[4].find_element(By.TAG_NAME, "a").get_attribute("href")
-                    except Exception:
-                        tender_link = "No Link"
-                    organisation_chain = columns[5].text.strip()
-                    tender_value = columns[6].text.strip()
-
-                    # Convert and filter by date
-                    try:
-                        published_date = datetime.strptime(published_date_str, "%d-%b-%Y %I:%M %p")
-                    except ValueError as e:
-                        print(f"Date parsing error: {e}, skipping row.")
-                        continue
-
-                    # Stop scraping if published_date is older than start_date
-                    if published_date < start_date:
-                        print(f"Published date {published_date_str} is earlier than start date. Stopping.")
-                        stop_scraping = True
-                        break
-
-                    # Keyword filtering across all key-value pairs
-                    matched = any(kw.lower() in tender_title.lower() for kw in keywords)
-
-                    if matched:
-                        tenders.append({
-                            "S.No": s_no,
-                            "Published Date": published_date_str,
-                            "Closing Date": closing_date,
-                            "Opening Date": opening_date,
-                            "Title": tender_title,
-                            "Link": tender_link,
-                            "Organisation Chain": organisation_chain,
-                            "Tender Value": tender_value
-                        })
+            with timer.span(EXTRACTION, page):
+                # Find all rows in the table
+                rows = table_body.find_elements(By.TAG_NAME, "tr")
+                print(f"Found {len(rows)} rows on this page.")
+
+                stop_scraping = False
+
+                for row in rows[1:]:  # Skip the header row
+                    columns = row.find_elements(By.TAG_NAME, "td")
+                    if len(columns) >= 7:
+                        # Extract tender details
+                        s_no = columns[0].text.strip()
+                        published_date_str = columns[1].text.strip()
+                        closing_date = columns[2].text.strip()
+                        opening_date = columns[3].text.strip()
+                        tender_title = columns[4].text.strip()
+                        try:
+                            tender_link = columns[4].find_element(By.TAG_NAME, "a").get_attribute("href")
+                        except Exception:
+                            tender_link = "No Link"
+                        organisation_chain = columns[5].text.strip()
+                        tender_value = columns[6].text.strip()
+
+                        # Convert and filter by date
+                        try:
+                            published_date = datetime.strptime(published_date_str, "%d-%b-%Y %I:%M %p")
+                        except ValueError as e:
+                            print(f"Date parsing error: {e}, skipping row.")
+                            continue
+
+                        # Stop scraping if published_date is older than start_date
+                        if published_date < start_date:
+                            print(f"Published date {published_date_str} is earlier than start date. Stopping.")
+                            stop_scraping = True
+                            break
+
+                        # Keyword filtering across all key-value pairs
+                        matched = any(kw.lower() in tender_title.lower() for kw in keywords)
+
+                        if matched:
+                            tenders.append({
+                                "S.No": s_no,
+                                "Published Date": published_date_str,
+                                "Closing Date": closing_date,
+                                "Opening Date": opening_date,
+                                "Title": tender_title,
+                                "Link": tender_link,
+                                "Organisation Chain": organisation_chain,
+                                "Tender Value": tender_value
+                            })
 
             if stop_scraping:
                 break
 
             # Check for the 'Next' button
             try:
-                next_button = driver.find_element(By.ID, "loadNext")
-                driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                next_button.click()
-                time.sleep(5)  # Allow the next page to load
+                with timer.span(PAGE_WAIT, page + 1):
+                    next_button = driver.find_element(By.ID, "loadNext")
+                    driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
+                    next_button.click()
+                    # The next page is in once the old table body has been replaced
+                    try:
+                        waits.until(driver, "cppp next page", EC.staleness_of(table_body), default=15)
+                    except TimeoutException:
+                        print(f"Page {page + 1} did not replace the previous table in time.")
+                page += 1
             except Exception as e:
                 print(f"No Next button found or clickable: {e}")
                 break
@@ -160,8 +180,14 @@ scrape_tenders()
 
 # Save results to CSV
 if tenders:
-    df = pd.DataFrame(tenders)
-    df.to_csv(csv_filename, index=False)
+    with timer.span(EXPORT):
+        df = pd.DataFrame(tenders)
+        df.to_csv(csv_filename, index=False)
     print(f"Scraping completed! Results saved to '{csv_filename}'.")
 else:
     print("No matching tenders found.")
+
+waits.save()
+report_path = timer.save(os.path.join(os.path.dirname(os.path.abspath(__file__)), "run-reports"))
+print(timer.summary())
+print(f"Run timing report saved to '{report_path}'")
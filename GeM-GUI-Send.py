@@ -10,14 +10,13 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import QThread, pyqtSignal, QDate
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 # New imports for webdriver_manager
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+from driver_pool import acquire_driver, release_driver
 
 
 class ScraperThread(QThread):
@@ -34,17 +33,8 @@ class ScraperThread(QThread):
     def run(self):
         try:
             self.log_signal.emit("Starting scraper...")
-            # Set up Selenium WebDriver in Headless Mode
-            options = webdriver.ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920x1080")
-            
-            # Use webdriver_manager to automatically download and manage ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
+            # Warm headless browser from the shared pool
+            driver = acquire_driver()
 
             # Open the GeM website
             url = "https://bidplus.gem.gov.in/advance-search"
@@ -118,7 +108,7 @@ class ScraperThread(QThread):
                 self.log_signal.emit("Results loaded successfully!")
             except:
                 self.log_signal.emit("Results section did not load.")
-                driver.quit()
+                release_driver(driver)
                 self.finished_signal.emit()
                 return
 
@@ -286,7 +276,7 @@ class ScraperThread(QThread):
             df_all.to_excel(filename1, index=False)
             self.log_signal.emit(f"All tender data saved to '{filename1}'")
             self.log_signal.emit("Scraping completed successfully!")
-            driver.quit()
+            release_driver(driver)
 
         except Exception as e:
             self.log_signal.emit(f"An error occurred: {str(e)}")
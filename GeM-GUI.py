@@ -10,11 +10,12 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import QThread, pyqtSignal, QDate
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from driver_pool import acquire_driver, release_driver
+
 
 class ScraperThread(QThread):
     # Signal to update log text in the UI
@@ -30,14 +31,8 @@ class ScraperThread(QThread):
     def run(self):
         try:
             self.log_signal.emit("Starting scraper...")
-            # Set up Selenium WebDriver in Headless Mode
-            options = webdriver.ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920x1080")
-            driver = webdriver.Chrome(options=options)
+            # Warm headless browser from the shared pool
+            driver = acquire_driver()
 
             # Open the GeM website
             url = "https://bidplus.gem.gov.in/advance-search"
@@ -111,7 +106,7 @@ class ScraperThread(QThread):
                 self.log_signal.emit("Results loaded successfully!")
             except:
                 self.log_signal.emit("Results section did not load.")
-                driver.quit()
+                release_driver(driver)
                 self.finished_signal.emit()
                 return
 
@@ -211,7 +206,7 @@ class ScraperThread(QThread):
             df = pd.DataFrame(tender_list)
             df.to_excel(filename, index=False)
             self.log_signal.emit(f"Filtered tender data saved to '{filename}'")
-            driver.quit()
+            release_driver(driver)
 
         except Exception as e:
             self.log_signal.emit(f"An error occurred: {str(e)}")
@@ -10,62 +10,15 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import QThread, pyqtSignal, QDate
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 # New imports for webdriver_manager and BeautifulSoup
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
-BASE_KEYWORDS = [
-    "hose", "hoses",
-    "pdc bit", "pdc bits",
-    "gate valve", "gate valves", "gate-valve", "gate-valves",
-    "ball valve", "ball valves", "ball-valve", "ball-valves",
-    "check valve", "check valves", "check-valve", "check-valves",
-    "choke", "chokes",
-    "well head", "well heads", "well-head", "well-heads",
-    "well test equipment", "well-test equipment", "well test equipments", "well-test equipments",
-    "christmas tree", "xmas tree", "x-mas tree", "christmas-tree", "x-mas-tree", "x-mas", "christmas", "xmas", 
-    "bop",
-    "blowout preventer", "blowout preventers", "blow-out preventer", "blow-out preventers", "blowout-preventer",
-    "manifold", "manifolds",
-    "well contain", "well contains", "well-contain", "well-contains",
-    "onshore", "on shore", "on-shore",
-    "offshore", "off shore", "off-shore",
-    "subsea application", "subsea applications", "subsea-application", "subsea-applications",
-    "hi-lo safety valve", "hi-lo safety valves", "hi lo safety valve", "hi lo safety valves", "hi-lo-safety-valve", "hi-lo-safety-valves",
-    "charter hire rig", "charter hire rigs", "charter-hire rig", "charter-hire rigs",
-    "remote monitoring", "remote-monitoring", "remote monitor", "remote-monitor",
-    "realtime monitoring", "real-time monitoring", "real time monitoring", "realtime-monitoring", "real-time-monitoring",
-    "well stimulation", "well-stimulation", "well stimulations", "well-stimulations",
-    "acidizing", "acidising",
-    "hf / hcl", "hf/hcl", "hydrofluoric acid / hydrochloric acid", "hydrofluoric acid/hydrochloric acid", "hf & hcl", "hf and hcl",
-    "mopu",
-    "engineering services", "engineering-services",
-    "lost circulation control additive", "lost circulation control additives", "lost-circulation-control additive", "lost-circulation-control additives",
-    "lcca",
-    "cement additive", "cement additives", "cement-additive", "cement-additives",
-    "downhole gauge", "downhole gauges", "downhole-gauge", "downhole-gauges",
-    "tubing encapsulated cable", "tubing encapsulated cables", "tubing-encapsulated cable", "tubing-encapsulated cables", "tec", "t.e.c.",
-    "control line", "control lines", "control-line", "control-lines",
-    "drone", "drones",
-    "piper", "pipers",
-    "free floating piper", "free floating pipers", "free-floating piper", "free-floating pipers",
-    "carbon mapping", "carbon-mapping",
-    "carbon footprint", "carbon footprints", "carbon-footprint", "carbon-footprints",
-    "ccus", "carbon capture utilization and storage", "carbon capture, utilization and storage",
-    "live rig monitoring", "live-rig monitoring", "live rig-monitoring", "live-rig-monitoring",
-    "analytics", "analytic",
-    "production testing service", "production testing services", "production-testing-service", "production-testing-services",
-    "heavy weight drill pipe", "heavy weight drill pipes", "heavy-weight drill pipe", "heavy-weight drill pipes", "heavyweight drill pipe", "heavyweight drill pipes",
-    "drill collar", "drill collars", "drill-collar", "drill-collars",
-    "enhanced oil recovery", "enhanced-oil recovery", "eor",
-    "esp", "electric submersible pump", "electric submersible pumps", "electric-submersible pump", "electric-submersible pumps"
-]
+from driver_pool import acquire_driver, release_driver
+from keyword_taxonomy import CONCEPTS, compile_concepts, user_concepts
 
 class ScraperThread(QThread):
     log_signal = pyqtSignal(str)
@@ -78,26 +31,16 @@ class ScraperThread(QThread):
         self.end_date     = end_date
 
         # parse anything the user typed
-        user_kw = [k.strip().lower() for k in keywords_str.split(',') if k.strip()]
+        user_kw = user_concepts(keywords_str)
 
-        # combine with your hard-coded list, dedupe via a set
-        combined = list(dict.fromkeys(BASE_KEYWORDS + user_kw))
-        self.keywords = combined
+        # combine with the shared concept taxonomy; the compiled matcher folds plurals, hyphens and punctuation
+        self.matcher = compile_concepts({**CONCEPTS, **user_kw})
 
     def run(self):
         try:
             self.log_signal.emit("Starting scraper...")
-            # Set up Selenium WebDriver in Headless Mode
-            options = webdriver.ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920x1080")
-
-            # Use webdriver_manager to automatically download and manage ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
+            # Warm headless browser from the shared pool
+            driver = acquire_driver()
 
             # Open the GeM website
             url = "https://bidplus.gem.gov.in/advance-search"
@@ -171,7 +114,7 @@ class ScraperThread(QThread):
                 self.log_signal.emit("Results loaded successfully!")
             except:
                 self.log_signal.emit("Results section did not load.")
-                driver.quit()
+                release_driver(driver)
                 self.finished_signal.emit()
                 return
 
@@ -245,7 +188,7 @@ class ScraperThread(QThread):
                         end_date_text = "N/A"
 
                     # 6) Keyword filtering
-                    if any(kw in item_desc_full.lower() for kw in self.keywords):
+                    if self.matcher.first(item_desc_full):
                         tender_list_filtered.append({
                             "BID NO": bid_no,
                             "Link": bid_link,
@@ -298,7 +241,7 @@ class ScraperThread(QThread):
             df_all.to_excel(filename1, index=False)
             self.log_signal.emit(f"All tender data saved to '{filename1}'")
             self.log_signal.emit("Scraping completed successfully!")
-            driver.quit()
+            release_driver(driver)
 
         except Exception as e:
             self.log_signal.emit(f"An error occurred: {str(e)}")
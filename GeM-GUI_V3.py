@@ -11,63 +11,17 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import QThread, pyqtSignal, QDate
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 # New imports for webdriver_manager and BeautifulSoup
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
-BASE_KEYWORDS = [
-    "hose", "hoses",
-    "pdc bit", "pdc bits", "bit" "bits"
-    "gate valve", "gate valves", "gate-valve", "gate-valves",
-    "ball valve", "ball valves", "ball-valve", "ball-valves",
-    "check valve", "check valves", "check-valve", "check-valves",
-    "choke", "chokes",
-    "well head", "well heads", "well-head", "well-heads",
-    "well test equipment", "well-test equipment", "well test equipments", "well-test equipments",
-    "christmas tree", "xmas tree", "x-mas tree", "christmas-tree", "x-mas-tree", "x-mas", "christmas", "xmas", 
-    "bop",
-    "blowout preventer", "blowout preventers", "blow-out preventer", "blow-out preventers", "blowout-preventer",
-    "manifold", "manifolds",
-    "well contain", "well contains", "well-contain", "well-contains",
-    "onshore", "on shore", "on-shore",
-    "offshore", "off shore", "off-shore",
-    "subsea application", "subsea applications", "subsea-application", "subsea-applications",
-    "hi-lo safety valve", "hi-lo safety valves", "hi lo safety valve", "hi lo safety valves", "hi-lo-safety-valve", "hi-lo-safety-valves",
-    "charter hire rig", "charter hire rigs", "charter-hire rig", "charter-hire rigs",
-    "remote monitoring", "remote-monitoring", "remote monitor", "remote-monitor",
-    "realtime monitoring", "real-time monitoring", "real time monitoring", "realtime-monitoring", "real-time-monitoring",
-    "well stimulation", "well-stimulation", "well stimulations", "well-stimulations",
-    "acidizing", "acidising",
-    "hf / hcl", "hf/hcl", "hydrofluoric acid / hydrochloric acid", "hydrofluoric acid/hydrochloric acid", "hf & hcl", "hf and hcl",
-    "mopu",
-    "engineering services", "engineering-services",
-    "lost circulation control additive", "lost circulation control additives", "lost-circulation-control additive", "lost-circulation-control additives",
-    "lcca",
-    "cement additive", "cement additives", "cement-additive", "cement-additives",
-    "downhole gauge", "downhole gauges", "downhole-gauge", "downhole-gauges",
-    "tubing encapsulated cable", "tubing encapsulated cables", "tubing-encapsulated cable", "tubing-encapsulated cables", "tec", "t.e.c.",
-    "control line", "control lines", "control-line", "control-lines",
-    "drone", "drones",
-    "piper", "pipers",
-    "free floating piper", "free floating pipers", "free-floating piper", "free-floating pipers",
-    "carbon mapping", "carbon-mapping",
-    "carbon footprint", "carbon footprints", "carbon-footprint", "carbon-footprints",
-    "ccus", "carbon capture utilization and storage", "carbon capture, utilization and storage",
-    "live rig monitoring", "live-rig monitoring", "live rig-monitoring", "live-rig-monitoring",
-    "analytics", "analytic",
-    "production testing service", "production testing services", "production-testing-service", "production-testing-services",
-    "heavy weight drill pipe", "heavy weight drill pipes", "heavy-weight drill pipe", "heavy-weight drill pipes", "heavyweight drill pipe", "heavyweight drill pipes",
-    "drill collar", "drill collars", "drill-collar", "drill-collars",
-    "enhanced oil recovery", "enhanced-oil recovery", "eor",
-    "esp", "electric submersible pump", "electric submersible pumps", "electric-submersible pump", "electric-submersible pumps"
-]
+from driver_pool import acquire_driver, release_driver
+from keyword_taxonomy import CONCEPTS, user_concepts
+from keyword_frame import FrameMatcher, match_frame
 
 class ScraperThread(QThread):
     log_signal = pyqtSignal(str)
@@ -81,35 +35,22 @@ class ScraperThread(QThread):
         self.search_keywords = False
 
         # parse anything the user typed
-        user_kw = [k.strip().lower() for k in keywords_str.split(',') if k.strip()]
+        user_kw = user_concepts(keywords_str)
 
         if user_kw:
-            self.keywords = user_kw  # Only user-defined
+            self.concepts = user_kw  # Only user-defined
             self.log_signal.emit("Using only user-defined keywords.")
             self.search_keywords = True
         else:
-            self.keywords = BASE_KEYWORDS  # Use full base list
+            self.concepts = CONCEPTS  # Use full base taxonomy
             self.log_signal.emit("No keywords entered. Using full predefined list.")
 
-    def normalize(self, text):
-        import re
-        return re.sub(r'\W+', ' ', text.lower()).strip()
-
 
     def run(self):
         try:
             self.log_signal.emit("Starting scraper...")
-            # Set up Selenium WebDriver in Headless Mode
-            options = webdriver.ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920x1080")
-
-            # Use webdriver_manager to automatically download and manage ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
+            # Warm headless browser from the shared pool
+            driver = acquire_driver()
 
             # Open the GeM website
             url = "https://bidplus.gem.gov.in/advance-search"
@@ -183,12 +124,11 @@ class ScraperThread(QThread):
                 self.log_signal.emit("Results loaded successfully!")
             except:
                 self.log_signal.emit("Results section did not load.")
-                driver.quit()
+                release_driver(driver)
                 self.finished_signal.emit()
                 return
 
             tender_list = []
-            tender_list_filtered = []
             page_num = 1
 
             while True:
@@ -206,7 +146,7 @@ class ScraperThread(QThread):
                         self.log_signal.emit("Results loaded successfully on retry!")
                     except:
                         self.log_signal.emit("Results section did not load after retry.")
-                        driver.quit()
+                        release_driver(driver)
                         self.finished_signal.emit()
                         return
 
@@ -320,20 +260,13 @@ class ScraperThread(QThread):
 
             self.log_signal.emit("Applying keyword filtering to all collected tenders...")
 
-            for tender in tender_list:
-                desc_clean = self.normalize(tender["Item Description"])
-                matched_kw = None
-                for kw in self.keywords:
-                    if self.normalize(kw) in desc_clean:
-                        matched_kw = kw
-                        break
-                if matched_kw:
-                    tender_copy = tender.copy()
-                    tender_copy["Matched Keyword"] = matched_kw
-                    tender_list_filtered.append(tender_copy)
+            # One vectorized pass over the whole batch instead of a loop per tender
+            df_all = pd.DataFrame(tender_list)
+            df_matched = match_frame(df_all, matcher=FrameMatcher(self.concepts))
+            df = df_matched[df_matched["Matched Keyword"] != ""]
 
             self.log_signal.emit(f"Total tenders scraped: {len(tender_list)}")
-            self.log_signal.emit(f"Tenders matched by keywords: {len(tender_list_filtered)}")
+            self.log_signal.emit(f"Tenders matched by keywords: {len(df)}")
 
             if self.search_keywords:  # user provided custom keyword
                 filename = os.path.join(app_path, f"{today_str}-{org_short}-search.xlsx")
@@ -343,16 +276,14 @@ class ScraperThread(QThread):
     
             # filename = os.path.join(app_path, f"{today_str}-{org_short}-filtered.xlsx")
             filename1 = os.path.join(app_path, f"{today_str}-{org_short}-all.xlsx")
-            df = pd.DataFrame(tender_list_filtered)
-            df.drop_duplicates(subset=["BID NO"], inplace=True)
-            df.reset_index(drop=True, inplace=True)
+            if not df.empty:
+                df = df.drop_duplicates(subset=["BID NO"]).reset_index(drop=True)
             df.to_excel(filename, index=False)
             self.log_signal.emit(f"Filtered tender data saved to '{filename}'")
-            df_all = pd.DataFrame(tender_list)
             df_all.to_excel(filename1, index=False)
             self.log_signal.emit(f"All tender data saved to '{filename1}'")
             self.log_signal.emit("Scraping completed successfully!")
-            driver.quit()
+            release_driver(driver)
 
         except Exception as e:
             self.log_signal.emit(f"An error occurred: {str(e)}")
@@ -2,364 +2,928 @@ import sys
 import os
 import time
 import pandas as pd
+import requests
 from datetime import datetime
 import re
+import glob
+import csv
+import threading
+import shutil
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed, FIRST_COMPLETED, wait as wait_futures
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QComboBox, QDateEdit, QPushButton, QTextEdit, QLineEdit
+    QLabel, QComboBox, QDateEdit, QPushButton, QTextEdit, QLineEdit, QSpinBox,
+    QCheckBox
 )
-from PyQt6.QtCore import QThread, pyqtSignal, QDate
+from PyQt6.QtCore import QThread, pyqtSignal, QDate, Qt
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 # New imports for webdriver_manager and BeautifulSoup
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
-BASE_KEYWORDS = [
-    "hose", "hoses",
-    "pdc bit", "pdc bits", "bit" "bits"
-    "gate valve", "gate valves", "gate-valve", "gate-valves",
-    "ball valve", "ball valves", "ball-valve", "ball-valves",
-    "check valve", "check valves", "check-valve", "check-valves",
-    "choke", "chokes",
-    "well head", "well heads", "well-head", "well-heads",
-    "well test equipment", "well-test equipment", "well test equipments", "well-test equipments",
-    "christmas tree", "xmas tree", "x-mas tree", "christmas-tree", "x-mas-tree", "x-mas", "christmas", "xmas", 
-    "bop",
-    "blowout preventer", "blowout preventers", "blow-out preventer", "blow-out preventers", "blowout-preventer",
-    "manifold", "manifolds",
-    "well contain", "well contains", "well-contain", "well-contains",
-    "onshore", "on shore", "on-shore",
-    "offshore", "off shore", "off-shore",
-    "subsea application", "subsea applications", "subsea-application", "subsea-applications",
-    "hi-lo safety valve", "hi-lo safety valves", "hi lo safety valve", "hi lo safety valves", "hi-lo-safety-valve", "hi-lo-safety-valves",
-    "charter hire rig", "charter hire rigs", "charter-hire rig", "charter-hire rigs",
-    "remote monitoring", "remote-monitoring", "remote monitor", "remote-monitor",
-    "realtime monitoring", "real-time monitoring", "real time monitoring", "realtime-monitoring", "real-time-monitoring",
-    "well stimulation", "well-stimulation", "well stimulations", "well-stimulations",
-    "acidizing", "acidising",
-    "hf / hcl", "hf/hcl", "hydrofluoric acid / hydrochloric acid", "hydrofluoric acid/hydrochloric acid", "hf & hcl", "hf and hcl",
-    "mopu",
-    "engineering services", "engineering-services",
-    "lost circulation control additive", "lost circulation control additives", "lost-circulation-control additive", "lost-circulation-control additives",
-    "lcca",
-    "cement additive", "cement additives", "cement-additive", "cement-additives",
-    "downhole gauge", "downhole gauges", "downhole-gauge", "downhole-gauges",
-    "tubing encapsulated cable", "tubing encapsulated cables", "tubing-encapsulated cable", "tubing-encapsulated cables", "tec", "t.e.c.",
-    "control line", "control lines", "control-line", "control-lines",
-    "drone", "drones",
-    "piper", "pipers",
-    "free floating piper", "free floating pipers", "free-floating piper", "free-floating pipers",
-    "carbon mapping", "carbon-mapping",
-    "carbon footprint", "carbon footprints", "carbon-footprint", "carbon-footprints",
-    "ccus", "carbon capture utilization and storage", "carbon capture, utilization and storage",
-    "live rig monitoring", "live-rig monitoring", "live rig-monitoring", "live-rig-monitoring",
-    "analytics", "analytic",
-    "production testing service", "production testing services", "production-testing-service", "production-testing-services",
-    "heavy weight drill pipe", "heavy weight drill pipes", "heavy-weight drill pipe", "heavy-weight drill pipes", "heavyweight drill pipe", "heavyweight drill pipes",
-    "drill collar", "drill collars", "drill-collar", "drill-collars",
-    "enhanced oil recovery", "enhanced-oil recovery", "eor",
-    "esp", "electric submersible pump", "electric submersible pumps", "electric-submersible pump", "electric-submersible pumps"
-]
+from gem_extract import extract_page
+from gem_http import GEM_BASE_URL, MINISTRY, GemSearchClient, GemContractError
+from gem_pages import read_total_pages, goto_page, split_page_range
+from driver_pool import acquire_driver, release_driver, get_pool
+from chromedriver_cache import last_resolution
+from tender_store import TenderStore, new_run_id
+from checkpoint import PageCheckpoint, RunState
+from fast_load import FastLoad
+from gem_capture import XhrCapture
+from keyword_taxonomy import CONCEPTS, compile_concepts, user_concepts
+from keyword_frame import FrameMatcher, iter_matched
+from fuzzy_matcher import FuzzyMatcher
+from waits import Waits, document_ready, results_ready
+from gem_form import OptionCache, fill_form, load_organizations
+from date_shards import PROFILE_PATH as SHARD_PROFILE_PATH, ShardPlanner
+from run_timing import (
+    RunTimer, DRIVER_STARTUP, NAVIGATION, FORM_SETUP, SEARCH_TRIGGER, PAGE_WAIT, EXTRACTION, MATCHING, EXPORT
+)
+
+
+def app_dir():
+    """Folder the exports (and local databases) live in, next to the script or frozen exe."""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+LIVE_COLUMNS = ["BID NO", "Matched Keyword", "Matched Concepts", "Item Description", "Quantity",
+                "Department", "Start Date", "End Date", "Link", "Page", "Organization"]
+
+# Organization choice that sweeps every organization under the ministry
+ALL_ORGANIZATIONS = "ALL ORGANIZATIONS"
+SEARCH_WORKERS = 4  # searches a sweep or sharded run keeps going when the page workers setting is left at 1
+
 
 class ScraperThread(QThread):
     log_signal = pyqtSignal(str)
+    match_signal = pyqtSignal(dict)  # one matched tender record, as soon as its page is scraped
     finished_signal = pyqtSignal()
 
-    def __init__(self, organization, start_date, end_date, keywords_str, parent=None):
+    def __init__(self, organization, start_date, end_date, keywords_str, extract_mode="script",
+                 fetch_mode="browser", workers=1, incremental=False, known_page_limit=0, fast_load=False,
+                 fuzzy=False, shard=False, resume_state=None, base_url=GEM_BASE_URL, data_dir=None,
+                 matcher=None, waits=None, option_cache=None, page_load=None, parent=None):
         super().__init__(parent)
         self.organization = organization
         self.start_date   = start_date
         self.end_date     = end_date
-        self.search_keywords = False
+        self.extract_mode = extract_mode
+        # Capture mode needs browsers that record the performance log (a separate pool)
+        self.capture_log = extract_mode == "capture"
+        self.fetch_mode = fetch_mode
+        self.workers = workers
+        self.incremental = incremental
+        # Incremental mode stops after this many fully-known pages in a row; 0 pages through everything
+        self.known_page_limit = known_page_limit
+        # Split the date range into concurrently searched windows (see scrape_shards)
+        self.shard = shard
+        self.shard_profile_path = SHARD_PROFILE_PATH
+        # Overridable so a run can be pointed at mock_gem_portal.py and a scratch folder
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.data_dir = data_dir or app_dir()
+        # page_load, matcher, waits and option_cache are passed in by a parent run so its
+        # child scrapers share what it already compiled and loaded
+        self.fast_load = page_load if page_load is not None else FastLoad(enabled=fast_load)
+        self.store = None
+        self.run_id = None
+        self.checkpoint = None
+        self.keywords_str = keywords_str
+        self.state = resume_state
 
-        # parse anything the user typed
-        user_kw = [k.strip().lower() for k in keywords_str.split(',') if k.strip()]
+        # parse anything the user typed; without any, use the full base taxonomy
+        user_kw = user_concepts(keywords_str)
+        self.search_keywords = bool(user_kw)
+        self.concepts = user_kw or CONCEPTS
 
-        if user_kw:
-            self.keywords = user_kw  # Only user-defined
-            self.log_signal.emit("Using only user-defined keywords.")
-            self.search_keywords = True
+        # Per-page matching while scraping; compiled once and shared by the page workers
+        self.fuzzy = fuzzy
+        if matcher is not None:
+            self.matcher = matcher
+        elif fuzzy:
+            self.matcher = FuzzyMatcher(self.concepts)
         else:
-            self.keywords = BASE_KEYWORDS  # Use full base list
-            self.log_signal.emit("No keywords entered. Using full predefined list.")
-
-    def normalize(self, text):
-        import re
-        return re.sub(r'\W+', ' ', text.lower()).strip()
+            self.matcher = compile_concepts(self.concepts)
+        self.live_lock = threading.Lock()
+        self.live_seen = set()
+        self.live_path = None
+        # Stage timings of the current run; replaced with a fresh timer at the start of run()
+        self.timer = RunTimer("gem")
+        # Condition-based waits with timeouts learned over previous runs
+        self.waits = waits if waits is not None else Waits()
+        # Organization options per ministry, so the form can be filled without dropdown round trips
+        self.option_cache = option_cache if option_cache is not None else OptionCache()
+        # True for the per-organization scrapers of a ministry sweep
+        self.in_sweep = False
+        self.label = organization
+        self.found = 0  # bids seen on result pages, before incremental filtering
 
 
     def run(self):
         try:
             self.log_signal.emit("Starting scraper...")
-            # Set up Selenium WebDriver in Headless Mode
-            options = webdriver.ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920x1080")
-
-            # Use webdriver_manager to automatically download and manage ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-
-            # Open the GeM website
-            url = "https://bidplus.gem.gov.in/advance-search"
+            if self.search_keywords:
+                self.log_signal.emit("Using only user-defined keywords.")
+            else:
+                self.log_signal.emit("No keywords entered. Using full predefined list.")
+            if self.fuzzy:
+                self.log_signal.emit("Fuzzy matching on: misspelled keywords (1 edit) count as matches.")
+            self.store = TenderStore(os.path.join(self.data_dir, "tenders.db"))
+            if self.incremental:
+                self.log_signal.emit("Incremental mode: only new or changed bids will be processed.")
+
+            checkpoint_dir = os.path.join(self.data_dir, "checkpoints")
+            self.live_path = self.output_path("search-live" if self.search_keywords else "filtered-live", "csv")
+            if self.state is not None:
+                self.run_id = self.state.run_id
+                self.log_signal.emit(
+                    f"Resuming run {self.run_id}: {len(self.state.completed_pages)} page(s) already "
+                    f"checkpointed, continuing from Page {self.state.next_page()}."
+                )
+            else:
+                self.run_id = new_run_id()
+                # A fresh run starts its live filtered file over; a resumed run keeps appending
+                if os.path.exists(self.live_path):
+                    os.remove(self.live_path)
+                self.state = RunState(os.path.join(checkpoint_dir, f"{self.run_id}.state.json"), self.run_params())
+                self.state.save()
+            self.timer = RunTimer("gem", self.run_id, self.run_params())
+
+            # Every page is appended here as soon as it is extracted
+            self.checkpoint = PageCheckpoint(os.path.join(checkpoint_dir, f"{self.run_id}.jsonl"))
+            # Part files left behind by page workers of a killed run
+            leftovers = sorted(
+                glob.glob(self.checkpoint.path + ".part*"),
+                key=lambda path: int(path.rsplit(".part", 1)[1]),
+            )
+            if leftovers:
+                parts = [PageCheckpoint(path) for path in leftovers]
+                self.checkpoint.merge_from(parts)
+                for part in parts:
+                    part.remove()
+
+            scraped = self.scrape(self.checkpoint)
+            if scraped is None:
+                self.log_signal.emit(
+                    f"Pages scraped so far are kept in '{self.checkpoint.path}'. "
+                    "Use 'Resume Last Run' to continue from the next page."
+                )
+                self.finished_signal.emit()
+                return
+
+            # Pages checkpointed before a resume count towards this run as well
+            scraped = self.checkpoint.count()
+            if scraped:
+                with self.timer.span(EXPORT):
+                    stored = self.store.upsert_gem(self.checkpoint.iter_records(), self.organization, self.run_id)
+                self.log_signal.emit(f"Saved {stored} tenders to the local store.")
+                self.export_results(scraped)
+            else:
+                self.log_signal.emit("No new tenders to export.")
+            self.checkpoint.remove()
+            self.state.remove()
+            self.log_signal.emit("Scraping completed successfully!")
+
+        except Exception as e:
+            self.log_signal.emit(f"An error occurred: {str(e)}")
+        finally:
+            if self.fast_load.pages:
+                try:
+                    summary = self.fast_load.summary()
+                    if summary:
+                        self.log_signal.emit(summary)
+                    self.fast_load.save()
+                except OSError as e:
+                    self.log_signal.emit(f"Could not save the page load profile: {str(e)}")
+            try:
+                summary = self.waits.summary()
+                if summary:
+                    self.log_signal.emit(summary)
+                self.waits.save()
+            except OSError as e:
+                self.log_signal.emit(f"Could not save the learned wait timeouts: {str(e)}")
+            try:
+                report_path = self.timer.save(os.path.join(self.data_dir, "run-reports"))
+                self.log_signal.emit(self.timer.summary())
+                self.log_signal.emit(f"Run timing report saved to '{report_path}'")
+            except OSError as e:
+                self.log_signal.emit(f"Could not save the run timing report: {str(e)}")
+            if self.store is not None:
+                self.store.close()
+                self.store = None
+            if self.checkpoint is not None:
+                self.checkpoint.close()
+                self.checkpoint = None
+        self.finished_signal.emit()
+
+    def run_params(self):
+        """What a resumed run needs to rebuild this thread."""
+        return {
+            "run_id": self.run_id,
+            "organization": self.organization,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "keywords_str": self.keywords_str,
+            "extract_mode": self.extract_mode,
+            "fetch_mode": self.fetch_mode,
+            "workers": self.workers,
+            "incremental": self.incremental,
+            "known_page_limit": self.known_page_limit,
+            "fast_load": self.fast_load.enabled,
+            "fuzzy": self.fuzzy,
+            "shard": self.shard,
+        }
+
+    def scrape(self, sink):
+        """Scrape into sink over HTTP or the browser; None if the run stopped early (and can be resumed)."""
+        if self.organization == ALL_ORGANIZATIONS:
+            return self.scrape_ministry(sink)
+        if self.shard:
+            return self.scrape_shards(sink)
+        scraped = None
+        if self.fetch_mode == "http":
+            scraped = self.scrape_with_http(sink)
+        if scraped is None:
+            scraped = self.scrape_with_browser(sink)
+        return scraped
+
+    def search_workers(self, jobs=None):
+        """How many searches a sweep or sharded run keeps going at once."""
+        workers = self.workers if self.workers > 1 else SEARCH_WORKERS
+        return max(1, min(jobs, workers)) if jobs is not None else workers
+
+    def discover_organizations(self):
+        """Names of every organization under the ministry, from the option cache or the search form."""
+        cached = self.option_cache.organizations(MINISTRY)
+        if cached:
+            self.log_signal.emit(f"{len(cached)} organizations under the ministry (cached list).")
+            return [text for _, text in cached]
+        driver = self.make_driver()
+        try:
+            with self.timer.span(NAVIGATION):
+                driver.get(urljoin(self.base_url, "advance-search"))
+            with self.timer.span(FORM_SETUP):
+                options = load_organizations(driver, self.waits, MINISTRY, self.option_cache)
+        finally:
+            release_driver(driver, capture=self.capture_log)
+        self.log_signal.emit(f"{len(options)} organizations under the ministry (read from the search form).")
+        return [text for _, text in options]
+
+    def child_scraper(self, folder, label, organization=None, start_date=None, end_date=None):
+        """A plain scraper for one slice of this run (an organization or a date window), sharing its store and output."""
+        scraper = ScraperThread(
+            organization or self.organization, start_date or self.start_date, end_date or self.end_date,
+            self.keywords_str, extract_mode=self.extract_mode, fetch_mode=self.fetch_mode, workers=1,
+            incremental=self.incremental, known_page_limit=self.known_page_limit,
+            fuzzy=self.fuzzy, base_url=self.base_url, data_dir=self.data_dir,
+            matcher=self.matcher, waits=self.waits, option_cache=self.option_cache, page_load=self.fast_load,
+        )
+        scraper.label = label
+        scraper.run_id = self.run_id
+        scraper.store = self.store
+        scraper.live_lock, scraper.live_seen, scraper.live_path = self.live_lock, self.live_seen, self.live_path
+
+        # Progress of each slice lives in folder, so a resumed run skips what already finished
+        name = re.sub(r"[^\w.-]+", "_", label).lower()
+        state_path = os.path.join(folder, f"{name}.state.json")
+        if os.path.exists(state_path):
+            scraper.state = RunState.load(state_path)
+        else:
+            scraper.state = RunState(state_path, scraper.run_params())
+        scraper.checkpoint = PageCheckpoint(os.path.join(folder, f"{name}.jsonl"))
+
+        # Called from the pool threads directly; the GUI still receives them queued
+        scraper.log_signal.connect(lambda message: self.log_signal.emit(f"[{label}] {message}"),
+                                   Qt.ConnectionType.DirectConnection)
+        scraper.match_signal.connect(self.match_signal.emit, Qt.ConnectionType.DirectConnection)
+        return scraper
+
+    def run_children(self, sink, next_scraper, workers, kind, on_done=None):
+        """Run child scrapers on `workers` threads, merging each into sink as soon as it finishes.
+
+        next_scraper() returns the next child to start (None when there are
+        none left) and is only called when a worker frees up, so later
+        children can be planned from what on_done(scraper, scraped) saw of
+        earlier ones. Merging keeps the first copy of each BID NO. Returns
+        (tenders written, labels of the children that failed).
+        """
+        def scrape_one(scraper):
+            # Timed from when a worker picks the slice up, not from when it was planned
+            scraper.timer = RunTimer("gem", self.run_id, {
+                "organization": scraper.organization, "start_date": scraper.start_date, "end_date": scraper.end_date,
+            })
+            return scraper.scrape(scraper.checkpoint)
+
+        written, failed = 0, []
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+
+            def submit():
+                scraper = next_scraper()
+                if scraper is not None:
+                    futures[pool.submit(scrape_one, scraper)] = scraper
+                return scraper is not None
+
+            while len(futures) < workers and submit():
+                pass
+            while futures:
+                done, _ = wait_futures(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    scraper = futures.pop(future)
+                    try:
+                        scraped = future.result()
+                    except Exception as e:
+                        self.log_signal.emit(f"[{scraper.label}] An error occurred: {str(e)}")
+                        scraped = None
+                    self.timer.add_part(scraper.label, scraper.timer)
+                    if on_done is not None:
+                        on_done(scraper, scraped)
+                    if scraped is None:
+                        failed.append(scraper.label)
+                        scraper.checkpoint.close()
+                    else:
+                        added = sink.merge_from([scraper.checkpoint])
+                        written += added
+                        scraper.state.params["complete"] = True
+                        scraper.state.save()
+                        scraper.checkpoint.remove()
+                        self.log_signal.emit(
+                            f"[{scraper.label}] {scraped} tenders in {self.timer.parts[scraper.label]['total_secs']:.1f}s "
+                            f"({added} added after BID NO dedup)."
+                        )
+                    submit()
+
+        parts = self.timer.parts
+        if parts:
+            slowest = max(parts, key=lambda label: parts[label]["total_secs"])
+            self.log_signal.emit(
+                f"{kind} took {time.perf_counter() - started:.1f}s; slowest {slowest} "
+                f"{parts[slowest]['total_secs']:.1f}s, {sum(p['total_secs'] for p in parts.values()):.1f}s "
+                "if run one after another."
+            )
+        if failed:
+            self.log_signal.emit(f"{len(failed)} of them did not finish: {', '.join(failed)}")
+        return written, failed
+
+    def scrape_ministry(self, sink):
+        """Scrape every organization under the ministry on a bounded pool, merging them into sink.
+
+        Each organization is an ordinary single-organization scrape with its
+        own browser (or HTTP session) and checkpoint, so the sweep takes about
+        as long as the slowest organization. Returns None if any organization
+        failed; the finished ones are kept for a resume.
+        """
+        organizations = self.discover_organizations()
+        if not organizations:
+            self.log_signal.emit("No organizations found under the ministry.")
+            return None
+
+        folder = os.path.join(os.path.dirname(sink.path), f"{self.run_id}-orgs")
+        scrapers = [self.child_scraper(folder, org, organization=org) for org in organizations]
+        pending = [scraper for scraper in scrapers if not scraper.state.params.get("complete")]
+        if len(pending) < len(scrapers):
+            self.log_signal.emit(f"{len(scrapers) - len(pending)} organization(s) already finished before the resume.")
+        for scraper in pending:
+            scraper.in_sweep = True
+        workers = self.search_workers(len(pending))
+        self.log_signal.emit(f"Sweeping {len(pending)} organizations with {workers} workers...")
+
+        queue = iter(pending)
+        written, failed = self.run_children(sink, lambda: next(queue, None), workers, "Sweep")
+        if failed:
+            return None
+        shutil.rmtree(folder, ignore_errors=True)
+        return written
+
+    def scrape_shards(self, sink):
+        """Split the bid end date range into windows searched concurrently, merging them into sink.
+
+        The date range is cut into windows as workers free up, each sized by
+        ShardPlanner from the records per day found so far, so no window is
+        left as a long tail of pages to walk one after another. Returns None
+        if any window failed; the finished ones are kept for a resume.
+        """
+        folder = os.path.join(os.path.dirname(sink.path), f"{self.run_id}-shards")
+        # Windows of an interrupted run: finished ones are skipped, unfinished ones run again as they were
+        covered, retry = [], []
+        for path in sorted(glob.glob(os.path.join(folder, "*.state.json"))):
+            params = RunState.load(path).params
+            covered.append((params["start_date"], params["end_date"]))
+            if not params.get("complete"):
+                retry.append(self.child_scraper(folder, f"{params['start_date']}..{params['end_date']}",
+                                                start_date=params["start_date"], end_date=params["end_date"]))
+        if covered:
+            self.log_signal.emit(f"{len(covered) - len(retry)} date window(s) already finished before the resume.")
+        planner = ShardPlanner(self.start_date, self.end_date, self.organization, self.shard_profile_path, covered)
+
+        def next_shard():
+            if retry:
+                return retry.pop(0)
+            window = planner.next_window()
+            if window is None:
+                return None
+            start, end = window
+            return self.child_scraper(folder, f"{start}..{end}", start_date=start, end_date=end)
+
+        def shard_done(scraper, scraped):
+            if scraped is not None:
+                planner.observe(scraper.start_date, scraper.end_date, scraper.found)
+
+        workers = self.search_workers()
+        self.log_signal.emit(
+            f"Splitting {self.start_date} to {self.end_date} into date windows "
+            f"(starting at {planner.shard_days()} day(s)), {workers} at a time..."
+        )
+        written, failed = self.run_children(sink, next_shard, workers, "Date windows", on_done=shard_done)
+        try:
+            planner.save()
+        except OSError as e:
+            self.log_signal.emit(f"Could not save the date window sizes: {str(e)}")
+        if failed:
+            return None
+        shutil.rmtree(folder, ignore_errors=True)
+        return written
+
+    def page_done(self, page_num):
+        return page_num in self.state.completed_pages
+
+    def output_path(self, suffix, ext="xlsx"):
+        today_str = datetime.today().strftime("%Y-%m-%d")
+        org_short = self.organization.replace(" ", "_").lower()
+        return os.path.join(self.data_dir, f"{today_str}-{org_short}-{suffix}.{ext}")
+
+    def match_page(self, tenders):
+        """Match one page's tenders, emit each hit and append it to the live filtered CSV."""
+        descriptions = [tender["Item Description"] for tender in tenders]
+        if self.fuzzy:
+            # Index the whole page at once; the fuzzy matcher locks its own vocabulary
+            self.matcher.index(descriptions)
+            found = [self.matcher.matched(text, index=False) for text in descriptions]
+        else:
+            found = [self.matcher.matched(text) for text in descriptions]
+        hits = []
+        for tender, concepts in zip(tenders, found):
+            if concepts:
+                hits.append(dict(tender, **{"Matched Keyword": concepts[0], "Matched Concepts": "; ".join(concepts)}))
+        if not hits:
+            return 0
+
+        with self.live_lock:
+            hits = [hit for hit in hits if hit["BID NO"] not in self.live_seen]
+            self.live_seen.update(hit["BID NO"] for hit in hits)
+            new_file = not os.path.exists(self.live_path)
+            with open(self.live_path, "a", newline="", encoding="utf-8-sig" if new_file else "utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=LIVE_COLUMNS, extrasaction="ignore")
+                if new_file:
+                    writer.writeheader()
+                    self.log_signal.emit(f"Matches are written to '{self.live_path}' as they are found.")
+                writer.writerows(hits)
+        for hit in hits:
+            self.match_signal.emit(hit)
+        return len(hits)
+
+    def received_page(self, tenders):
+        """Count a page's bids and, in a ministry sweep, record which organization each came from."""
+        self.found += len(tenders)
+        if not self.in_sweep:
+            return tenders
+        return [dict(tender, Organization=self.organization) for tender in tenders]
+
+    def filter_known(self, tenders, page_num, known_pages=0):
+        """Incremental mode: drop bids seen on a previous run.
+
+        Returns (fresh_tenders, known_pages), where known_pages counts the
+        consecutive pages with nothing new so far. Results are ordered by
+        bid end date, not by when a bid was published, so a new bid can show
+        up on any page; fully-known pages are skipped and paging goes on,
+        unless the user asked to stop after known_page_limit of them in a row.
+        """
+        if not self.incremental:
+            return tenders, 0
+        fresh = self.store.classify(tenders, self.organization)
+        if tenders and not fresh:
+            known_pages += 1
+            if self.stop_paging(known_pages):
+                self.log_signal.emit(f"Page {page_num}: all {len(tenders)} bids already known, "
+                                     f"{known_pages} page(s) in a row. Stopping here.")
+            else:
+                self.log_signal.emit(f"Page {page_num}: all {len(tenders)} bids already known.")
+            return fresh, known_pages
+        if len(fresh) < len(tenders):
+            self.log_signal.emit(
+                f"Page {page_num}: {len(fresh)} new or changed, {len(tenders) - len(fresh)} already known."
+            )
+        return fresh, 0
+
+    def stop_paging(self, known_pages):
+        """True once incremental mode has seen known_page_limit fully-known pages in a row."""
+        return bool(self.known_page_limit) and known_pages >= self.known_page_limit
+
+    def scrape_with_http(self, sink):
+        """Page through the search endpoint directly into sink.
+
+        Returns the number of tenders written; None means fall back to the browser.
+        """
+        self.log_signal.emit("Fetching results over HTTP (no browser)...")
+        client = GemSearchClient(self.base_url)
+        written = 0
+        known_pages = 0
+        try:
+            fetch_started = time.perf_counter()
+            for page_num, total_pages, tenders in client.iter_pages(
+                self.organization, self.start_date, self.end_date, first_page=self.state.next_page()
+            ):
+                self.timer.add(PAGE_WAIT, time.perf_counter() - fetch_started, page_num)
+                if self.page_done(page_num):
+                    fetch_started = time.perf_counter()
+                    continue
+                self.log_signal.emit(f"Fetched {len(tenders)} tenders on Page {page_num}/{total_pages} (HTTP)")
+                fresh, known_pages = self.filter_known(self.received_page(tenders), page_num, known_pages)
+                written += sink.append_page(page_num, fresh)
+                self.state.mark_page_done(page_num)
+                with self.timer.span(MATCHING, page_num):
+                    self.match_page(fresh)
+                if self.stop_paging(known_pages):
+                    break
+                fetch_started = time.perf_counter()
+        except GemContractError as e:
+            self.log_signal.emit(f"Search endpoint contract changed ({e}). Falling back to Selenium...")
+            return None
+        except requests.RequestException as e:
+            self.log_signal.emit(f"HTTP search failed ({e}). Falling back to Selenium...")
+            return None
+        finally:
+            client.close()
+        return written
+
+    def open_search(self, driver, wait):
+        """Fill the ministry/organization form and trigger the search; False if no results."""
+        # Open the GeM website
+        url = urljoin(self.base_url, "advance-search")
+        with self.timer.span(NAVIGATION):
             driver.get(url)
-            wait = WebDriverWait(driver, 10)
-            self.log_signal.emit("Opened GeM website.")
-
-            # Click "Search by Ministry / Organization" tab
-            ministry_tab = wait.until(EC.element_to_be_clickable((By.ID, "ministry-tab")))
-            ministry_tab.click()
-            time.sleep(2)
-
-            # Select "MINISTRY OF PETROLEUM AND NATURAL GAS"
-            ministry_dropdown = wait.until(EC.element_to_be_clickable(
-                (By.XPATH, "//select[@id='ministry']/following-sibling::span")
-            ))
-            ministry_dropdown.click()
-            time.sleep(1)
-            ministry_option = wait.until(EC.element_to_be_clickable(
-                (By.XPATH, "//li[contains(text(), 'MINISTRY OF PETROLEUM AND NATURAL GAS')]")
-            ))
-            ministry_option.click()
-
-            # Select the Organization based on user selection
-            organization_dropdown = wait.until(EC.element_to_be_clickable(
-                (By.XPATH, "//select[@id='organization']/following-sibling::span")
-            ))
-            organization_dropdown.click()
-            time.sleep(1)
-            organization_option = wait.until(EC.element_to_be_clickable(
-                (By.XPATH, f"//li[contains(text(), '{self.organization}')]")
-            ))
-            organization_option.click()
-
-            # Set the date range
-            driver.execute_script("document.getElementById('bidendFromMinistrySearch').removeAttribute('readonly')")
-            driver.execute_script("document.getElementById('bidendToMinistrySearch').removeAttribute('readonly')")
-            time.sleep(1)
-
-            from_date_elem = wait.until(EC.element_to_be_clickable((By.ID, "bidendFromMinistrySearch")))
-            to_date_elem = wait.until(EC.element_to_be_clickable((By.ID, "bidendToMinistrySearch")))
-
-            from_date_elem.clear()
-            from_date_elem.send_keys(self.start_date)
-            time.sleep(1)
-
-            to_date_elem.clear()
-            to_date_elem.send_keys(self.end_date)
-            time.sleep(1)
-
-            driver.find_element(By.TAG_NAME, "body").click()
-            time.sleep(1)
-
-            # Trigger the search button
+        self.log_signal.emit("Opened GeM website.")
+
+        with self.timer.span(FORM_SETUP):
+            self.fill_search_form(driver, wait)
+        with self.timer.span(SEARCH_TRIGGER):
+            return self.trigger_search(driver, wait)
+
+    def fill_search_form(self, driver, wait):
+        """Set the ministry, organization and date range, by script if possible, else through the dropdowns."""
+        try:
+            source = fill_form(driver, self.waits, MINISTRY, self.organization,
+                               self.start_date, self.end_date, self.option_cache)
+            self.log_signal.emit(f"Search form filled by script (organization list from {source}).")
+            return
+        except Exception as e:
+            self.log_signal.emit(f"Filling the form by script failed ({e}). Using the dropdowns...")
+            driver.get(urljoin(self.base_url, "advance-search"))
+        self.click_search_form(driver)
+
+    def click_search_form(self, driver):
+        """Pick the ministry and organization in their select2 dropdowns and type the date range."""
+        # Click "Search by Ministry / Organization" tab
+        ministry_tab = self.waits.until(driver, "ministry tab", EC.element_to_be_clickable((By.ID, "ministry-tab")))
+        ministry_tab.click()
+
+        # Select "MINISTRY OF PETROLEUM AND NATURAL GAS" (the dropdown becomes clickable once the tab is shown)
+        self.pick_select2(driver, "ministry", MINISTRY)
+
+        # Select the Organization based on user selection; its options arrive over AJAX after the ministry pick
+        self.pick_select2(driver, "organization", self.organization)
+
+        # Set the date range
+        driver.execute_script("document.getElementById('bidendFromMinistrySearch').removeAttribute('readonly')")
+        driver.execute_script("document.getElementById('bidendToMinistrySearch').removeAttribute('readonly')")
+
+        from_date_elem = self.waits.until(driver, "date inputs", EC.element_to_be_clickable((By.ID, "bidendFromMinistrySearch")))
+        to_date_elem = self.waits.until(driver, "date inputs", EC.element_to_be_clickable((By.ID, "bidendToMinistrySearch")))
+
+        from_date_elem.clear()
+        from_date_elem.send_keys(self.start_date)
+        to_date_elem.clear()
+        to_date_elem.send_keys(self.end_date)
+
+        # Close any datepicker popup before searching
+        driver.find_element(By.TAG_NAME, "body").click()
+
+    def pick_select2(self, driver, select_id, text):
+        """Open the select2 dropdown next to <select id=select_id> and click the option containing text."""
+        dropdown = self.waits.until(driver, "select2 dropdown", EC.element_to_be_clickable(
+            (By.XPATH, f"//select[@id='{select_id}']/following-sibling::span")
+        ))
+        dropdown.click()
+        option = self.waits.until(driver, "select2 option", EC.element_to_be_clickable(
+            (By.XPATH, f"//li[contains(text(), '{text}')]")
+        ))
+        option.click()
+
+    def trigger_search(self, driver, wait):
+        """Run searchBid() and wait for the results to render; False if they never show up."""
+        try:
+            self.waits.until(driver, "search button", EC.presence_of_element_located((By.ID, "searchByBid")))
             try:
-                search_button = wait.until(EC.presence_of_element_located((By.ID, "searchByBid")))
-                driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-                time.sleep(1)
-                try:
-                    driver.execute_script("searchBid('ministry-search')")
-                    self.log_signal.emit("Search triggered successfully!")
-                except Exception as e:
-                    self.log_signal.emit(f"Search button trigger failed: {str(e)}")
+                driver.execute_script("searchBid('ministry-search')")
+                self.log_signal.emit("Search triggered successfully!")
             except Exception as e:
-                self.log_signal.emit(f"Search button not found: {str(e)}")
+                self.log_signal.emit(f"Search button trigger failed: {str(e)}")
+        except Exception as e:
+            self.log_signal.emit(f"Search button not found: {str(e)}")
 
-            time.sleep(5)
+        try:
+            # Cards (or the empty-result message) rather than just the #result container
+            self.waits.until(driver, "search results", results_ready, default=15)
+            self.log_signal.emit("Results loaded successfully!")
+        except TimeoutException:
+            if not driver.find_elements(By.ID, "result"):
+                self.log_signal.emit("Results section did not load.")
+                return False
+            self.log_signal.emit("Results section loaded without any bid cards.")
+        return True
+
+    def make_driver(self):
+        # Warm headless browser from the shared pool (launched on demand if none is idle)
+        # Timed here: the pool is shared by every worker of this run, and by other runs
+        started = time.perf_counter()
+        with self.timer.span(DRIVER_STARTUP):
+            driver = acquire_driver(capture=self.capture_log)
+        self.log_signal.emit(f"Browser ready in {time.perf_counter() - started:.2f}s.")
+        if last_resolution:
+            self.log_signal.emit(
+                f"chromedriver resolved from {last_resolution['source']} "
+                f"in {last_resolution['ms']:.0f} ms (Chrome {last_resolution['chrome_version']})."
+            )
+        try:
+            if self.fast_load.apply(driver):
+                self.log_signal.emit(f"Fast load on: blocking {len(self.fast_load.patterns())} resource patterns.")
+        except Exception as e:
+            self.log_signal.emit(f"Fast load unavailable ({str(e)}); loading pages normally.")
+        return driver
 
+    def wait_for_results(self, driver, wait):
+        """Wait for the page's cards (or at least #result), refreshing once on timeout; False if nothing shows up."""
+        try:
+            self.waits.until(driver, "page results", results_ready)
+            self.log_signal.emit("Results loaded successfully!")
+        except TimeoutException:
+            if driver.find_elements(By.ID, "result"):
+                self.log_signal.emit("Results section loaded without any bid cards.")
+                return True
+            self.log_signal.emit("Initial load failed. Retrying once after 5s...")
+            self.timer.sleep(5)  # back off before hitting the site again
+            driver.refresh()
             try:
+                self.waits.until(driver, "page load", document_ready)
                 wait.until(EC.presence_of_element_located((By.ID, "result")))
-                self.log_signal.emit("Results loaded successfully!")
+                self.log_signal.emit("Results loaded successfully on retry!")
             except:
-                self.log_signal.emit("Results section did not load.")
-                driver.quit()
-                self.finished_signal.emit()
-                return
+                self.log_signal.emit("Results section did not load after retry.")
+                return False
+        return True
 
-            tender_list = []
-            tender_list_filtered = []
-            page_num = 1
+    def scrape_pages(self, driver, wait, sink, page_num=1, last_page=None):
+        """Extract pages from page_num onwards (up to last_page), appending each one to sink.
 
-            while True:
+        Returns the number of tenders written; None if a page never loads.
+        """
+        written = 0
+        known_pages = 0
+        extract_times = []
+        capture = None
+        if self.extract_mode == "capture":
+            # Whatever response is on screen now belongs to page_num
+            capture = XhrCapture(driver, self.base_url)
+            capture.skip_to_latest()
+
+        while True:
+            if self.page_done(page_num):
+                self.log_signal.emit(f"Page {page_num} already checkpointed, skipping.")
+            else:
                 self.log_signal.emit(f"Extracting data from Page {page_num}...")
-                try:
-                    wait.until(EC.presence_of_element_located((By.ID, "result")))
-                    self.log_signal.emit("Results loaded successfully!")
-                except TimeoutException:
-                    self.log_signal.emit("Initial load failed. Retrying once after 5s...")
-                    time.sleep(5)
-                    driver.refresh()
+                page_results = None
+                mode = self.extract_mode
+                if capture is not None:
+                    started = time.perf_counter()
                     try:
-                        time.sleep(5)
-                        wait.until(EC.presence_of_element_located((By.ID, "result")))
-                        self.log_signal.emit("Results loaded successfully on retry!")
-                    except:
-                        self.log_signal.emit("Results section did not load after retry.")
-                        driver.quit()
-                        self.finished_signal.emit()
-                        return
-
-                    # ─── Selenium-based extraction ────────────────────────────────────
-                tender_elems = driver.find_elements(By.CSS_SELECTOR, "#bidCard .card")
-                self.log_signal.emit(f"Found {len(tender_elems)} tenders on Page {page_num} (using Selenium)!") 
-
-                for card_el in tender_elems:
-                    # 1) BID No & Link
-                    try:
-                        link_el = card_el.find_element(By.CSS_SELECTOR, ".bid_no a")
-                        bid_no   = link_el.text
-                        bid_link = link_el.get_attribute("href")
-                    except:
-                        bid_no, bid_link = "N/A", "N/A"
-
-                    # 2) Item Description (first try data-content, then fallback to "Items:" row)
-                    item_desc_full = "N/A"
-                    raw_html = card_el.get_attribute("outerHTML")
-
-                    # Primary: Try to extract from data-content
-                    marker = 'data-content="'
-                    start = raw_html.find(marker)
-                    if start != -1:
-                        start += len(marker)
-                        end = raw_html.find('">', start)
-                        if end != -1:
-                            item_desc_full = raw_html[start:end]
-                        else:
-                            item_desc_full = raw_html[start:]
-                            # self.log_signal.emit(f"⚠️ Unclosed data-content for BID: {bid_no}")
+                        with self.timer.span(PAGE_WAIT, page_num):
+                            tenders = capture.next_page(page_num)
+                    except Exception as e:
+                        self.log_signal.emit(f"XHR capture failed on Page {page_num}: {str(e)}")
+                        tenders = None
+                    if tenders is not None:
+                        page_results = [(tender, "") for tender in tenders]
+                        extract_secs = time.perf_counter() - started
                     else:
-                        # self.log_signal.emit(f"⚠️ No data-content found for BID: {bid_no}. Trying fallback...")
+                        self.log_signal.emit(f"No search response captured for Page {page_num}; reading the page instead.")
+                        mode = "script"
 
-                        # Fallback: Try to extract from text near 'Items:'
-                        try:
-                            item_rows = card_el.find_elements(By.CSS_SELECTOR, ".col-md-4 .row")
-                            for row in item_rows:
-                                text = row.text.strip()
-                                if text.lower().startswith("items:"):
-                                    item_desc_full = text.split(":", 1)[1].strip()
-                                    # self.log_signal.emit(f"✅ Fallback item description found: {item_desc_full} (BID: {bid_no})")
-                                    break
-                        except Exception as e:
-                            self.log_signal.emit(f"❌ Failed fallback extraction for BID: {bid_no}: {str(e)}")
+                if page_results is None:
+                    with self.timer.span(PAGE_WAIT, page_num):
+                        if not self.wait_for_results(driver, wait):
+                            return None
 
+                    # ─── Card extraction ─────────────────────────────────────
+                    with self.timer.span(EXTRACTION, page_num):
+                        page_results, extract_secs = extract_page(driver, page_num, mode)
+                self.log_signal.emit(
+                    f"Found {len(page_results)} tenders on Page {page_num} "
+                    f"(using {mode} extraction, {extract_secs:.2f}s)!"
+                )
+                extract_times.append(extract_secs)
+                if self.fast_load.metering:
+                    load = self.fast_load.sample(driver)
+                    self.log_signal.emit(f"Page {page_num} load: {self.fast_load.record(load)}")
+
+                page_tenders = []
+                for tender, raw_html in page_results:
                     # Log if still N/A
-                    if item_desc_full == "N/A":
-                        # self.log_signal.emit(f"❗ Item description is still N/A. BID: {bid_no}")
-                        with open(f"debug_card_{bid_no.replace('/', '_')}.html", "w", encoding="utf-8") as f:
+                    if tender["Item Description"] == "N/A" and raw_html:
+                        with open(f"debug_card_{tender['BID NO'].replace('/', '_')}.html", "w", encoding="utf-8") as f:
                             f.write(raw_html)
+                    page_tenders.append(tender)
 
+                # Store all tenders first
+                fresh, known_pages = self.filter_known(self.received_page(page_tenders), page_num, known_pages)
+                written += sink.append_page(page_num, fresh)
+                self.state.mark_page_done(page_num)
+                with self.timer.span(MATCHING, page_num):
+                    self.match_page(fresh)
+                if self.stop_paging(known_pages):
+                    break
 
-                    # 3) Quantity
-                    try:
-                        qty_el = card_el.find_element(By.CSS_SELECTOR, ".col-md-4 div.row:nth-of-type(2)")
-                        quantity = qty_el.text.split(":",1)[1].strip()
-                    except:
-                        quantity = "N/A"
+            if last_page is not None and page_num >= last_page:
+                break
 
-                    # 4) Department
-                    try:
-                        dept_el = card_el.find_element(By.CSS_SELECTOR, ".col-md-5 div.row")
-                        department = dept_el.text.replace("\n"," ")
-                    except:
-                        department = "N/A"
+            try:
+                with self.timer.span(PAGE_WAIT, page_num + 1):
+                    next_button = driver.find_element(By.CSS_SELECTOR, "a.page-link.next")
+                    old_cards = driver.find_elements(By.CSS_SELECTOR, "#bidCard .card")[:1]
+                    driver.execute_script("arguments[0].scrollIntoView();", next_button)
+                    next_button.click()
+                    if capture is None and old_cards:
+                        # capture mode waits for the response itself; otherwise wait for the old cards to be replaced
+                        try:
+                            self.waits.until(driver, "next page", EC.staleness_of(old_cards[0]))
+                        except TimeoutException:
+                            self.log_signal.emit(f"Page {page_num + 1} did not replace the previous cards in time.")
+                page_num += 1
+            except:
+                self.log_signal.emit("No more pages left. Exiting...")
+                break
 
-                    # 5) Start / End Dates
-                    try:
-                        start_el = card_el.find_element(By.CSS_SELECTOR, ".start_date")
-                        start_date_text = start_el.text
-                    except:
-                        start_date_text = "N/A"
+        if extract_times:
+            self.log_signal.emit(
+                f"Extraction ({self.extract_mode}): {sum(extract_times):.2f}s total, "
+                f"{sum(extract_times) / len(extract_times):.2f}s per page"
+            )
+        return written
+
+    def scrape_page_slice(self, first_page, last_page, part):
+        """Worker: open its own browser, jump to first_page and extract through last_page into part.
+
+        Returns False if the slice could not be scraped completely.
+        """
+        driver = self.make_driver()
+        wait = WebDriverWait(driver, 10)
+        try:
+            if not self.open_search(driver, wait):
+                self.log_signal.emit(f"Search did not load for pages {first_page}-{last_page}.")
+                return False
+            if not goto_page(driver, first_page):
+                self.log_signal.emit(f"Could not reach Page {first_page}; pages {first_page}-{last_page} are missing.")
+                return False
+            return self.scrape_pages(driver, wait, part, first_page, last_page) is not None
+        finally:
+            release_driver(driver, capture=self.capture_log)
+
+    def scrape_parallel(self, driver, wait, total_pages, sink):
+        """Split the page range across self.workers browsers and merge into sink in page order.
+
+        Returns None if any slice failed; what the others scraped is still
+        merged and checkpointed, so the run can be resumed.
+        """
+        slices = split_page_range(total_pages, self.workers)
+        self.log_signal.emit(
+            f"{total_pages} pages found. Scraping with {len(slices)} workers: "
+            + ", ".join(f"{first}-{last}" for first, last in slices)
+        )
+        # Each worker streams into its own part file; parts are merged once all are done
+        parts = [PageCheckpoint(f"{sink.path}.part{first}") for first, _ in slices[1:]]
+        written, complete = 0, True
+        try:
+            with ThreadPoolExecutor(max_workers=len(slices) - 1) as pool:
+                futures = {
+                    pool.submit(self.scrape_page_slice, first, last, part): first
+                    for (first, last), part in zip(slices[1:], parts)
+                }
+                # The browser that ran the first search takes the first slice itself
+                first, last = slices[0]
+                scraped = self.scrape_pages(driver, wait, sink, first, last)
+                if scraped is None:
+                    complete = False
+                else:
+                    written += scraped
+                for future in as_completed(futures):
                     try:
-                        end_el = card_el.find_element(By.CSS_SELECTOR, ".end_date")
-                        end_date_text = end_el.text
-                    except:
-                        end_date_text = "N/A"
-
-                    # Store all tenders first
-                    tender_list.append({
-                        "BID NO": bid_no,
-                        "Link": bid_link,
-                        "Item Description": item_desc_full,
-                        "Quantity": quantity,
-                        "Department": department,
-                        "Start Date": start_date_text,
-                        "End Date": end_date_text,
-                        "Page": page_num
-                    })
+                        if not future.result():
+                            complete = False
+                    except Exception as e:
+                        self.log_signal.emit(f"Worker for Page {futures[future]} failed: {str(e)}")
+                        complete = False
+        finally:
+            # Merge whatever the workers finished, even after a failure, so resume can use it
+            written += sink.merge_from(parts)
+            for part in parts:
+                part.remove()
+        if not complete:
+            self.log_signal.emit("Some page ranges were not scraped.")
+            return None
+        return written
 
+    def scrape_with_browser(self, sink):
+        """Drive headless Chrome through the search and every result page into sink."""
+        driver = self.make_driver()
+        wait = WebDriverWait(driver, 10)
 
-                try:
-                    next_button = driver.find_element(By.CSS_SELECTOR, "a.page-link.next")
-                    driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                    time.sleep(1)
-                    next_button.click()
-                    page_num += 1
-                    time.sleep(3)
-                except:
-                    self.log_signal.emit("No more pages left. Exiting...")
-                    break
+        try:
+            if not self.open_search(driver, wait):
+                return None
 
-            # Prepare file saving
-            today_str = datetime.today().strftime("%Y-%m-%d")
-            org_short = self.organization.replace(" ", "_").lower()
-            if getattr(sys, 'frozen', False):
-                app_path = os.path.dirname(sys.executable)
-            else:
-                app_path = os.path.dirname(os.path.abspath(__file__))
-
-            self.log_signal.emit("Applying keyword filtering to all collected tenders...")
-
-            for tender in tender_list:
-                desc_clean = self.normalize(tender["Item Description"])
-                matched_kw = None
-                for kw in self.keywords:
-                    # Escape special characters in keyword for regex
-                    pattern = r'\b' + re.escape(self.normalize(kw)) + r'\b'
-                    if re.search(pattern, desc_clean):
-                        matched_kw = kw
-                        break
-
-                if matched_kw:
-                    tender_copy = tender.copy()
-                    tender_copy["Matched Keyword"] = matched_kw
-                    tender_list_filtered.append(tender_copy)
-
-            self.log_signal.emit(f"Total tenders scraped: {len(tender_list)}")
-            self.log_signal.emit(f"Tenders matched by keywords: {len(tender_list_filtered)}")
-
-            if self.search_keywords:  # user provided custom keyword
-                filename = os.path.join(app_path, f"{today_str}-{org_short}-search.xlsx")
-            else:
-                filename = os.path.join(app_path, f"{today_str}-{org_short}-filtered.xlsx")
-
-    
-            # filename = os.path.join(app_path, f"{today_str}-{org_short}-filtered.xlsx")
-            filename1 = os.path.join(app_path, f"{today_str}-{org_short}-all.xlsx")
-            df = pd.DataFrame(tender_list_filtered)
-            df.drop_duplicates(subset=["BID NO"], inplace=True)
-            df.reset_index(drop=True, inplace=True)
-            df.to_excel(filename, index=False)
-            self.log_signal.emit(f"Filtered tender data saved to '{filename}'")
-            df_all = pd.DataFrame(tender_list)
-            df_all.to_excel(filename1, index=False)
-            self.log_signal.emit(f"All tender data saved to '{filename1}'")
-            self.log_signal.emit("Scraping completed successfully!")
-            driver.quit()
+            start_page = self.state.next_page()
+            if start_page > 1:
+                # Resumed run: jump straight past the pages already on disk
+                if goto_page(driver, start_page):
+                    self.log_signal.emit(f"Jumped to Page {start_page}.")
+                else:
+                    self.log_signal.emit(f"Could not jump to Page {start_page}; walking from Page 1.")
+                    start_page = 1
+                return self.scrape_pages(driver, wait, sink, start_page)
 
-        except Exception as e:
-            self.log_signal.emit(f"An error occurred: {str(e)}")
-        self.finished_signal.emit()
+            if self.workers > 1:
+                total_pages = read_total_pages(driver)
+                if total_pages > 1:
+                    return self.scrape_parallel(driver, wait, total_pages, sink)
+
+            return self.scrape_pages(driver, wait, sink)
+        finally:
+            release_driver(driver, capture=self.capture_log)
+
+    def export_results(self, scraped):
+        """Apply keyword filtering and export this run's -all / -filtered Excel files from the store."""
+        self.log_signal.emit("Applying keyword filtering to all collected tenders...")
+        with self.timer.span(MATCHING):
+            matches = self.match_run()
+
+        with self.timer.span(EXPORT):
+            self.write_exports(scraped, matches)
+
+    def match_run(self):
+        """(bid_no, organization, concept) for every checkpointed tender that matches."""
+        matches = []
+        if self.fuzzy:
+            # Index the whole run first so every misspelling is known before matching
+            self.matcher.index(t["Item Description"] for t in self.checkpoint.iter_records())
+            for tender in self.checkpoint.iter_records():
+                concept = self.matcher.first(tender["Item Description"], index=False)
+                if concept:
+                    matches.append((tender["BID NO"], tender.get("Organization", self.organization), concept))
+        else:
+            # Vectorized over batches of the checkpoint, so memory stays flat on large runs
+            for df in iter_matched(self.checkpoint.iter_records(), FrameMatcher(self.concepts)):
+                # Sweep records carry their own organization
+                organizations = df["Organization"] if "Organization" in df else [self.organization] * len(df)
+                matches.extend(
+                    (bid_no, organization, concept)
+                    for bid_no, organization, concept in zip(df["BID NO"], organizations, df["Matched Keyword"])
+                )
+        return matches
+
+    def write_exports(self, scraped, matches):
+        self.store.record_matches("gem", matches, self.run_id)
+        self.log_signal.emit(f"Total tenders scraped: {scraped}")
+        self.log_signal.emit(f"Tenders matched by keywords: {len(matches)}")
+
+        if self.search_keywords:  # user provided custom keyword
+            filename = self.output_path("search")
+        else:
+            filename = self.output_path("filtered")
+
+        # Incremental runs only hold the bids that are new since the last run
+        filename1 = self.output_path("new" if self.incremental else "all")
+        organization = None if self.organization == ALL_ORGANIZATIONS else self.organization
+        self.store.export_matches(filename, run_id=self.run_id, organization=organization)
+        self.log_signal.emit(f"Filtered tender data saved to '{filename}'")
+        self.store.export_run(self.run_id, filename1)
+        self.log_signal.emit(f"All tender data saved to '{filename1}'")
 
 
 class MainWindow(QMainWindow):
@@ -370,6 +934,9 @@ class MainWindow(QMainWindow):
         self.init_ui()
         self.worker = None
 
+        # Start a headless browser in the background so the first run doesn't wait for it
+        get_pool().prewarm(1)
+
     def init_ui(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -384,6 +951,11 @@ class MainWindow(QMainWindow):
             "OIL AND NATURAL GAS CORPORATION LIMITED",
             "OIL INDIA LIMITED"
         ])
+        # Every other organization seen under the ministry so far, then the whole-ministry sweep
+        for _, text in OptionCache().organizations(MINISTRY) or []:
+            if self.org_combo.findText(text) < 0:
+                self.org_combo.addItem(text)
+        self.org_combo.addItem(ALL_ORGANIZATIONS)
         org_layout.addWidget(org_label)
         org_layout.addWidget(self.org_combo)
         layout.addLayout(org_layout)
@@ -412,38 +984,158 @@ class MainWindow(QMainWindow):
         keyword_layout.addWidget(self.keyword_input)
         layout.addLayout(keyword_layout)
 
+        # Extraction mode
+        extract_layout = QHBoxLayout()
+        extract_label = QLabel("Extraction Mode:")
+        self.extract_combo = QComboBox()
+        self.extract_combo.addItem("Batch script (one call per page)", "script")
+        self.extract_combo.addItem("Offline HTML parse (BeautifulSoup)", "html")
+        self.extract_combo.addItem("Per-element Selenium", "selenium")
+        self.extract_combo.addItem("Capture search XHR (DevTools)", "capture")
+        extract_layout.addWidget(extract_label)
+        extract_layout.addWidget(self.extract_combo)
+        layout.addLayout(extract_layout)
+
+        # Fetch mode
+        fetch_layout = QHBoxLayout()
+        fetch_label = QLabel("Fetch Mode:")
+        self.fetch_combo = QComboBox()
+        self.fetch_combo.addItem("Headless browser", "browser")
+        self.fetch_combo.addItem("Direct HTTP (falls back to browser)", "http")
+        fetch_layout.addWidget(fetch_label)
+        fetch_layout.addWidget(self.fetch_combo)
+        workers_label = QLabel("Page Workers:")
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, 8)
+        self.workers_spin.setValue(1)
+        fetch_layout.addWidget(workers_label)
+        fetch_layout.addWidget(self.workers_spin)
+        layout.addLayout(fetch_layout)
+
+        # Run options
+        options_layout = QHBoxLayout()
+        self.incremental_check = QCheckBox("Incremental (only new or changed bids)")
+        options_layout.addWidget(self.incremental_check)
+        known_label = QLabel("Stop after known pages:")
+        self.known_pages_spin = QSpinBox()
+        self.known_pages_spin.setRange(0, 50)
+        self.known_pages_spin.setSpecialValueText("Never")  # 0: page through the whole window
+        self.known_pages_spin.setToolTip("Incremental mode: stop after this many pages in a row with no new bids")
+        options_layout.addWidget(known_label)
+        options_layout.addWidget(self.known_pages_spin)
+        self.fast_load_check = QCheckBox("Fast load (skip images, fonts, CSS)")
+        options_layout.addWidget(self.fast_load_check)
+        self.fuzzy_check = QCheckBox("Fuzzy match (tolerate typos)")
+        options_layout.addWidget(self.fuzzy_check)
+        self.shard_check = QCheckBox("Split long date ranges")
+        options_layout.addWidget(self.shard_check)
+        layout.addLayout(options_layout)
+
         # Start button
         self.start_button = QPushButton("Start Scraping")
         self.start_button.clicked.connect(self.start_scraping)
         layout.addWidget(self.start_button)
 
+        # Resume button
+        self.resume_button = QPushButton("Resume Last Run")
+        self.resume_button.clicked.connect(self.resume_scraping)
+        layout.addWidget(self.resume_button)
+
         # Log output (read-only)
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         layout.addWidget(self.log_text)
 
+        # Live match counter
+        self.matches_label = QLabel("Matches: 0")
+        layout.addWidget(self.matches_label)
+        self.match_count = 0
+
     def append_log(self, message):
         self.log_text.append(message)
 
+    def add_match(self, tender):
+        self.match_count += 1
+        self.matches_label.setText(f"Matches: {self.match_count}")
+        self.append_log(
+            f"MATCH [{tender['Matched Keyword']}] {tender['BID NO']} (Page {tender['Page']}): "
+            f"{tender['Item Description']}"
+        )
+
     def start_scraping(self):
         organization = self.org_combo.currentText()
         start_date = self.start_date_edit.date().toString("yyyy-MM-dd")
         end_date = self.end_date_edit.date().toString("yyyy-MM-dd")
         keywords_str = self.keyword_input.text()
+        extract_mode = self.extract_combo.currentData()
+        fetch_mode = self.fetch_combo.currentData()
+        workers = self.workers_spin.value()
+        incremental = self.incremental_check.isChecked()
+        known_page_limit = self.known_pages_spin.value()
+        fast_load = self.fast_load_check.isChecked()
+        fuzzy = self.fuzzy_check.isChecked()
+        shard = self.shard_check.isChecked()
 
         self.append_log(f"Selected Organization: {organization}")
         self.append_log(f"Selected Date Range: {start_date} to {end_date}")
         self.append_log(f"Keywords: {keywords_str}")
-        self.start_button.setEnabled(False)
+        self.append_log(f"Extraction Mode: {extract_mode}")
+        self.append_log(f"Fetch Mode: {fetch_mode} ({workers} page worker(s))")
+        if incremental:
+            self.append_log("Incremental sync enabled.")
+        if shard:
+            self.append_log("Date range will be split into concurrently searched windows.")
+
+        self.launch_worker(ScraperThread(
+            organization, start_date, end_date, keywords_str,
+            extract_mode=extract_mode,
+            fetch_mode=fetch_mode,
+            workers=workers,
+            incremental=incremental,
+            known_page_limit=known_page_limit,
+            fast_load=fast_load,
+            fuzzy=fuzzy,
+            shard=shard,
+        ))
 
-        self.worker = ScraperThread(organization, start_date, end_date, keywords_str)
+    def resume_scraping(self):
+        state = RunState.find_incomplete(os.path.join(app_dir(), "checkpoints"))
+        if state is None:
+            self.append_log("No interrupted run to resume.")
+            return
+        params = state.params
+        self.append_log(
+            f"Resuming {params['organization']} {params['start_date']} to {params['end_date']} "
+            f"after Page {state.last_completed_page}..."
+        )
+        self.launch_worker(ScraperThread(
+            params["organization"], params["start_date"], params["end_date"], params["keywords_str"],
+            extract_mode=params["extract_mode"],
+            fetch_mode=params["fetch_mode"],
+            workers=params["workers"],
+            incremental=params["incremental"],
+            known_page_limit=params.get("known_page_limit", 0),
+            fast_load=params.get("fast_load", False),
+            fuzzy=params.get("fuzzy", False),
+            shard=params.get("shard", False),
+            resume_state=state,
+        ))
+
+    def launch_worker(self, worker):
+        self.start_button.setEnabled(False)
+        self.resume_button.setEnabled(False)
+        self.worker = worker
+        self.match_count = 0
+        self.matches_label.setText("Matches: 0")
         self.worker.log_signal.connect(self.append_log)
+        self.worker.match_signal.connect(self.add_match)
         self.worker.finished_signal.connect(self.scraping_finished)
         self.worker.start()
 
     def scraping_finished(self):
         self.append_log("Scraping finished!")
         self.start_button.setEnabled(True)
+        self.resume_button.setEnabled(True)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,14 @@
 from flask import Flask, request, jsonify, render_template, send_file, Response
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
+from driver_pool import acquire_driver, release_driver, get_pool
+from tender_store import TenderStore, new_run_id
+from waits import Waits, attribute_changed
+from run_timing import (
+    RunTimer, DRIVER_STARTUP, NAVIGATION, FORM_SETUP, SEARCH_TRIGGER, PAGE_WAIT, EXTRACTION, EXPORT
+)
 import pandas as pd
 import os
 import time
@@ -19,6 +23,9 @@ excel_filename = ""
 keywords = []
 start_date = None
 progress_messages = []  # Store progress messages
+store = TenderStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), "tenders.db"))
+run_timer = RunTimer("cppp")  # replaced by every /get-captcha, saved after the export
+waits = Waits()
 
 @app.route('/')
 def home():
@@ -46,13 +53,18 @@ def set_start_date():
 
 @app.route('/get-captcha', methods=['GET'])
 def get_captcha():
-    global driver
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-    driver.get("https://etenders.gov.in/eprocure/app?page=FrontEndLatestActiveTenders&service=page")
-    time.sleep(3)
-    captcha_element = WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "captchaImage"))
-    )
+    global driver, run_timer
+    if driver is not None:
+        # A previous CAPTCHA session was abandoned; hand its browser back first
+        release_driver(driver, headless=False)
+    run_timer = RunTimer("cppp", params={
+        "start_date": start_date.strftime("%Y-%m-%d") if start_date else None, "keywords": list(keywords)
+    })
+    with run_timer.span(DRIVER_STARTUP):
+        driver = acquire_driver(headless=False)
+    with run_timer.span(NAVIGATION):
+        driver.get("https://etenders.gov.in/eprocure/app?page=FrontEndLatestActiveTenders&service=page")
+        captcha_element = waits.until(driver, "cppp captcha", EC.presence_of_element_located((By.ID, "captchaImage")))
     captcha_base64 = captcha_element.get_attribute("src").split(",")[1]
     return jsonify({"captcha": captcha_base64})
 
@@ -67,13 +79,13 @@ def refresh_captcha():
         refresh_button = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.ID, "captcha"))
         )
+        old_src = driver.find_element(By.ID, "captchaImage").get_attribute("src")
         refresh_button.click()
 
         # Wait for the new CAPTCHA to load
-        time.sleep(3)
-        captcha_element = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "captchaImage"))
-        )
+        with run_timer.span(FORM_SETUP):
+            waits.until(driver, "cppp captcha refresh", attribute_changed((By.ID, "captchaImage"), "src", old_src))
+        captcha_element = driver.find_element(By.ID, "captchaImage")
         captcha_base64 = captcha_element.get_attribute("src").split(",")[1]
         return jsonify({"captcha": captcha_base64})
     except Exception as e:
@@ -86,20 +98,29 @@ def submit_captcha():
     captcha_text = request.form['captcha']
     try:
         # Enter the CAPTCHA
-        captcha_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "captchaText"))
-        )
-        captcha_field.clear()
-        captcha_field.send_keys(captcha_text)
+        with run_timer.span(FORM_SETUP):
+            captcha_field = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.ID, "captchaText"))
+            )
+            captcha_field.clear()
+            captcha_field.send_keys(captcha_text)
 
-        # Click the submit button
-        submit_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.ID, "Submit"))
-        )
-        submit_button.click()
+        with run_timer.span(SEARCH_TRIGGER):
+            # Click the submit button
+            submit_button = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.ID, "Submit"))
+            )
+            submit_button.click()
 
-        # Wait for the page to refresh
-        time.sleep(5)
+            # Wait for the page to refresh, then for either the results table or a new CAPTCHA
+            try:
+                waits.until(driver, "cppp submit", EC.staleness_of(submit_button))
+            except TimeoutException:
+                pass  # no full reload; the check below still applies
+            waits.until(driver, "cppp submit result", EC.any_of(
+                EC.presence_of_element_located((By.XPATH, '//*[@id="table"]/tbody')),
+                EC.presence_of_element_located((By.ID, "captchaImage")),
+            ))
 
         # Check for invalid CAPTCHA error
         page_source = driver.page_source
@@ -113,7 +134,9 @@ def submit_captcha():
 
         # Start scraping tenders if CAPTCHA is correct
         tenders = scrape_tenders()
-        excel_filename = save_to_excel(tenders)
+        with run_timer.span(EXPORT):
+            excel_filename = save_to_excel(tenders)
+        save_run_report()
 
         if excel_filename:
             return jsonify({"status": "scraping_completed", "excel_filename": excel_filename})
@@ -138,63 +161,91 @@ def scrape_tenders():
     global driver, keywords, start_date
     tenders = []
     try:
+        page = 1
         while True:
-            WebDriverWait(driver, 30).until(
-                EC.presence_of_element_located((By.XPATH, '//*[@id="table"]/tbody'))
-            )
-            table_body = driver.find_element(By.XPATH, '//*[@id="table"]/tbody')
-            rows = table_body.find_elements(By.TAG_NAME, "tr")
-            progress_messages.append(f"Found {len(rows) - 2} rows on this page.")
-            for row in rows[1:]:
-                columns = row.find_elements(By.TAG_NAME, "td")
-                if len(columns) >= 7:
-                    s_no = columns[0].text.strip()
-                    published_date_str = columns[1].text.strip()
-                    closing_date = columns[2].text.strip()
-                    opening_date = columns[3].text.strip()
-                    tender_title = columns[4].text.strip()
-                    tender_link = columns[4].find_element(By.TAG_NAME, "a").get_attribute("href") if columns[4].find_elements(By.TAG_NAME, "a") else "No Link"
-                    organisation_chain = columns[5].text.strip()
-                    tender_value = columns[6].text.strip()
-
-                    try:
-                        published_date = datetime.strptime(published_date_str, "%d-%b-%Y %I:%M %p")
-                    except ValueError:
-                        continue
-
-                    if published_date < start_date:
-                        return tenders
-
-                    if any(kw.lower() in tender_title.lower() for kw in keywords):
-                        tenders.append({
-                            "S.No": s_no,
-                            "Published Date": published_date_str,
-                            "Closing Date": closing_date,
-                            "Opening Date": opening_date,
-                            "Title": tender_title,
-                            "Link": tender_link,
-                            "Organisation Chain": organisation_chain,
-                            "Tender Value": tender_value
-                        })
+            with run_timer.span(PAGE_WAIT, page):
+                WebDriverWait(driver, 30).until(
+                    EC.presence_of_element_located((By.XPATH, '//*[@id="table"]/tbody'))
+                )
+            with run_timer.span(EXTRACTION, page):
+                if extract_rows(tenders):
+                    return tenders
 
             try:
-                next_button = driver.find_element(By.ID, "loadNext")
-                driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                progress_messages.append("Navigating to the next page...")
-                next_button.click()
-                time.sleep(5)
+                with run_timer.span(PAGE_WAIT, page + 1):
+                    next_button = driver.find_element(By.ID, "loadNext")
+                    old_body = driver.find_element(By.XPATH, '//*[@id="table"]/tbody')
+                    driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
+                    progress_messages.append("Navigating to the next page...")
+                    next_button.click()
+                    # The next page is in once the old table body has been replaced
+                    try:
+                        waits.until(driver, "cppp next page", EC.staleness_of(old_body), default=15)
+                    except TimeoutException:
+                        progress_messages.append(f"Page {page + 1} did not replace the previous table in time.")
+                page += 1
             except Exception:
                 progress_messages.append("No more pages to scrape.")
                 break
     finally:
-        driver.quit()
+        release_driver(driver, headless=False)
+        driver = None
     return tenders
 
+def extract_rows(tenders):
+    """Append the current table's keyword hits to tenders; True once rows are older than start_date."""
+    table_body = driver.find_element(By.XPATH, '//*[@id="table"]/tbody')
+    rows = table_body.find_elements(By.TAG_NAME, "tr")
+    progress_messages.append(f"Found {len(rows) - 2} rows on this page.")
+    for row in rows[1:]:
+        columns = row.find_elements(By.TAG_NAME, "td")
+        if len(columns) >= 7:
+            s_no = columns[0].text.strip()
+            published_date_str = columns[1].text.strip()
+            closing_date = columns[2].text.strip()
+            opening_date = columns[3].text.strip()
+            tender_title = columns[4].text.strip()
+            tender_link = columns[4].find_element(By.TAG_NAME, "a").get_attribute("href") if columns[4].find_elements(By.TAG_NAME, "a") else "No Link"
+            organisation_chain = columns[5].text.strip()
+            tender_value = columns[6].text.strip()
+
+            try:
+                published_date = datetime.strptime(published_date_str, "%d-%b-%Y %I:%M %p")
+            except ValueError:
+                continue
+
+            if published_date < start_date:
+                return True
+
+            if any(kw.lower() in tender_title.lower() for kw in keywords):
+                tenders.append({
+                    "S.No": s_no,
+                    "Published Date": published_date_str,
+                    "Closing Date": closing_date,
+                    "Opening Date": opening_date,
+                    "Title": tender_title,
+                    "Link": tender_link,
+                    "Organisation Chain": organisation_chain,
+                    "Tender Value": tender_value
+                })
+    return False
+
+def save_run_report():
+    try:
+        waits.save()
+        path = run_timer.save(os.path.join(os.path.dirname(os.path.abspath(__file__)), "run-reports"))
+        progress_messages.append(run_timer.summary())
+        progress_messages.append(f"Run timing report saved to '{path}'")
+    except OSError as e:
+        progress_messages.append(f"Could not save the run timing report: {e}")
+
 def save_to_excel(tenders):
     if tenders:
+        # The store is the system of record; the spreadsheet is an export of this run
+        run_id = new_run_id()
+        store.save_cppp_run(tenders, keywords, run_id)
         filename = f"tenders_GEM-CPP{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.xlsx"
-        df = pd.DataFrame(tenders)
-        df.to_excel(filename, index=False, engine='openpyxl')
+        store.export_run(run_id, filename, source="cppp")
         return filename
     return None
 
@@ -203,4 +254,7 @@ def download_excel():
     return send_file(excel_filename, as_attachment=True)
 
 if __name__ == '__main__':
+    # Only the reloader's child process serves requests, so only it keeps a warm browser
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        get_pool(headless=False).prewarm(1)
     app.run(debug=True)
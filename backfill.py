@@ -0,0 +1,148 @@
+# Re-run a keyword list over archived GeM exports:
+#   python backfill.py matches.xlsx "archive/*-all.xlsx" [--keywords "gate valve, hose"]
+#                      [--keywords-file keywords.txt] [--workers 8] [--chunk 5000] [--keep-duplicates]
+# Each worker process reads whole archives in chunks and matches them, since
+# reading .xlsx costs more than matching it (and a read-only workbook can't
+# seek to a row, so an archive isn't split across workers). The matched rows
+# of every chunk travel back as soon as it is done and are streamed into one
+# .xlsx/.csv output, so a large archive never sits in memory whole.
+import argparse
+import glob
+import os
+import sys
+import time
+from multiprocessing import Pool, Queue, cpu_count
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from keyword_frame import FrameMatcher, matched_rows
+from keyword_taxonomy import CONCEPTS, user_concepts
+from tender_store import write_records
+
+# Built once per worker process by the pool initializer; tasks only carry a path
+_matcher = None
+_chunk_size = 5000
+_results = None
+
+
+def _init_worker(concepts, chunk_size, results):
+    global _matcher, _chunk_size, _results
+    _matcher = FrameMatcher(concepts)
+    _chunk_size = chunk_size
+    _results = results
+
+
+def _match_archive(path):
+    """Put (rows scanned, hits) on the results queue per chunk, then (0, None) once the archive is done."""
+    name = os.path.basename(path)
+    try:
+        for rows in iter_archive_chunks(path, _chunk_size):
+            df = matched_rows(pd.DataFrame(rows), matcher=_matcher)
+            df.insert(0, "Source File", name)
+            _results.put((len(rows), df.fillna("").to_dict("records")))
+    finally:
+        # Sent even if reading failed, so the parent never waits on this archive
+        _results.put((0, None))
+
+
+def iter_archive_chunks(path, chunk_size=5000):
+    """Lists of row dicts from one archive, read with constant memory."""
+    if path.lower().endswith(".csv"):
+        for df in pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False):
+            yield df.to_dict("records")
+        return
+
+    wb = load_workbook(path, read_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if not header or "Item Description" not in header:
+            print(f"skipping {os.path.basename(path)}: no 'Item Description' column", file=sys.stderr)
+            return
+        header = [str(h) if h is not None else "" for h in header]
+        chunk = []
+        for values in rows:
+            chunk.append({col: ("" if v is None else v) for col, v in zip(header, values)})
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        wb.close()
+
+
+def backfill(paths, output, concepts=CONCEPTS, workers=None, chunk_size=5000, dedupe=True, progress=None):
+    """Match every archived row against concepts and stream the hits into output; returns (rows, hits)."""
+    workers = workers or cpu_count()
+    stats = {"rows": 0, "hits": 0}
+    seen = set()
+    # Biggest archives first, so the largest one doesn't start last and hold up the end of the run
+    paths = sorted(paths, key=lambda p: os.path.getsize(p), reverse=True)
+    chunks = Queue()
+
+    def results(pool):
+        # Chunks arrive as workers finish them, interleaved across archives; with
+        # duplicates, the first copy matched is kept
+        pending = pool.map_async(_match_archive, paths, chunksize=1)
+        remaining = len(paths)
+        while remaining:
+            scanned, hits = chunks.get()
+            if hits is None:
+                remaining -= 1
+                continue
+            stats["rows"] += scanned
+            for hit in hits:
+                bid_no = hit.get("BID NO")
+                if dedupe and bid_no:
+                    if bid_no in seen:
+                        continue
+                    seen.add(bid_no)
+                stats["hits"] += 1
+                yield hit
+            if progress:
+                progress(stats["rows"], stats["hits"])
+        pending.get()  # re-raise a worker's error
+
+    with Pool(min(workers, len(paths)), initializer=_init_worker, initargs=(concepts, chunk_size, chunks)) as pool:
+        write_records(results(pool), output)
+    return stats["rows"], stats["hits"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Match a keyword list against archived -all.xlsx exports.")
+    parser.add_argument("output", help="where the matched rows go (.xlsx or .csv)")
+    parser.add_argument("archives", nargs="+", help="archive files or glob patterns")
+    parser.add_argument("--keywords", help="comma-separated keywords (default: the built-in taxonomy)")
+    parser.add_argument("--keywords-file", help="one keyword per line")
+    parser.add_argument("--workers", type=int, default=cpu_count())
+    parser.add_argument("--chunk", type=int, default=5000, help="rows matched at a time")
+    parser.add_argument("--keep-duplicates", action="store_true", help="keep every copy of a BID NO")
+    args = parser.parse_args(argv)
+
+    paths = sorted({p for pattern in args.archives for p in glob.glob(pattern)})
+    if not paths:
+        parser.error("no archive files matched")
+
+    concepts = CONCEPTS
+    if args.keywords_file:
+        with open(args.keywords_file, "r", encoding="utf-8") as f:
+            concepts = user_concepts(",".join(line.strip() for line in f))
+    elif args.keywords:
+        concepts = user_concepts(args.keywords)
+
+    def progress(rows, hits):
+        rate = rows / max(time.perf_counter() - started, 1e-9)
+        print(f"\r{rows} rows scanned, {hits} matched ({rate:,.0f} rows/s)", end="", file=sys.stderr)
+
+    started = time.perf_counter()
+    rows, hits = backfill(paths, args.output, concepts, args.workers, args.chunk,
+                          dedupe=not args.keep_duplicates, progress=progress)
+    secs = time.perf_counter() - started
+    print(f"\n{len(paths)} archives, {rows} rows, {hits} matched -> {args.output} "
+          f"in {secs:.1f}s with {args.workers} workers ({rows / max(secs, 1e-9):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
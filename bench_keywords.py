@@ -0,0 +1,204 @@
+# Benchmark every keyword-matching strategy in the repo on a synthetic GeM corpus:
+#   python bench_keywords.py [--sizes 1000,100000,1000000] [--budget 20] [--out bench_results.json]
+# Strategies that would take longer than --budget seconds at a size are timed
+# on a prefix and extrapolated (flagged in the output). The JSON file is meant
+# to be committed/compared between runs so regressions show up.
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from fuzzy_matcher import FuzzyMatcher
+from keyword_frame import FrameMatcher
+from keyword_matcher import KeywordMatcher, normalize
+from keyword_taxonomy import CONCEPTS, base_keywords, compile_concepts
+
+ITEM_WORDS = [
+    "supply", "of", "procurement", "spares", "for", "annual", "maintenance", "contract", "pump", "motor",
+    "cable", "pipe", "fitting", "assembly", "nos", "set", "hydraulic", "electrical", "kit", "seal",
+    "bearing", "gasket", "flange", "compressor", "filter", "element", "sensor", "transmitter", "panel",
+    "lubricant", "oil", "grease", "drilling", "services", "hiring", "vehicle", "laptop", "printer",
+    "cartridge", "office", "stationery", "chemical", "safety", "helmet", "gloves", "boots", "rig",
+]
+DECORATIONS = ["", "", "", " (Q3)", " - 10 nos", " as per specification", " / OEM", " [PAC]"]
+
+
+def make_corpus(size, keywords, seed=42, hit_rate=0.15):
+    """Reproducible GeM-like item descriptions; about hit_rate of them contain a keyword spelling."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        words = [rng.choice(ITEM_WORDS) for _ in range(rng.randint(3, 12))]
+        if rng.random() < hit_rate:
+            kw = rng.choice(keywords)
+            kw = rng.choice((kw, kw.upper(), kw.title(), kw.replace(" ", "-"), kw + "s"))
+            words.insert(rng.randrange(len(words) + 1), kw)
+        desc = " ".join(words) + rng.choice(DECORATIONS)
+        corpus.append(desc[0].upper() + desc[1:])
+    return corpus
+
+
+def strategies(keywords):
+    """name -> (semantics group, factory returning a per-batch function descs -> list of first hits)."""
+
+    def substring_in():
+        # GeM.py / V2: raw lowercase substring test
+        def run(descs):
+            out = []
+            for desc in descs:
+                low = desc.lower()
+                out.append(next((kw for kw in keywords if kw in low), None))
+            return out
+        return run
+
+    def normalized_substring():
+        # V3: both sides normalized, still substring
+        def run(descs):
+            out = []
+            for desc in descs:
+                clean = normalize(desc)
+                out.append(next((kw for kw in keywords if normalize(kw) in clean), None))
+            return out
+        return run
+
+    def per_keyword_regex():
+        # V4 before the compiled matcher: a \b regex per tender x keyword
+        def run(descs):
+            out = []
+            for desc in descs:
+                clean = normalize(desc)
+                out.append(next((kw for kw in keywords
+                                 if re.search(r"\b" + re.escape(normalize(kw)) + r"\b", clean)), None))
+            return out
+        return run
+
+    def aho_corasick():
+        matcher = KeywordMatcher(keywords)
+        return lambda descs: [matcher.first(desc) for desc in descs]
+
+    def concept_matcher():
+        matcher = compile_concepts(CONCEPTS)
+        return lambda descs: [matcher.first(desc) for desc in descs]
+
+    def frame_filter():
+        matcher = FrameMatcher(CONCEPTS)
+
+        def run(descs):
+            found = matcher.concepts(pd.Series(descs))
+            return [hits[0] if hits else None for hits in found]
+        return run
+
+    def fuzzy():
+        matcher = FuzzyMatcher(CONCEPTS)
+
+        def run(descs):
+            matcher.index(descs)
+            return [matcher.first(desc, index=False) for desc in descs]
+        return run
+
+    # Strategies in the same group must report identical first hits
+    return {
+        "substring_in": ("substring", substring_in),
+        "normalized_substring": ("normalized-substring", normalized_substring),
+        "per_keyword_regex": ("whole-word", per_keyword_regex),
+        "aho_corasick": ("whole-word", aho_corasick),
+        "concept_matcher": ("concept", concept_matcher),
+        "frame_filter": ("concept", frame_filter),
+        "fuzzy": ("fuzzy", fuzzy),
+    }
+
+
+def time_strategy(factory, corpus, budget):
+    """Time one strategy; returns (seconds, results, sample size, extrapolated?)."""
+    started = time.perf_counter()
+    run = factory()
+    setup = time.perf_counter() - started
+
+    # Probe on a small prefix to decide whether the full corpus fits in the budget
+    probe = corpus[: min(len(corpus), 1000)]
+    started = time.perf_counter()
+    results = run(probe)
+    probe_secs = time.perf_counter() - started
+    if len(probe) == len(corpus):
+        return setup + probe_secs, results, len(corpus), False
+
+    estimate = probe_secs * len(corpus) / len(probe)
+    sample = corpus if estimate <= budget else corpus[: max(len(probe), int(len(corpus) * budget / estimate))]
+    started = time.perf_counter()
+    results = run(sample)
+    secs = time.perf_counter() - started
+    if len(sample) < len(corpus):
+        return setup + secs * len(corpus) / len(sample), results, len(sample), True
+    return setup + secs, results, len(corpus), False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the keyword-matching strategies.")
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--budget", type=float, default=20.0, help="max measured seconds per strategy and size")
+    parser.add_argument("--strategies", help="comma-separated subset (default: all)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    keywords = base_keywords()
+    available = strategies(keywords)
+    chosen = args.strategies.split(",") if args.strategies else list(available)
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "keywords": len(keywords),
+        "concepts": len(CONCEPTS),
+        "seed": args.seed,
+        "results": [],
+        "disagreements": [],
+    }
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        corpus = make_corpus(size, keywords, args.seed)
+        first_hits = {}
+        for name in chosen:
+            group, factory = available[name]
+            secs, results, measured, extrapolated = time_strategy(factory, corpus, args.budget)
+            matched = sum(1 for r in results if r)
+            row = {
+                "strategy": name, "group": group, "size": size, "seconds": round(secs, 4),
+                "per_1k_ms": round(secs * 1000 / size * 1000, 3),
+                "descs_per_sec": round(size / secs) if secs else None,
+                "match_rate": round(matched / len(results), 4) if results else 0.0,
+                "measured_on": measured, "extrapolated": extrapolated,
+            }
+            report["results"].append(row)
+            first_hits[name] = (group, results)
+            flag = " (extrapolated)" if extrapolated else ""
+            print(f"{size:>9} {name:<22} {secs:10.3f}s  {row['descs_per_sec'] or 0:>12,}/s  "
+                  f"match {row['match_rate']:.3f}{flag}")
+
+        # Engines with the same semantics must agree on the common prefix they were measured on
+        names = list(first_hits)
+        for i, a in enumerate(names):
+            for b in names[i + 1:]:
+                (group_a, res_a), (group_b, res_b) = first_hits[a], first_hits[b]
+                if group_a != group_b:
+                    continue
+                n = min(len(res_a), len(res_b))
+                diff = sum(1 for x, y in zip(res_a[:n], res_b[:n]) if x != y)
+                if diff:
+                    report["disagreements"].append({"size": size, "a": a, "b": b, "compared": n, "differ": diff})
+                    print(f"  DISAGREE {a} vs {b}: {diff}/{n}")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to '{args.out}'")
+    return 1 if report["disagreements"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+# End-to-end benchmark of GeM-GUI_V4's ScraperThread against mock_gem_portal.py:
+#   python bench_scraper.py [--records 300] [--latency 0.3] [--page-latency 0.5]
+#                           [--configs browser:script:1,browser:capture:1,http:script:1] [--out bench_scraper.json]
+#                           [--organization "ALL ORGANIZATIONS"]   sweep every organization of the mock
+# Every config is "fetch_mode:extract_mode:workers", plus ":shard" to split the
+# date range into concurrently searched windows. The scraper runs in this
+# thread against a fresh mock server and a scratch data folder; per-stage
+# times come from the run timing report the scraper writes (run_timing.py).
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from PyQt6.QtCore import QCoreApplication, Qt
+
+from gem_http import MINISTRY
+from waits import Waits
+from gem_form import OptionCache
+from mock_gem_portal import ORGANIZATIONS, make_fixtures, search, start_mock_portal
+
+# Sweep workers prefix their lines with "[ORGANIZATION] "
+PAGE_RE = re.compile(r"^(\[[^\]]+\] )?(?:Found|Fetched) (\d+) tenders on Page (\d+)")
+
+
+def load_scraper_module():
+    """GeM-GUI_V4.py has a dash in its name, so it is loaded from its path."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "GeM-GUI_V4.py")
+    spec = importlib.util.spec_from_file_location("gem_gui_v4", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_config(module, base_url, organization, start_date, end_date, fetch_mode, extract_mode, workers,
+               organizations=(), shard=False):
+    """Run one ScraperThread to completion; returns its timestamped log, timing report and wall time."""
+    data_dir = tempfile.mkdtemp(prefix="bench_scraper_")
+    log, timing = [], None
+    started = time.perf_counter()
+    try:
+        # Learned wait timeouts stay out of the user's profile and don't carry over between configs
+        thread = module.ScraperThread(
+            organization, start_date, end_date, "",
+            extract_mode=extract_mode, fetch_mode=fetch_mode, workers=workers, shard=shard,
+            base_url=base_url, data_dir=data_dir,
+            waits=Waits(os.path.join(data_dir, "waits.json")),
+            option_cache=OptionCache(os.path.join(data_dir, "gem_options.json")),
+        )
+        thread.shard_profile_path = os.path.join(data_dir, "shards.json")
+        if organizations and fetch_mode == "http":
+            # A sweep over HTTP has no dropdown to read the organizations from
+            thread.option_cache.put(MINISTRY, [(org, org) for org in organizations])
+        # Direct connections: page workers log from their own threads and there is no event loop here
+        thread.log_signal.connect(lambda message: log.append((time.perf_counter(), message)),
+                                  Qt.ConnectionType.DirectConnection)
+        log.append((time.perf_counter(), "Starting benchmark run"))
+        thread.run()
+        secs = time.perf_counter() - started
+        for path in glob.glob(os.path.join(data_dir, "run-reports", "*.json")):
+            with open(path, "r", encoding="utf-8") as f:
+                timing = json.load(f)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+    return log, timing, secs
+
+
+def summarize(log, timing, secs, expected_records):
+    pages, records = set(), 0
+    for _, message in log:
+        match = PAGE_RE.search(message)
+        if match:
+            records += int(match.group(2))
+            pages.add((match.group(1), int(match.group(3))))
+    errors = [message for _, message in log
+              if re.sub(r"^\[[^\]]+\] ", "", message).startswith(("An error occurred", "Results section did not load"))]
+    return {
+        "seconds": round(secs, 3),
+        "pages": len(pages),
+        "records": records,
+        "expected_records": expected_records,
+        "pages_per_sec": round(len(pages) / secs, 3) if secs else None,
+        "records_per_sec": round(records / secs, 2) if secs else None,
+        "completed": any(message.startswith("Scraping completed") for _, message in log),
+        "errors": errors,
+        "page_p50_secs": timing["pages"]["p50_secs"] if timing else None,
+        "page_p95_secs": timing["pages"]["p95_secs"] if timing else None,
+        "fixed_sleep_secs": timing["fixed_sleep_secs"] if timing else None,
+        "stages": {stage: info["total_secs"] for stage, info in timing["stages"].items()} if timing else {},
+        # Per organization of a sweep, or per date window of a sharded run
+        "parts": {name: part["total_secs"] for name, part in timing.get("parts", {}).items()} if timing else {},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ScraperThread end to end against the mock GeM portal.")
+    parser.add_argument("--records", type=int, default=300, help="tenders per organization")
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds before each search-bids response")
+    parser.add_argument("--page-latency", type=float, default=0.5, help="seconds before the advance-search page")
+    parser.add_argument("--option-latency", type=float, default=0.2)
+    parser.add_argument("--configs", default="browser:script:1,browser:capture:1,http:script:1",
+                        help="comma-separated fetch_mode:extract_mode:workers[:shard]")
+    parser.add_argument("--organization", default=ORGANIZATIONS[1], help='or "ALL ORGANIZATIONS" for a ministry sweep')
+    parser.add_argument("--start-date", default="2025-01-01")
+    parser.add_argument("--end-date", default="2025-01-31")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--verbose", action="store_true", help="echo the scraper's log")
+    parser.add_argument("--out", default="bench_scraper.json")
+    args = parser.parse_args(argv)
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])  # noqa: F841
+    module = load_scraper_module()
+    fixtures = make_fixtures(args.records, args.seed)
+    sweep = ORGANIZATIONS if args.organization == module.ALL_ORGANIZATIONS else ()
+    expected = sum(
+        search(fixtures, {"ministry": MINISTRY, "organization": org,
+                          "bidEndFromMin": args.start_date, "bidEndToMin": args.end_date})[0]
+        for org in (sweep or [args.organization])
+    )
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "mock": {"records": args.records, "latency": args.latency, "page_latency": args.page_latency,
+                 "option_latency": args.option_latency, "seed": args.seed},
+        "search": {"organization": args.organization, "start_date": args.start_date, "end_date": args.end_date,
+                   "expected_records": expected},
+        "results": [],
+    }
+
+    for config in args.configs.split(","):
+        fetch_mode, extract_mode, workers, *flags = config.split(":")
+        server, base_url = start_mock_portal(args.records, args.latency, args.page_latency,
+                                             args.option_latency, args.seed)
+        try:
+            log, timing, secs = run_config(module, base_url, args.organization, args.start_date, args.end_date,
+                                           fetch_mode, extract_mode, int(workers), sweep, "shard" in flags)
+        finally:
+            server.shutdown()
+            server.server_close()
+        if args.verbose:
+            for t, message in log:
+                print(f"  {t - log[0][0]:8.2f}s  {message}")
+        row = dict(config=config, requests={k: v for k, v in server.stats.items() if k != "lock"},
+                   **summarize(log, timing, secs, expected))
+        report["results"].append(row)
+        status = "ok" if row["completed"] and row["records"] >= expected else "INCOMPLETE"
+        print(f"{config:<22} {secs:8.2f}s  {row['pages']:>4} pages {row['pages_per_sec'] or 0:7.2f}/s  "
+              f"{row['records']:>6} records {row['records_per_sec'] or 0:8.1f}/s  {status}")
+        print("    " + ", ".join(f"{stage} {t:.2f}s" for stage, t in row["stages"].items())
+              + f" | fixed sleep {row['fixed_sleep_secs'] or 0:.2f}s")
+        if row["parts"]:
+            print("    " + ", ".join(f"{name} {t:.2f}s" for name, t in row["parts"].items()))
+        for error in row["errors"]:
+            print(f"    ! {error}")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to '{args.out}'")
+    return 0 if all(r["completed"] for r in report["results"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
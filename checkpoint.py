@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+
+
+class PageCheckpoint:
+    """Append-only JSONL file that receives each page's records as soon as they're extracted.
+
+    Nothing is held in memory between pages: writers append and flush,
+    readers stream the file back line by line. A crash leaves every fully
+    written page on disk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._drop_partial_line()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _drop_partial_line(self):
+        # A crash mid-write can leave an unterminated last line; cut it off so
+        # new pages don't get glued onto it.
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def append_page(self, page_num, tenders):
+        """Write one page of records and force them to disk."""
+        lines = "".join(json.dumps(t, ensure_ascii=False) + "\n" for t in tenders)
+        with self._lock:
+            self._file.write(lines)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        return len(tenders)
+
+    def iter_records(self):
+        """Stream every record back in the order it was written."""
+        with self._lock:
+            self._file.flush()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # a half-written last line from a crash; everything before it is good
+                    break
+
+    def count(self):
+        return sum(1 for _ in self.iter_records())
+
+    def merge_from(self, parts):
+        """Append other checkpoints in the given order, keeping the first copy of each BID NO."""
+        seen = {t.get("BID NO") for t in self.iter_records()}
+        written = 0
+        for part in parts:
+            batch = []
+            for tender in part.iter_records():
+                bid_no = tender.get("BID NO")
+                if bid_no and bid_no != "N/A":
+                    if bid_no in seen:
+                        continue
+                    seen.add(bid_no)
+                batch.append(tender)
+                if len(batch) >= 500:
+                    written += self.append_page(None, batch)
+                    batch = []
+            if batch:
+                written += self.append_page(None, batch)
+        return written
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def remove(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class RunState:
+    """Parameters and page progress of a scrape, saved next to its checkpoint.
+
+    Written atomically after every completed page so an interrupted run can
+    be picked up again from the first page it hasn't finished.
+    """
+
+    def __init__(self, path, params, completed_pages=()):
+        self.path = path
+        self.params = dict(params)
+        self.completed_pages = set(completed_pages)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(path, data["params"], data.get("completed_pages", []))
+
+    @classmethod
+    def find_incomplete(cls, directory):
+        """Most recent run in `directory` that never finished, or None."""
+        if not os.path.isdir(directory):
+            return None
+        names = sorted((n for n in os.listdir(directory) if n.endswith(".state.json")), reverse=True)
+        for name in names:
+            try:
+                return cls.load(os.path.join(directory, name))
+            except (OSError, ValueError, KeyError):
+                continue
+        return None
+
+    @property
+    def run_id(self):
+        return self.params["run_id"]
+
+    @property
+    def last_completed_page(self):
+        return max(self.completed_pages, default=0)
+
+    def next_page(self):
+        """First page not yet checkpointed."""
+        page = 1
+        while page in self.completed_pages:
+            page += 1
+        return page
+
+    def mark_page_done(self, page_num):
+        with self._lock:
+            self.completed_pages.add(page_num)
+            self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"params": self.params, "completed_pages": sorted(self.completed_pages)}, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,168 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".askara_tender_search", "chromedriver.json")
+
+# Filled in by resolve_chromedriver(); shown in the logs as a startup metric
+last_resolution = {}
+
+_lock = threading.Lock()
+_resolved = None  # (chrome_stamp, chrome_version, driver_path) for the lifetime of the process
+
+VERSION_RE = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+
+def _chrome_version_windows():
+    import winreg
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            continue
+    return None
+
+
+def _chrome_binaries():
+    if sys.platform == "darwin":
+        candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+    else:
+        candidates = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+    for binary in candidates:
+        path = shutil.which(binary) or (binary if os.path.isabs(binary) and os.path.exists(binary) else None)
+        if path:
+            yield os.path.realpath(path)
+
+
+def chrome_stamp():
+    """[path, mtime] of the local Chrome binary, which changes when Chrome is updated; None if unknown.
+
+    Much cheaper than asking Chrome for its version, so the version is
+    only read again when the stamp differs from the recorded one. Windows
+    reads the version from the registry, which costs no process, so it
+    has no stamp.
+    """
+    if sys.platform.startswith("win"):
+        return None
+    for path in _chrome_binaries():
+        try:
+            return [path, os.path.getmtime(path)]
+        except OSError:
+            continue
+    return None
+
+
+def _chrome_version_posix():
+    for binary in _chrome_binaries():
+        try:
+            out = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = VERSION_RE.search(out)
+        if match:
+            return match.group(1)
+    return None
+
+
+def installed_chrome_version():
+    """Version string of the local Chrome, or None if it can't be found."""
+    try:
+        if sys.platform.startswith("win"):
+            return _chrome_version_windows()
+        return _chrome_version_posix()
+    except Exception:
+        return None
+
+
+def _load_cache():
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(chrome_stamp, chrome_version, driver_path):
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({
+            "chrome_stamp": chrome_stamp,
+            "chrome_version": chrome_version,
+            "driver_path": driver_path,
+            "resolved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }, f, indent=2)
+
+
+def resolve_chromedriver():
+    """Path to a chromedriver matching the installed Chrome.
+
+    The recorded path is reused as long as Chrome's version hasn't changed
+    and the file still exists; only then does ChromeDriverManager (and the
+    network) get involved. If that lookup fails, a stale recorded driver is
+    still better than no driver at all. While the Chrome binary's stamp is
+    the one recorded, its version isn't read again (no `--version` process).
+    """
+    global _resolved
+    started = time.perf_counter()
+    with _lock:
+        stamp = chrome_stamp()
+        # Without a stamp the version is cheap to read (registry, or no Chrome found at all)
+        chrome_version = installed_chrome_version() if stamp is None else None
+        if (_resolved and _resolved[0] == stamp and (stamp is not None or _resolved[1] == chrome_version)
+                and os.path.exists(_resolved[2])):
+            source, chrome_version, driver_path = "memory", _resolved[1], _resolved[2]
+        else:
+            cache = _load_cache()
+            cached_path = cache.get("driver_path")
+            cached_ok = bool(cached_path) and os.path.exists(cached_path)
+            if stamp is not None:
+                if cached_ok and cache.get("chrome_stamp") == stamp:
+                    chrome_version = cache.get("chrome_version")
+                else:
+                    chrome_version = installed_chrome_version()
+            if cached_ok and (chrome_version is None or cache.get("chrome_version") == chrome_version):
+                source, driver_path = "cache", cached_path
+                if cache.get("chrome_stamp") != stamp:
+                    _save_cache(stamp, chrome_version, driver_path)
+            else:
+                try:
+                    driver_path = ChromeDriverManager().install()
+                    source = "download"
+                    _save_cache(stamp, chrome_version, driver_path)
+                except Exception:
+                    if not cached_ok:
+                        raise
+                    source, driver_path = "stale-cache", cached_path
+            _resolved = (stamp, chrome_version, driver_path)
+
+    last_resolution.update({
+        "source": source,
+        "chrome_version": chrome_version,
+        "driver_path": driver_path,
+        "ms": (time.perf_counter() - started) * 1000,
+    })
+    return driver_path
+
+
+def clear_cache():
+    """Forget the recorded driver so the next call re-resolves it."""
+    global _resolved
+    with _lock:
+        _resolved = None
+        if os.path.exists(CACHE_PATH):
+            os.remove(CACHE_PATH)
+
+
+if __name__ == "__main__":
+    path = resolve_chromedriver()
+    print(f"chromedriver: {path}")
+    print(f"Chrome {last_resolution['chrome_version']} | source={last_resolution['source']} "
+          f"| {last_resolution['ms']:.1f} ms")
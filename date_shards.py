@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+from datetime import date, timedelta
+
+from gem_http import PAGE_SIZE
+
+PROFILE_PATH = os.path.join(os.path.expanduser("~"), ".askara_tender_search", "shards.json")
+
+TARGET_PAGES = 8   # result pages one shard should hold
+DEFAULT_DAYS = 7   # shard size before anything is known about an organization
+MIN_DAYS = 1
+MAX_DAYS = 31
+
+_lock = threading.Lock()
+
+
+def _load_profile(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class ShardPlanner:
+    """Hands out consecutive bid end date windows, each sized to hold about TARGET_PAGES pages.
+
+    Windows are planned one at a time as workers free up, so every finished
+    shard's records-per-day refines the size of the next ones: a busy
+    stretch gets day-sized shards, a quiet one gets up to a month. The
+    records-per-day of each organization is kept in the profile, so a later
+    run starts from the right size. `covered` windows (finished or still
+    pending from an interrupted run) are never handed out again.
+    """
+
+    def __init__(self, start_date, end_date, key, profile_path=PROFILE_PATH, covered=()):
+        self.first = date.fromisoformat(start_date)
+        self.last = date.fromisoformat(end_date)
+        self.key = key
+        self.profile_path = profile_path
+        self.profile = _load_profile(profile_path)
+        self.covered = sorted((date.fromisoformat(a), date.fromisoformat(b)) for a, b in covered)
+        self.cursor = self.first
+        self.records = 0
+        self.days = 0
+
+    def density(self):
+        """Records per day seen by this run's finished shards, else the saved one, else None."""
+        if self.days:
+            return self.records / self.days
+        return self.profile.get(self.key)
+
+    def shard_days(self):
+        density = self.density()
+        if density is None:
+            return DEFAULT_DAYS
+        if density <= 0:
+            return MAX_DAYS
+        return max(MIN_DAYS, min(MAX_DAYS, int(TARGET_PAGES * PAGE_SIZE / density)))
+
+    def next_window(self):
+        """(start, end) of the next shard as YYYY-MM-DD strings, or None once the range is used up."""
+        with _lock:
+            moved = True
+            while moved:
+                moved = False
+                for first, last in self.covered:
+                    if first <= self.cursor <= last:
+                        self.cursor = last + timedelta(days=1)
+                        moved = True
+            if self.cursor > self.last:
+                return None
+            end = min(self.last, self.cursor + timedelta(days=self.shard_days() - 1))
+            for first, _ in self.covered:
+                if self.cursor < first <= end:
+                    end = first - timedelta(days=1)
+            start, self.cursor = self.cursor, end + timedelta(days=1)
+        return start.isoformat(), end.isoformat()
+
+    def observe(self, start_date, end_date, records):
+        """Record how many bids a finished shard found."""
+        days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
+        with _lock:
+            self.records += records
+            self.days += days
+
+    def save(self):
+        with _lock:
+            if not self.days:
+                return
+            self.profile[self.key] = round(self.records / self.days, 3)
+            os.makedirs(os.path.dirname(self.profile_path), exist_ok=True)
+            tmp = self.profile_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.profile, f, indent=2)
+            os.replace(tmp, self.profile_path)
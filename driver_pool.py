@@ -0,0 +1,173 @@
+import atexit
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from chromedriver_cache import resolve_chromedriver
+from fast_load import clear_blocking
+from gem_capture import drain_performance_log
+
+
+def chrome_options(headless=True, capture=False):
+    """The Chrome flags every scraper in this repo uses; capture=True adds the performance log."""
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--window-size=1920x1080")
+    if capture:
+        # Network events for gem_capture.XhrCapture; drained on every pool reset
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def launch_chrome(headless=True, capture=False):
+    """Start a fresh Chrome; the slow path the pool exists to avoid."""
+    service = Service(resolve_chromedriver())
+    return webdriver.Chrome(service=service, options=chrome_options(headless, capture))
+
+
+class DriverPool:
+    """Keeps pre-launched Chrome instances warm between scraping runs.
+
+    acquire() hands out an idle browser (or launches one if none is idle),
+    release() resets it and puts it back. Browsers that fail the health
+    check or have served `max_uses` jobs are quit instead of reused, and
+    at most `size` browsers are kept idle. Only a `capture` pool's browsers
+    record the performance log that gem_capture reads.
+    """
+
+    def __init__(self, size=2, max_uses=20, headless=True, capture=False):
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self.capture = capture
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _launch(self):
+        driver = launch_chrome(self.headless, self.capture)
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def prewarm(self, count=None, background=True):
+        """Launch browsers until `count` (default: size) are idle."""
+        def fill():
+            target = self.size if count is None else min(count, self.size)
+            while not self._closed:
+                with self._lock:
+                    if len(self._idle) >= target:
+                        return
+                try:
+                    driver = self._launch()
+                except Exception:
+                    return
+                with self._lock:
+                    self._idle.append(driver)
+
+        if background:
+            threading.Thread(target=fill, daemon=True).start()
+        else:
+            fill()
+
+    def is_healthy(self, driver):
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def reset(self, driver):
+        """Drop cookies, storage and extra tabs so the next job starts clean."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.delete_all_cookies()
+        clear_blocking(driver)
+        if self.capture:
+            drain_performance_log(driver)
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass  # about:blank and some error pages have no storage
+        driver.get("about:blank")
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """Return a ready browser, launching a new one when none is idle."""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                driver = self._launch()
+                break
+            if self.is_healthy(driver):
+                break
+            self._discard(driver)
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        return driver
+
+    def release(self, driver):
+        """Give a browser back; it is reset, or quit if it is spent or broken."""
+        if driver is None:
+            return
+        with self._lock:
+            spent = self._closed or self._uses.get(id(driver), 0) >= self.max_uses
+            full = len(self._idle) >= self.size
+        if spent or full or not self.is_healthy(driver):
+            self._discard(driver)
+            return
+        try:
+            self.reset(driver)
+        except Exception:
+            self._discard(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(headless=True, size=2, max_uses=20, capture=False):
+    """Process-wide pool, one per headless/capture setting, shared by every scraper."""
+    with _pools_lock:
+        pool = _pools.get((headless, capture))
+        if pool is None:
+            pool = _pools[(headless, capture)] = DriverPool(
+                size=size, max_uses=max_uses, headless=headless, capture=capture
+            )
+            atexit.register(pool.shutdown)
+        return pool
+
+
+def acquire_driver(headless=True, capture=False):
+    return get_pool(headless, capture=capture).acquire()
+
+
+def release_driver(driver, headless=True, capture=False):
+    get_pool(headless, capture=capture).release(driver)
@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+
+# Resources the scraper never looks at. Chrome's Network.setBlockedURLs takes
+# wildcard patterns matched against the full URL.
+STATIC_PATTERNS = [
+    "*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.gif", "*.gif?*",
+    "*.svg", "*.svg?*", "*.ico", "*.ico?*", "*.webp", "*.webp?*",
+    "*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.ttf?*", "*.eot", "*.eot?*", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*hotjar.com*", "*facebook.net*", "*clarity.ms*",
+]
+
+# Anything whose URL contains one of these is never blocked: the search form
+# needs jQuery, select2 (script and CSS, or its dropdowns aren't clickable),
+# the pagination plugin and the searchBid() code.
+ALLOWLIST = ("searchbid", "select2", "jquery", "pagination", "search-bids", "advance-search")
+
+# Initiator types worth learning: stylesheets and anything a pattern above missed
+LEARNABLE = {"css", "link", "img", "image", "font", "video", "audio", "beacon"}
+
+# Runs without the filter meter pages only until the baseline holds this many
+BASELINE_PAGES = 200
+
+PROFILE_PATH = os.path.join(os.path.expanduser("~"), ".askara_tender_search", "page_load.json")
+
+# Resource timing entries since the last call, then clear them so each page is measured on its own
+RESOURCES_JS = """
+const out = performance.getEntriesByType('resource').map(e =>
+    [e.name, e.initiatorType, e.transferSize || e.encodedBodySize || 0, e.startTime, e.responseEnd]);
+performance.clearResourceTimings();
+return out;
+"""
+
+_lock = threading.Lock()
+
+
+def is_allowed(url, allowlist=ALLOWLIST):
+    url = url.lower()
+    return any(name in url for name in allowlist)
+
+
+def _load_profile(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class FastLoad:
+    """Opt-in network filter for the headless GeM browser, plus per-page load metering.
+
+    Static patterns block images, fonts, media and analytics from the first
+    request. Stylesheets can't be told apart by pattern from the select2 CSS
+    the form needs, so every non-allowlisted stylesheet/image URL seen on a
+    page is remembered and blocked by exact URL from then on (the list is
+    kept in the profile, so later runs block it from the start).
+
+    Runs with the filter meter every page and report the bytes and ms
+    saved against a baseline. Runs without it only meter pages (and never
+    learn URLs) until that baseline holds BASELINE_PAGES pages.
+    """
+
+    def __init__(self, enabled=False, allowlist=ALLOWLIST, profile_path=PROFILE_PATH):
+        self.enabled = enabled
+        self.allowlist = allowlist
+        self.profile_path = profile_path
+        profile = _load_profile(profile_path)
+        self.learned = set(profile.get("learned", []))
+        self.baseline = profile.get("baseline") or {}
+        self.pages = 0
+        self.bytes_saved = 0
+        self.ms_saved = 0.0
+
+    @property
+    def metering(self):
+        """Whether pages should be sampled at all: always with the filter, else only to fill the baseline."""
+        return self.enabled or self.baseline.get("pages", 0) < BASELINE_PAGES
+
+    def patterns(self):
+        learned = sorted(url for url in self.learned if not is_allowed(url, self.allowlist))
+        return STATIC_PATTERNS + learned
+
+    def apply(self, driver):
+        """Install the block list on driver (a no-op unless enabled)."""
+        if not self.enabled:
+            return False
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns()})
+        return True
+
+    def sample(self, driver):
+        """Bytes, ms and request count the page loaded since the last sample."""
+        try:
+            entries = driver.execute_script(RESOURCES_JS) or []
+        except Exception:
+            return {"bytes": 0, "ms": 0.0, "requests": 0}
+
+        if self.enabled:
+            new_urls = {
+                name for name, kind, _, _, _ in entries
+                if kind in LEARNABLE and not is_allowed(name, self.allowlist)
+                and not name.split("?")[0].endswith(".js")  # a <link rel=preload> of a script
+            }
+            with _lock:
+                fresh = new_urls - self.learned
+                self.learned |= fresh
+            if fresh:
+                # Pagination clicks and later drivers skip what this page loaded
+                self.apply(driver)
+
+        loaded = sum(size for _, _, size, _, _ in entries)
+        span = 0.0
+        if entries:
+            span = max(end for *_, end in entries) - min(start for *_, start, _ in entries)
+        return {"bytes": loaded, "ms": span, "requests": len(entries)}
+
+    def record(self, load):
+        """Fold a page sample into the totals; returns a one-line summary for the log."""
+        with _lock:
+            self.pages += 1
+            if not self.enabled:
+                pages = self.baseline.get("pages", 0)
+                for key in ("bytes", "ms"):
+                    avg = self.baseline.get(key, 0.0)
+                    self.baseline[key] = avg + (load[key] - avg) / (pages + 1)
+                self.baseline["pages"] = min(pages + 1, BASELINE_PAGES)
+                return f"{load['requests']} resources, {load['bytes'] / 1024:.0f} KB, {load['ms']:.0f} ms."
+            if not self.baseline.get("pages"):
+                return (f"{load['requests']} resources, {load['bytes'] / 1024:.0f} KB "
+                        "(no baseline yet; run once without fast load to measure savings).")
+            saved_bytes = max(0, self.baseline["bytes"] - load["bytes"])
+            saved_ms = max(0.0, self.baseline["ms"] - load["ms"])
+            self.bytes_saved += saved_bytes
+            self.ms_saved += saved_ms
+            return (f"{load['requests']} resources, {load['bytes'] / 1024:.0f} KB; "
+                    f"saved ~{saved_bytes / 1024:.0f} KB and ~{saved_ms:.0f} ms vs. baseline.")
+
+    def summary(self):
+        if not self.enabled or not self.pages or not self.baseline.get("pages"):
+            return None
+        return (f"Fast load saved ~{self.bytes_saved / 1024:.0f} KB and ~{self.ms_saved / 1000:.1f}s "
+                f"over {self.pages} pages ({len(self.patterns())} blocked patterns).")
+
+    def save(self):
+        with _lock:
+            data = {"baseline": self.baseline, "learned": sorted(self.learned)}
+        os.makedirs(os.path.dirname(self.profile_path), exist_ok=True)
+        tmp = self.profile_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.profile_path)
+
+
+def clear_blocking(driver):
+    """Lift any block list, e.g. before a pooled browser goes to another scraper."""
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+    except Exception:
+        pass
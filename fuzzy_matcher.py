@@ -0,0 +1,246 @@
+import threading
+
+from keyword_matcher import KeywordMatcher, normalize
+from keyword_taxonomy import CONCEPTS, concept_patterns, fold_plural
+
+
+def edit_distance(a, b, limit=None):
+    """Levenshtein distance; stops early and returns limit + 1 once it can't come in under limit."""
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree: finds every word within an edit distance without comparing against all of them."""
+
+    def __init__(self):
+        self.root = None  # [word, {distance: child}]
+        self.size = 0
+        self.comparisons = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, word):
+        if self.root is None:
+            self.root = [word, {}]
+            self.size = 1
+            return True
+        node = self.root
+        while True:
+            d = edit_distance(word, node[0])
+            if d == 0:
+                return False
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [word, {}]
+                self.size += 1
+                return True
+            node = child
+
+    def search(self, word, max_distance):
+        """(distance, word) for every indexed word within max_distance."""
+        found = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            self.comparisons += 1
+            d = edit_distance(word, node[0])
+            if d <= max_distance:
+                found.append((d, node[0]))
+            # Triangle inequality: only children at distance d±max_distance can hold matches
+            for dist, child in node[1].items():
+                if d - max_distance <= dist <= d + max_distance:
+                    stack.append(child)
+        return found
+
+
+# Everyday and procurement words that sit one edit away from a keyword word
+# ("height" / "weight", "remove" / "remote"); they are never taken for typos.
+COMMON_WORDS = frozenset("""
+about above across after again against along also amount annual another around assembly available based
+before being below between board bottom broken building cabinet called carton centre center certain
+change charge chemical cleaning closed colour column common complete contained content contract contracts
+controller cooling copper counter cover current custom damage delivery design detail device
+different direct domestic double during either electrical element energy engine entire equal estimate
+except factory filter final finish fitting flange floor format framed further general ground handle
+having heater height higher hiring holder housekeeping inside install intent itself junction keeping
+labour ladder latest leather letter lights limited liquid little longer lubricant machine maintenance
+manual marine master matter medium mention meters method mobile module motion motor nature needle
+normal notice number office online option orange outside output packing panels parcel partial people
+period person petrol pillow pipeline placed plastic plates pocket portable powder preventive printer
+private process product project proper public pumping purpose quality random reason record regular
+related remove repair report request resting return rubber sample screen season second section select
+senior series server setting shelter should signal silver simple single socket source spares special
+spring square stable standard station steel stocks street stress strong supply surface switch system
+tables tablet things though timber toilet torch toward travel turning twenty uniform united
+upper useful valves vehicle vessel volume washer welding wheels window winter wiring within without
+wooden worker writing
+""".split())
+
+
+class FuzzyMatcher:
+    """Concept matching that tolerates misspelled words ("preventor", "x-mas tre").
+
+    The keyword words long enough to allow typos go into a BK-tree. Each
+    description word is looked up in it once, the first time it is seen,
+    and a spelling within max_distance edits is mapped onto its keyword word
+    before the usual exact matcher runs. The edit-distance work grows with
+    the number of new words, so streaming descriptions in one at a time
+    costs the same as indexing them in one batch. Safe to share between
+    threads.
+
+    Short words are where one edit turns a keyword into plain English
+    ("hose" / "house", "piper" / "paper"), so a keyword word only tolerates
+    typos from min_length letters on, and a one-word concept from
+    single_min_length (its typo would match on its own, with no other
+    phrase word to back it up). COMMON_WORDS are never read as typos.
+    max_distance stays at 1: item descriptions are typed, and their typos
+    are single slips, while two edits on these word lengths reach too many
+    real words.
+    """
+
+    def __init__(self, concepts=CONCEPTS, max_distance=1, min_length=6, single_min_length=8):
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self.single_min_length = single_min_length
+        self.vocabulary = set()
+        self.canonical = {}  # misspelled word -> keyword word
+        self._best = {}      # misspelled word -> (distance, keyword word)
+        self._lock = threading.Lock()
+
+        self.exact = KeywordMatcher(
+            [p for p, _ in concept_patterns(concepts)],
+            labels=[c for _, c in concept_patterns(concepts)],
+            fold=self._fold, compounds=True,
+        )
+        self.keyword_words = {word for pattern, _ in concept_patterns(concepts) for word in pattern.split()}
+        self.single_words = {pattern for pattern, _ in concept_patterns(concepts) if " " not in pattern}
+        self.tree = BKTree()
+        for word in sorted(self.keyword_words):
+            if self.allowed_distance(word):
+                self.tree.add(word)
+
+    def _fold(self, word):
+        word = fold_plural(word)
+        return self.canonical.get(word, word)
+
+    def allowed_distance(self, word):
+        min_length = self.single_min_length if word in self.single_words else self.min_length
+        return self.max_distance if len(word) >= min_length else 0
+
+    def index(self, descriptions):
+        """Add the words of these descriptions to the vocabulary, mapping any new misspellings."""
+        with self._lock:
+            for text in descriptions:
+                for word in normalize(text or "").split():
+                    word = fold_plural(word)
+                    if word in self.vocabulary:
+                        continue
+                    self.vocabulary.add(word)
+                    if word in self.keyword_words or word in COMMON_WORDS:
+                        continue
+                    for distance, keyword_word in self.tree.search(word, self.max_distance):
+                        if not distance or distance > self.allowed_distance(keyword_word):
+                            continue
+                        best = self._best.get(word)
+                        if best is None or (distance, keyword_word) < best:
+                            self._best[word] = (distance, keyword_word)
+                            self.canonical[word] = keyword_word
+
+    def matched(self, text, index=True):
+        """Concepts in text, misspellings included; indexes text's words first unless index=False."""
+        if index:
+            self.index([text])
+        return self.exact.matched(text)
+
+    def first(self, text, index=True):
+        if index:
+            self.index([text])
+        return self.exact.first(text)
+
+
+if __name__ == "__main__":
+    # python fuzzy_matcher.py [descriptions] [max_distance]
+    import random
+    import sys
+    import time
+
+    from keyword_taxonomy import base_keywords, compile_concepts
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    max_distance = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    rng = random.Random(5)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+
+    def typo(phrase):
+        chars = list(phrase)
+        i = rng.randrange(len(chars))
+        op = rng.choice("sdi")
+        if op == "s" and chars[i].isalpha():
+            chars[i] = rng.choice(letters)
+        elif op == "d" and len(chars) > 6:
+            del chars[i]
+        else:
+            chars.insert(i, rng.choice(letters))
+        return "".join(chars)
+
+    filler = ["supply", "of", "procurement", "spares", "annual", "maintenance", "pump", "motor", "cable",
+              "fitting", "assembly", "nos", "set", "hydraulic", "electrical", "lot", "item", "unit"]
+    filler += ["".join(rng.choice(letters) for _ in range(rng.randint(4, 10))) for _ in range(3000)]
+    spellings = [k for k in base_keywords() if len(k) >= 8]
+    corpus, planted, typos = [], [], 0
+    for _ in range(count):
+        words = [rng.choice(filler) for _ in range(rng.randint(4, 12))]
+        planted.append(rng.random() < 0.2)
+        if planted[-1]:
+            phrase = rng.choice(spellings)
+            if rng.random() < 0.5:
+                phrase, typos = typo(phrase), typos + 1
+            words.insert(rng.randrange(len(words) + 1), phrase)
+        corpus.append(" ".join(words))
+
+    exact = compile_concepts()
+    started = time.perf_counter()
+    exact_hits = sum(1 for desc in corpus if exact.first(desc))
+    exact_secs = time.perf_counter() - started
+
+    fuzzy = FuzzyMatcher(max_distance=max_distance)
+    started = time.perf_counter()
+    fuzzy.index(corpus)
+    index_secs = time.perf_counter() - started
+    started = time.perf_counter()
+    fuzzy_found = [bool(fuzzy.first(desc, index=False)) for desc in corpus]
+    fuzzy_secs = time.perf_counter() - started
+    fuzzy_hits = sum(fuzzy_found)
+    spurious = sum(1 for found, real in zip(fuzzy_found, planted) if found and not real)
+
+    brute = len(fuzzy.vocabulary) * len(fuzzy.tree)
+    print(f"{count} descriptions, {len(fuzzy.vocabulary)} distinct words, {typos} phrases with a typo injected")
+    print(f"exact : {exact_hits:6} matched in {exact_secs:.2f}s")
+    print(f"fuzzy : {fuzzy_hits:6} matched in {fuzzy_secs:.2f}s + {index_secs:.2f}s indexing "
+          f"(max_distance={max_distance}, {len(fuzzy.canonical)} misspellings mapped, "
+          f"{spurious} hits on descriptions without a planted keyword)")
+    print(f"edit-distance computations: {fuzzy.tree.comparisons} via BK-tree vs {brute} brute force")
+
+    # Regression: everyday words one edit from a keyword must not match; real typos must
+    checker = FuzzyMatcher(max_distance=max_distance)
+    false_hits = [text for text in ("Supply of A4 paper ream", "House keeping services", "Those items",
+                                    "Nose mask", "Height gauge", "Remove old fittings")
+                  if checker.first(text)]
+    missed = [text for text in ("Blow out preventor spares", "Electric submersable pump", "Acidizng job",
+                                "Wellhead manifld", "Tubing encapsulted cable")
+              if not checker.first(text)]
+    print(f"regression: {len(false_hits)} false hits {false_hits}, {len(missed)} missed typos {missed}")
+    sys.exit(1 if false_hits or missed else 0)
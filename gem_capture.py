@@ -0,0 +1,81 @@
+import base64
+import json
+import time
+
+from gem_http import GEM_BASE_URL, GemContractError, doc_to_tender, parse_search_response
+
+SEARCH_XHR = "search-bids"
+
+
+def drain_performance_log(driver):
+    """Read (and so discard) everything in the browser's performance log."""
+    try:
+        return driver.get_log("performance")
+    except Exception:
+        return []
+
+
+class XhrCapture:
+    """Decodes the advance-search XHR responses of a live Selenium session.
+
+    Needs a browser started with the "performance" logging pref (see
+    driver_pool.chrome_options; acquire_driver(capture=True) gives one). The page keeps doing the session, cookie
+    and CSRF work; instead of waiting for #bidCard to render and querying
+    it, the search-bids JSON is pulled with Network.getResponseBody and
+    mapped with the same doc_to_tender() the HTTP fetcher uses.
+    """
+
+    def __init__(self, driver, base_url=GEM_BASE_URL, url_part=SEARCH_XHR):
+        self.driver = driver
+        self.base_url = base_url
+        self.url_part = url_part
+        self._pending = set()  # requestIds whose response headers arrived
+        self._ready = []       # requestIds whose body is complete, oldest first
+        self.num_found = None
+
+    def poll(self):
+        for entry in drain_performance_log(self.driver):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.responseReceived":
+                if self.url_part in params.get("response", {}).get("url", ""):
+                    self._pending.add(params["requestId"])
+            elif method == "Network.loadingFinished":
+                if params.get("requestId") in self._pending:
+                    self._pending.discard(params["requestId"])
+                    self._ready.append(params["requestId"])
+            elif method == "Network.loadingFailed":
+                self._pending.discard(params.get("requestId"))
+
+    def skip_to_latest(self):
+        """Drop responses older than the one currently on screen (e.g. after a page jump)."""
+        self.poll()
+        del self._ready[:-1]
+
+    def body(self, request_id):
+        result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8")
+        return json.loads(body)
+
+    def next_page(self, page_num, timeout=10):
+        """Tender records from the next unread search response; None if none arrives in time."""
+        deadline = time.monotonic() + timeout
+        while True:
+            self.poll()
+            if self._ready:
+                break
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(0.1)
+
+        try:
+            self.num_found, docs = parse_search_response(self.body(self._ready.pop(0)))
+            return [doc_to_tender(doc, page_num, self.base_url) for doc in docs]
+        except (GemContractError, ValueError, KeyError) as e:
+            raise GemContractError(f"captured search response not usable: {e}")
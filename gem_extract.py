@@ -0,0 +1,246 @@
+import sys
+import time
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+from selenium.webdriver.common.by import By
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+GEM_BASE_URL = "https://bidplus.gem.gov.in/"
+
+
+# Collects the raw fields of every "#bidCard .card" in a single round trip.
+# Text is taken from innerText (trimmed) to match what Selenium's `.text`
+# returns, and missing elements come back as null so the Python side can
+# apply the same "N/A" fallbacks as the per-element path.
+CARD_FIELDS_JS = """
+const text = (root, sel) => {
+    const el = root.querySelector(sel);
+    return el ? el.innerText.trim() : null;
+};
+return Array.from(document.querySelectorAll('#bidCard .card')).map(card => {
+    const link = card.querySelector('.bid_no a');
+    return {
+        bid_no: link ? link.innerText.trim() : null,
+        link: link ? link.href : null,
+        html: card.outerHTML,
+        item_rows: Array.from(card.querySelectorAll('.col-md-4 .row')).map(r => r.innerText.trim()),
+        quantity: text(card, '.col-md-4 div.row:nth-of-type(2)'),
+        department: text(card, '.col-md-5 div.row'),
+        start_date: text(card, '.start_date'),
+        end_date: text(card, '.end_date')
+    };
+});
+"""
+
+
+def item_description_from_html(raw_html):
+    """Return the data-content item description from a card's outerHTML, or None."""
+    marker = 'data-content="'
+    start = raw_html.find(marker)
+    if start == -1:
+        return None
+    start += len(marker)
+    end = raw_html.find('">', start)
+    if end != -1:
+        return raw_html[start:end]
+    return raw_html[start:]
+
+
+def item_description_from_rows(row_texts):
+    """Fallback: pick the description out of the card's "Items:" row."""
+    for text in row_texts:
+        text = text.strip()
+        if text.lower().startswith("items:"):
+            return text.split(":", 1)[1].strip()
+    return "N/A"
+
+
+def extract_cards_selenium(driver, page_num):
+    """Per-element extraction; one WebDriver call per field per card.
+
+    Returns a list of (tender, raw_html) tuples.
+    """
+    results = []
+    for card_el in driver.find_elements(By.CSS_SELECTOR, "#bidCard .card"):
+        # 1) BID No & Link
+        try:
+            link_el = card_el.find_element(By.CSS_SELECTOR, ".bid_no a")
+            bid_no = link_el.text
+            bid_link = link_el.get_attribute("href")
+        except Exception:
+            bid_no, bid_link = "N/A", "N/A"
+
+        # 2) Item Description (first try data-content, then fallback to "Items:" row)
+        raw_html = card_el.get_attribute("outerHTML")
+        item_desc_full = item_description_from_html(raw_html)
+        if item_desc_full is None:
+            try:
+                item_rows = card_el.find_elements(By.CSS_SELECTOR, ".col-md-4 .row")
+                item_desc_full = item_description_from_rows(row.text for row in item_rows)
+            except Exception:
+                item_desc_full = "N/A"
+
+        # 3) Quantity
+        try:
+            qty_el = card_el.find_element(By.CSS_SELECTOR, ".col-md-4 div.row:nth-of-type(2)")
+            quantity = qty_el.text.split(":", 1)[1].strip()
+        except Exception:
+            quantity = "N/A"
+
+        # 4) Department
+        try:
+            dept_el = card_el.find_element(By.CSS_SELECTOR, ".col-md-5 div.row")
+            department = dept_el.text.replace("\n", " ")
+        except Exception:
+            department = "N/A"
+
+        # 5) Start / End Dates
+        try:
+            start_date_text = card_el.find_element(By.CSS_SELECTOR, ".start_date").text
+        except Exception:
+            start_date_text = "N/A"
+        try:
+            end_date_text = card_el.find_element(By.CSS_SELECTOR, ".end_date").text
+        except Exception:
+            end_date_text = "N/A"
+
+        results.append(({
+            "BID NO": bid_no,
+            "Link": bid_link,
+            "Item Description": item_desc_full,
+            "Quantity": quantity,
+            "Department": department,
+            "Start Date": start_date_text,
+            "End Date": end_date_text,
+            "Page": page_num
+        }, raw_html))
+    return results
+
+
+def tender_from_fields(fields, page_num):
+    """Build a tender dict from one entry returned by CARD_FIELDS_JS."""
+    bid_no = fields.get("bid_no")
+    bid_link = fields.get("link")
+    if bid_no is None:
+        bid_no, bid_link = "N/A", "N/A"
+
+    raw_html = fields.get("html") or ""
+    item_desc_full = item_description_from_html(raw_html)
+    if item_desc_full is None:
+        item_desc_full = item_description_from_rows(fields.get("item_rows") or [])
+
+    try:
+        quantity = fields["quantity"].split(":", 1)[1].strip()
+    except Exception:
+        quantity = "N/A"
+
+    department = fields.get("department")
+    department = department.replace("\n", " ") if department is not None else "N/A"
+    start_date_text = fields.get("start_date")
+    end_date_text = fields.get("end_date")
+
+    return {
+        "BID NO": bid_no,
+        "Link": bid_link,
+        "Item Description": item_desc_full,
+        "Quantity": quantity,
+        "Department": department,
+        "Start Date": start_date_text if start_date_text is not None else "N/A",
+        "End Date": end_date_text if end_date_text is not None else "N/A",
+        "Page": page_num
+    }
+
+
+def extract_cards_script(driver, page_num):
+    """Batch extraction; every card on the page in one execute_script call.
+
+    Returns a list of (tender, raw_html) tuples, same as extract_cards_selenium.
+    """
+    cards = driver.execute_script(CARD_FIELDS_JS) or []
+    return [(tender_from_fields(fields, page_num), fields.get("html") or "") for fields in cards]
+
+
+def _soup_text(el):
+    """Whitespace-collapsed text of a tag, close to what Selenium's `.text` gives."""
+    return " ".join(el.get_text(" ").split())
+
+
+def parse_cards_html(html, page_num=1, base_url=GEM_BASE_URL):
+    """Parse every "#bidCard .card" out of a page (or "#result" fragment) offline.
+
+    Works on driver.page_source or on saved HTML files, so parsing can be
+    run and timed without a browser. Returns (tender, raw_html) tuples.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    results = []
+    for card in soup.select("#bidCard .card"):
+        link = card.select_one(".bid_no a")
+        qty = card.select_one(".col-md-4 div.row:nth-of-type(2)")
+        dept = card.select_one(".col-md-5 div.row")
+        start = card.select_one(".start_date")
+        end = card.select_one(".end_date")
+        raw_html = str(card)
+        fields = {
+            "bid_no": _soup_text(link) if link else None,
+            "link": urljoin(base_url, link.get("href", "")) if link else None,
+            "html": raw_html,
+            "item_rows": [_soup_text(row) for row in card.select(".col-md-4 .row")],
+            "quantity": _soup_text(qty) if qty else None,
+            "department": _soup_text(dept) if dept else None,
+            "start_date": _soup_text(start) if start else None,
+            "end_date": _soup_text(end) if end else None,
+        }
+        results.append((tender_from_fields(fields, page_num), raw_html))
+    return results
+
+
+def parse_saved_html(path, page_num=1):
+    """Parse a result page saved to disk."""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_cards_html(f.read(), page_num)
+
+
+def extract_cards_html(driver, page_num):
+    """Grab the "#result" container once and parse it offline with BeautifulSoup."""
+    html = driver.execute_script(
+        "const el = document.getElementById('result'); return el ? el.outerHTML : null;"
+    )
+    if not html:
+        html = driver.page_source
+    return parse_cards_html(html, page_num, base_url=driver.current_url)
+
+
+EXTRACTORS = {
+    "selenium": extract_cards_selenium,
+    "script": extract_cards_script,
+    "html": extract_cards_html,
+}
+
+
+def extract_page(driver, page_num, mode="script"):
+    """Run the chosen extractor and return (results, seconds_taken)."""
+    started = time.perf_counter()
+    results = EXTRACTORS[mode](driver, page_num)
+    return results, time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    # Benchmark the offline parser on saved pages:
+    #   python gem_extract.py page1.html page2.html ...
+    total_cards = 0
+    total_secs = 0.0
+    for page_num, path in enumerate(sys.argv[1:], start=1):
+        started = time.perf_counter()
+        results = parse_saved_html(path, page_num)
+        elapsed = time.perf_counter() - started
+        total_cards += len(results)
+        total_secs += elapsed
+        print(f"{path}: {len(results)} cards in {elapsed * 1000:.1f} ms ({HTML_PARSER})")
+    if total_secs:
+        print(f"Total: {total_cards} cards in {total_secs:.3f}s ({total_cards / total_secs:.0f} cards/s)")
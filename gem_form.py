@@ -0,0 +1,169 @@
+import json
+import os
+import threading
+import time
+
+OPTIONS_PATH = os.path.join(os.path.expanduser("~"), ".askara_tender_search", "gem_options.json")
+MAX_AGE_DAYS = 7  # organization lists older than this are re-read from the page
+
+# [value, text] of every non-empty option of a <select>
+READ_OPTIONS_JS = """
+const select = document.getElementById(arguments[0]);
+if (!select) return [];
+return Array.from(select.options).filter(o => o.value).map(o => [o.value, o.text.trim()]);
+"""
+
+# Sets each field in turn and fires the events select2 and the page's
+# dependent-dropdown code listen to. A <select> option is found by value, or
+# by text when no value is given; a missing option with a known value is
+# added, so a cached organization works before the page has loaded the list.
+SET_FIELDS_JS = """
+const fields = arguments[0];
+const fire = (el, names) => {
+    if (window.jQuery) { names.forEach(n => jQuery(el).trigger(n)); return; }
+    names.forEach(n => el.dispatchEvent(new Event(n, {bubbles: true})));
+};
+const tab = document.getElementById('ministry-tab');
+if (tab) tab.click();
+for (const f of fields) {
+    const el = document.getElementById(f.id);
+    if (!el) return 'missing #' + f.id;
+    if (el.tagName === 'SELECT') {
+        const options = Array.from(el.options);
+        let option = options.find(o => f.value != null && o.value === f.value)
+            || options.find(o => o.text.trim() === f.text);
+        if (!option) {
+            if (f.value == null) return 'no option ' + f.text + ' in #' + f.id;
+            option = new Option(f.text || f.value, f.value);
+            el.appendChild(option);
+        }
+        el.value = option.value;
+        const rendered = el.nextElementSibling && el.nextElementSibling.querySelector('.select2-selection__rendered');
+        if (rendered) rendered.textContent = option.text;
+    } else {
+        el.removeAttribute('readonly');
+        el.value = f.value;
+    }
+    if (f.fire) fire(el, el.tagName === 'SELECT' ? ['change'] : ['input', 'change']);
+}
+return null;
+"""
+
+READ_FORM_JS = """
+const text = id => {
+    const el = document.getElementById(id);
+    if (!el) return null;
+    return el.tagName === 'SELECT' ? (el.selectedIndex >= 0 ? el.options[el.selectedIndex].text.trim() : '') : el.value;
+};
+return [text('ministry'), text('organization'), text('bidendFromMinistrySearch'), text('bidendToMinistrySearch')];
+"""
+
+_lock = threading.Lock()
+
+
+class OptionCache:
+    """Ministry -> [value, text] organization options, as last read from the advance-search page."""
+
+    def __init__(self, path=OPTIONS_PATH, max_age_days=MAX_AGE_DAYS):
+        self.path = path
+        self.max_age = max_age_days * 86400
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+
+    def organizations(self, ministry):
+        """Cached [value, text] pairs for ministry, or None if unknown or stale."""
+        with _lock:
+            entry = self.data.get(ministry)
+        if not entry or time.time() - entry.get("saved_at", 0) > self.max_age:
+            return None
+        return entry["options"]
+
+    def value_for(self, ministry, organization):
+        return pick_option(self.organizations(ministry) or [], organization)
+
+    def put(self, ministry, options):
+        with _lock:
+            self.data[ministry] = {"saved_at": time.time(), "options": [list(o) for o in options]}
+        self.save()
+
+    def forget(self, ministry):
+        with _lock:
+            self.data.pop(ministry, None)
+        self.save()
+
+    def save(self):
+        # Held for the write too: the scrapers of a ministry sweep share one cache file
+        with _lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp, self.path)
+
+
+def pick_option(options, organization):
+    """The (value, text) option for organization: an exact text match, else the only option containing it."""
+    exact = [(value, text) for value, text in options if text == organization]
+    if exact:
+        return exact[0]
+    partial = [(value, text) for value, text in options if organization in text]
+    return partial[0] if len(partial) == 1 else None
+
+
+def read_options(driver, select_id):
+    return [tuple(o) for o in driver.execute_script(READ_OPTIONS_JS, select_id) or []]
+
+
+def load_organizations(driver, waits, ministry, cache=None):
+    """Pick ministry, wait for the page to load its organizations and return (and cache) them."""
+    waits.until(driver, "ministry options", lambda d: read_options(d, "ministry") or False)
+    error = driver.execute_script(SET_FIELDS_JS, [{"id": "ministry", "value": None, "text": ministry, "fire": True}])
+    if error:
+        raise RuntimeError(f"advance-search form has changed: {error}")
+    options = waits.until(driver, "organization options", lambda d: read_options(d, "organization") or False)
+    if cache is not None:
+        cache.put(ministry, options)
+    return options
+
+
+def fill_form(driver, waits, ministry, organization, start_date, end_date, cache=None):
+    """Set ministry, organization and the bid end date range in one script.
+
+    With the organization in the cache, the ministry is set without firing
+    its change event, so the page never reloads the organization list and
+    no dropdown round trip happens. Otherwise the ministry's change event
+    loads the list once and it is cached for next time. Returns "cache" or
+    "page" (where the organization came from); raises RuntimeError if the
+    form doesn't read back as set.
+    """
+    cached = cache.value_for(ministry, organization) if cache is not None else None
+    source = "cache"
+    if cached is not None:
+        waits.until(driver, "ministry options", lambda d: read_options(d, "ministry") or False)
+    else:
+        source = "page"
+        options = load_organizations(driver, waits, ministry, cache)
+        cached = pick_option(options, organization)
+        if cached is None:
+            raise RuntimeError(f"'{organization}' is not an organization under {ministry} (or matches more than one)")
+
+    org_value, org_text = cached
+    fields = [
+        {"id": "ministry", "value": None, "text": ministry, "fire": False},
+        {"id": "organization", "value": org_value, "text": org_text, "fire": True},
+        {"id": "bidendFromMinistrySearch", "value": start_date, "fire": True},
+        {"id": "bidendToMinistrySearch", "value": end_date, "fire": True},
+    ]
+    error = driver.execute_script(SET_FIELDS_JS, fields)
+    if error:
+        raise RuntimeError(f"advance-search form has changed: {error}")
+
+    state = driver.execute_script(READ_FORM_JS)
+    if state != [ministry, org_text, start_date, end_date]:
+        if cache is not None and source == "cache":
+            cache.forget(ministry)  # the cached list may be out of date; re-read it next time
+        raise RuntimeError(f"form did not keep the values set: {state}")
+    return source
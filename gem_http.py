@@ -0,0 +1,369 @@
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+GEM_BASE_URL = "https://bidplus.gem.gov.in/"
+MINISTRY = "MINISTRY OF PETROLEUM AND NATURAL GAS"
+PAGE_SIZE = 10
+
+CSRF_FIELD = "csrf_bd_gem_nk"
+CSRF_COOKIE = "csrf_gem_cookie"
+CSRF_INPUT_RE = re.compile(r'name=["\']' + CSRF_FIELD + r'["\'][^>]*value=["\']([^"\']+)["\']')
+CSRF_JS_RE = re.compile(CSRF_FIELD + r'["\']?\s*[:=]\s*["\']([^"\']+)["\']')
+
+
+class GemContractError(Exception):
+    """The search endpoint answered with something we don't know how to read.
+
+    Callers should treat this as "use the Selenium path instead".
+    """
+
+
+def _first(value, default=None):
+    # Solr docs come back with every field wrapped in a list
+    if isinstance(value, list):
+        return value[0] if value else default
+    return value if value is not None else default
+
+
+def _card_date(value):
+    """Turn '2025-01-31T15:00:00Z' into the '31-01-2025 3:00 PM' form the cards show."""
+    if not value:
+        return "N/A"
+    try:
+        dt = datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S")
+    except ValueError:
+        return value
+    return dt.strftime("%d-%m-%Y ") + dt.strftime("%I:%M %p").lstrip("0")
+
+
+def doc_to_tender(doc, page_num, base_url=GEM_BASE_URL):
+    """Map one search-bids doc onto the same record the card scrapers produce."""
+    bid_no = _first(doc.get("b_bid_number"))
+    if bid_no is None:
+        raise GemContractError(f"search doc without b_bid_number: {sorted(doc)[:10]}")
+    bid_id = _first(doc.get("b_id"), _first(doc.get("id")))
+    ministry = _first(doc.get("ba_official_details_minName"), "")
+    dept = _first(doc.get("ba_official_details_deptName"), "")
+    quantity = _first(doc.get("b_total_quantity"))
+    return {
+        "BID NO": bid_no,
+        "Link": urljoin(base_url, f"showbidDocument/{bid_id}") if bid_id is not None else "N/A",
+        "Item Description": _first(doc.get("b_category_name"), "N/A"),
+        "Quantity": str(quantity) if quantity is not None else "N/A",
+        "Department": " ".join(part for part in (ministry, dept) if part) or "N/A",
+        "Start Date": _card_date(_first(doc.get("final_start_date_sort"))),
+        "End Date": _card_date(_first(doc.get("final_end_date_sort"))),
+        "Page": page_num
+    }
+
+
+def parse_search_response(data):
+    """Return (num_found, docs) from a search-bids JSON body, or raise GemContractError."""
+    try:
+        inner = data["response"]["response"]
+        num_found = int(inner["numFound"])
+        docs = inner["docs"]
+    except (KeyError, TypeError, ValueError) as e:
+        raise GemContractError(f"unexpected search-bids payload: {e!r}")
+    if not isinstance(docs, list):
+        raise GemContractError("search-bids docs is not a list")
+    return num_found, docs
+
+
+class GemSearchClient:
+    """Talks to the advance-search backend directly, without a browser.
+
+    One pooled requests.Session is kept per client; the CSRF token is read
+    from the advance-search page and refreshed once if the server rejects it.
+    Pass record_dir to save every response so it can be replayed later with
+    `python gem_http.py --replay <dir>`.
+    """
+
+    def __init__(self, base_url=GEM_BASE_URL, timeout=20, pool_size=4, record_dir=None):
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.timeout = timeout
+        self.record_dir = record_dir
+        self.csrf_token = None
+
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                      allowed_methods=None)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                          "(KHTML, like Gecko) Chrome/131.0 Safari/537.36",
+            "X-Requested-With": "XMLHttpRequest",
+        })
+
+    def close(self):
+        self.session.close()
+
+    def _record(self, name, body):
+        if not self.record_dir:
+            return
+        os.makedirs(self.record_dir, exist_ok=True)
+        with open(os.path.join(self.record_dir, name), "w", encoding="utf-8") as f:
+            f.write(body)
+
+    def refresh_csrf(self):
+        """Load the advance-search page for cookies and the CSRF token."""
+        resp = self.session.get(urljoin(self.base_url, "advance-search"), timeout=self.timeout)
+        resp.raise_for_status()
+        self._record("advance-search.html", resp.text)
+        match = CSRF_INPUT_RE.search(resp.text) or CSRF_JS_RE.search(resp.text)
+        if match:
+            self.csrf_token = match.group(1)
+        else:
+            self.csrf_token = self.session.cookies.get(CSRF_COOKIE)
+        if not self.csrf_token:
+            raise GemContractError("no CSRF token on the advance-search page")
+        return self.csrf_token
+
+    def search_page(self, organization, bid_end_from, bid_end_to, page=1, ministry=MINISTRY):
+        """Fetch one page of ministry/organization results; returns (num_found, docs)."""
+        if self.csrf_token is None:
+            self.refresh_csrf()
+        payload = {
+            "searchType": "ministry-search",
+            "ministry": ministry,
+            "buyerState": "",
+            "organization": organization,
+            "department": "",
+            "bidEndFromMin": bid_end_from,
+            "bidEndToMin": bid_end_to,
+            "page": page,
+        }
+        for attempt in range(2):
+            resp = self.session.post(
+                urljoin(self.base_url, "search-bids"),
+                data={"payload": json.dumps(payload), CSRF_FIELD: self.csrf_token},
+                timeout=self.timeout,
+            )
+            if resp.status_code in (403, 419) and attempt == 0:
+                # token expired; fetch a fresh one and retry once
+                self.refresh_csrf()
+                continue
+            resp.raise_for_status()
+            break
+        self._record(f"search-bids-p{page}.json", resp.text)
+        try:
+            data = resp.json()
+        except ValueError:
+            raise GemContractError("search-bids did not return JSON")
+        return parse_search_response(data)
+
+    def iter_pages(self, organization, bid_end_from, bid_end_to, ministry=MINISTRY, first_page=1):
+        """Yield (page_num, total_pages, tenders) for every page of a search."""
+        page = first_page
+        while True:
+            num_found, docs = self.search_page(organization, bid_end_from, bid_end_to, page, ministry)
+            total_pages = max(1, -(-num_found // PAGE_SIZE))
+            yield page, total_pages, [doc_to_tender(doc, page, self.base_url) for doc in docs]
+            if not docs or page >= total_pages:
+                break
+            page += 1
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "gem_replay")
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Serves responses recorded by GemSearchClient(record_dir=...).
+
+    Searches posted with a token other than the recorded page's are
+    answered with reject_status, the way GeM answers an expired session.
+    """
+
+    record_dir = "."
+    reject_status = 419
+    stats = None
+
+    def _send_file(self, name, content_type):
+        path = os.path.join(self.record_dir, name)
+        if not os.path.exists(path):
+            self.send_error(404, f"no recording for {name}")
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _count(self, key):
+        if self.stats is not None:
+            with self.stats["lock"]:
+                self.stats[key] = self.stats.get(key, 0) + 1
+
+    def _recorded_token(self):
+        try:
+            with open(os.path.join(self.record_dir, "advance-search.html"), "r", encoding="utf-8") as f:
+                match = CSRF_INPUT_RE.search(f.read())
+        except OSError:
+            return None
+        return match.group(1) if match else None
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("advance-search"):
+            self._count("advance-search")
+            self._send_file("advance-search.html", "text/html; charset=utf-8")
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        try:
+            page = json.loads(form["payload"][0]).get("page", 1)
+        except (KeyError, ValueError):
+            self.send_error(400, "missing payload")
+            return
+        token = self._recorded_token()
+        if token and form.get(CSRF_FIELD, [None])[0] != token:
+            self._count("rejected")
+            self.send_error(self.reject_status, "CSRF token mismatch")
+            return
+        self._count("search-bids")
+        self._send_file(f"search-bids-p{page}.json", "application/json")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_replay(record_dir, reject_status=419, host="127.0.0.1", port=0):
+    """Replay a recorded search on a background thread; returns (server, base_url).
+
+    port=0 picks a free port. Request counts are kept in server.stats.
+    """
+    stats = {"lock": threading.Lock()}
+    handler = type("BoundReplayHandler", (ReplayHandler,), {
+        "record_dir": record_dir,
+        "reject_status": reject_status,
+        "stats": stats,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.stats = stats
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+
+def serve_recordings(record_dir, port=8765):
+    """Run a local stub server that replays a recorded search."""
+    handler = type("BoundReplayHandler", (ReplayHandler,), {"record_dir": record_dir})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    print(f"Replaying '{record_dir}' on http://127.0.0.1:{port}/")
+    server.serve_forever()
+
+
+def check_replay(record_dir=FIXTURE_DIR):
+    """Run iter_pages against a replayed search; returns a list of failures (empty when all is well).
+
+    Covers a plain run, the CSRF refresh after a 403 or 419, and the
+    GemContractError the GUI falls back to Selenium on.
+    """
+    failures = []
+    pages = sorted(int(m.group(1)) for m in map(re.compile(r"search-bids-p(\d+)\.json$").match,
+                                                  os.listdir(record_dir)) if m)
+    expected = []
+    for page in pages:
+        with open(os.path.join(record_dir, f"search-bids-p{page}.json"), "r", encoding="utf-8") as f:
+            _, docs = parse_search_response(json.load(f))
+        expected.extend(_first(doc["b_bid_number"]) for doc in docs)
+
+    def fetch(base_url, expire_token=False):
+        client = GemSearchClient(base_url, timeout=5)
+        try:
+            if expire_token:
+                client.refresh_csrf()
+                client.csrf_token = "expired"
+            return [t["BID NO"] for _, _, tenders in client.iter_pages("OIL INDIA LIMITED", "", "")
+                    for t in tenders]
+        finally:
+            client.close()
+
+    server, base_url = start_replay(record_dir)
+    try:
+        got = fetch(base_url)
+        if got != expected:
+            failures.append(f"plain run: {len(got)} bids, expected {len(expected)}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for status in (403, 419):
+        server, base_url = start_replay(record_dir, reject_status=status)
+        try:
+            got = fetch(base_url, expire_token=True)
+            if got != expected:
+                failures.append(f"expired token ({status}): {len(got)} bids, expected {len(expected)}")
+            if server.stats.get("rejected") != 1 or server.stats.get("advance-search") != 2:
+                failures.append(f"expired token ({status}): token was not refreshed exactly once")
+        except Exception as e:
+            failures.append(f"expired token ({status}): {e!r}")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    # A page that isn't JSON (a login or maintenance page) must raise GemContractError
+    broken = tempfile.mkdtemp()
+    try:
+        for name in os.listdir(record_dir):
+            shutil.copy(os.path.join(record_dir, name), broken)
+        with open(os.path.join(broken, "search-bids-p2.json"), "w", encoding="utf-8") as f:
+            f.write("<html><body>Session expired, please log in again.</body></html>")
+        server, base_url = start_replay(broken)
+        try:
+            fetch(base_url)
+            failures.append("non-JSON page: no GemContractError")
+        except GemContractError:
+            pass
+        except Exception as e:
+            failures.append(f"non-JSON page: {e!r} instead of GemContractError")
+        finally:
+            server.shutdown()
+            server.server_close()
+    finally:
+        shutil.rmtree(broken, ignore_errors=True)
+    return failures
+
+
+if __name__ == "__main__":
+    # python gem_http.py --replay recordings/ [port]
+    # python gem_http.py --check [recordings/]
+    # python gem_http.py "OIL INDIA LIMITED" 2025-01-01 2025-01-31 [base_url] [record_dir]
+    if len(sys.argv) >= 2 and sys.argv[1] == "--check":
+        failures = check_replay(sys.argv[2] if len(sys.argv) > 2 else FIXTURE_DIR)
+        for failure in failures:
+            print(f"FAIL {failure}")
+        print("replay check passed" if not failures else f"{len(failures)} replay check(s) failed")
+        sys.exit(1 if failures else 0)
+    elif len(sys.argv) >= 3 and sys.argv[1] == "--replay":
+        serve_recordings(sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else 8765)
+    elif len(sys.argv) >= 4:
+        org, start, end = sys.argv[1:4]
+        base = sys.argv[4] if len(sys.argv) > 4 else GEM_BASE_URL
+        client = GemSearchClient(base, record_dir=sys.argv[5] if len(sys.argv) > 5 else None)
+        count = 0
+        for page_num, total_pages, tenders in client.iter_pages(org, start, end):
+            count += len(tenders)
+            print(f"Page {page_num}/{total_pages}: {len(tenders)} tenders")
+        print(f"Total: {count} tenders")
+        client.close()
+    else:
+        print("usage: gem_http.py --replay DIR [PORT] | --check [DIR] | ORG FROM TO [BASE_URL] [RECORD_DIR]")
@@ -0,0 +1,96 @@
+import re
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+RESULTS_PER_PAGE = 10
+
+# Highest page number shown in the pagination bar, or derived from the
+# "Showing 1 to 10 of N records" banner when the bar is truncated.
+TOTAL_PAGES_JS = """
+let best = 0;
+document.querySelectorAll('.page-link').forEach(el => {
+    const n = parseInt(el.textContent.trim(), 10);
+    if (!isNaN(n) && n > best) best = n;
+});
+const banner = document.getElementById('result') || document.body;
+return [best, banner.innerText];
+"""
+
+CURRENT_PAGE_JS = """
+const el = document.querySelector('.pagination .active, .page-link.current, .page-item.active .page-link');
+const n = el ? parseInt(el.textContent.trim(), 10) : NaN;
+return isNaN(n) ? 1 : n;
+"""
+
+# Moves the result view towards page `target` in one step: through the
+# simplePagination plugin when it is loaded, otherwise by clicking the
+# furthest visible page link that does not overshoot, otherwise "next".
+JUMP_JS = """
+const target = arguments[0];
+if (window.jQuery) {
+    const bar = jQuery('#light-pagination');
+    if (bar.length && bar.data('pagination')) {
+        bar.pagination('selectPage', target);
+        return true;
+    }
+}
+let best = null, bestN = 0;
+document.querySelectorAll('a.page-link').forEach(a => {
+    const n = parseInt(a.textContent.trim(), 10);
+    if (!isNaN(n) && n <= target && n > bestN) { best = a; bestN = n; }
+});
+const current = arguments[1];
+if (best && bestN > current) { best.click(); return true; }
+const next = document.querySelector('a.page-link.next');
+if (next) { next.click(); return true; }
+return false;
+"""
+
+RECORDS_RE = re.compile(r"of\s+([\d,]+)\s+(?:records|results|entries)", re.IGNORECASE)
+
+
+def read_total_pages(driver):
+    """Best guess at the number of result pages after the first search returns."""
+    best, banner = driver.execute_script(TOTAL_PAGES_JS)
+    match = RECORDS_RE.search(banner or "")
+    if match:
+        records = int(match.group(1).replace(",", ""))
+        best = max(best, -(-records // RESULTS_PER_PAGE))
+    return max(1, best)
+
+
+def current_page(driver):
+    return driver.execute_script(CURRENT_PAGE_JS)
+
+
+def goto_page(driver, page, timeout=10):
+    """Navigate an open result set to `page`; returns False if it cannot get there."""
+    current = current_page(driver)
+    steps = 0
+    while current != page:
+        if current > page or steps > page:
+            return False
+        if not driver.execute_script(JUMP_JS, page, current):
+            return False
+        before = current
+        try:
+            WebDriverWait(driver, timeout).until(lambda d: current_page(d) != before)
+        except Exception:
+            return False
+        current = current_page(driver)
+        steps += 1
+    return True
+
+
+def split_page_range(total_pages, workers):
+    """Split pages 1..total_pages into at most `workers` contiguous (first, last) slices."""
+    workers = max(1, min(workers, total_pages))
+    size, extra = divmod(total_pages, workers)
+    slices = []
+    first = 1
+    for i in range(workers):
+        last = first + size - 1 + (1 if i < extra else 0)
+        slices.append((first, last))
+        first = last + 1
+    return slices
+
@@ -0,0 +1,168 @@
+import re
+
+import pandas as pd
+
+from keyword_taxonomy import CONCEPTS, compile_concepts, concept_patterns, fold_plural
+
+SEP = None  # trie token for "one or more non-word characters"
+
+
+def surface_forms(folded):
+    """Spellings that fold_plural() maps onto the folded word."""
+    candidates = {folded, folded + "s", folded + "es"}
+    if folded.endswith("y"):
+        candidates.add(folded[:-1] + "ies")
+    return sorted(c for c in candidates if fold_plural(c) == folded)
+
+
+def _trie_regex(node):
+    """Render a character trie as a regex; shared prefixes are matched once."""
+    branches = [
+        (r"\W+" if token is SEP else re.escape(token)) + _trie_regex(child)
+        for token, child in sorted(node.items(), key=lambda kv: (kv[0] is SEP, kv[0] or ""))
+        if token != ""
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return "(?:" + body + ")?"  # greedy: the longer spelling is tried first
+    return body
+
+
+class FrameMatcher:
+    """A concept taxonomy compiled into one regex for whole DataFrame columns.
+
+    Instead of normalizing and plural-folding every description, every
+    spelling the word matcher would accept (plural forms, any separator
+    run between words, run-together compounds) is generated once and
+    packed into a single character-trie regex. The column is only
+    lowercased, then Series.str.findall runs that regex inside a
+    lookahead, so overlapping concepts are all found. Each hit (a few
+    words at most) is then read by the word matcher to name its concepts.
+    """
+
+    def __init__(self, concepts=CONCEPTS):
+        self.words = compile_concepts(concepts)
+        self.rank = {concept: i for i, concept in enumerate(concepts)}
+
+        # Run-together words a pattern can start or end inside ("floatingpiper" holds "piper")
+        self.ending_in, self.starting_with = {}, {}
+        for key, (first, second) in self.words.compounds.items():
+            forms = [list(form) for form in surface_forms(key)]
+            self.ending_in.setdefault(second, []).extend(forms)
+            self.starting_with.setdefault(first, []).extend(forms)
+
+        trie = {}
+        for pattern, _ in concept_patterns(concepts):
+            for spelling in self._spellings(pattern.split(), at_start=True):
+                node = trie
+                for token in spelling:
+                    node = node.setdefault(token, {})
+                node[""] = {}
+        self.regex = re.compile(r"(?=\b(" + _trie_regex(trie) + r")\b)")
+
+    def _spellings(self, words, at_start=False):
+        """Token sequences (characters and SEP) for every accepted spelling of a folded pattern."""
+        if not words:
+            return [[]]
+        options = [list(form) for form in surface_forms(words[0])]
+        if at_start:
+            options += self.ending_in.get(words[0], [])
+        if len(words) == 1:
+            options += self.starting_with.get(words[0], [])
+        spellings = [form + [SEP] + rest if rest else form
+                     for rest in self._spellings(words[1:]) for form in options]
+        if len(words) > 1 and self.words.compounds.get(fold_plural(words[0] + words[1])) == (words[0], words[1]):
+            joined = [list(form) for form in surface_forms(fold_plural(words[0] + words[1]))]
+            if len(words) == 2:
+                joined += self.starting_with.get(words[1], [])
+            spellings += [form + [SEP] + rest if rest else form
+                          for rest in self._spellings(words[2:]) for form in joined]
+        return spellings
+
+    def concepts(self, series):
+        """Series of matched-concept lists, in taxonomy order."""
+        hits = series.fillna("").astype(str).str.lower().str.findall(self.regex)
+        matched, rank = self.words.matched, self.rank
+        return hits.map(lambda found: sorted({c for h in found for c in matched(h)}, key=rank.get) if found else [])
+
+
+def match_frame(df, concepts=CONCEPTS, column="Item Description", matcher=None):
+    """Copy of df with "Matched Keyword" (first concept) and "Matched Concepts" ("; "-joined) columns."""
+    matcher = matcher or FrameMatcher(concepts)
+    out = df.copy()
+    if column not in out.columns or out.empty:
+        out["Matched Keyword"] = pd.Series(dtype=str)
+        out["Matched Concepts"] = pd.Series(dtype=str)
+        return out
+    found = matcher.concepts(out[column])
+    out["Matched Keyword"] = found.str[0].fillna("")
+    out["Matched Concepts"] = found.str.join("; ")
+    return out
+
+
+def matched_rows(df, concepts=CONCEPTS, column="Item Description", matcher=None):
+    """Only the rows that hit at least one concept, with the match columns added."""
+    out = match_frame(df, concepts, column, matcher)
+    return out[out["Matched Keyword"] != ""]
+
+
+def iter_matched(records, matcher=None, chunk_size=5000, column="Item Description"):
+    """matched_rows() over an iterable of record dicts, one DataFrame per chunk_size records."""
+    matcher = matcher or FrameMatcher()
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield matched_rows(pd.DataFrame(chunk), column=column, matcher=matcher)
+            chunk = []
+    if chunk:
+        yield matched_rows(pd.DataFrame(chunk), column=column, matcher=matcher)
+
+
+if __name__ == "__main__":
+    # python keyword_frame.py export-all.xlsx [out.xlsx]   filter a saved export
+    # python keyword_frame.py --bench [rows]                time a synthetic batch
+    import random
+    import sys
+    import time
+
+    from keyword_taxonomy import base_keywords
+
+    if len(sys.argv) > 1 and sys.argv[1] != "--bench":
+        df = pd.read_excel(sys.argv[1]) if sys.argv[1].endswith(".xlsx") else pd.read_csv(sys.argv[1])
+        started = time.perf_counter()
+        hits = matched_rows(df)
+        print(f"{len(hits)}/{len(df)} rows matched in {time.perf_counter() - started:.3f}s")
+        if len(sys.argv) > 2:
+            hits.to_excel(sys.argv[2], index=False)
+        sys.exit(0)
+
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    spellings = base_keywords()
+    filler = ("supply of", "procurement", "spares for", "annual maintenance", "pump", "motor", "cables",
+              "pipe", "fittings", "assemblies", "nos", "set", "hydraulic", "boxes", "(", ")", "-", "/")
+    rng = random.Random(11)
+    descs = []
+    for _ in range(rows):
+        words = [rng.choice(filler) for _ in range(rng.randint(4, 14))]
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(spellings).upper() + rng.choice(("", "s")))
+        descs.append(" ".join(words))
+    df = pd.DataFrame({"BID NO": [f"GEM/{i}" for i in range(rows)], "Item Description": descs})
+
+    matcher = FrameMatcher()
+    started = time.perf_counter()
+    out = match_frame(df, matcher=matcher)
+    frame_secs = time.perf_counter() - started
+
+    started = time.perf_counter()
+    words = compile_concepts()
+    expected = [words.first(d) or "" for d in descs]
+    loop_secs = time.perf_counter() - started
+
+    disagree = int((out["Matched Keyword"] != pd.Series(expected)).sum())
+    print(f"{rows} rows, {int((out['Matched Keyword'] != '').sum())} matched")
+    print(f"vectorized frame filter: {frame_secs:.3f}s | per-row matcher loop: {loop_secs:.3f}s "
+          f"| {disagree} rows disagree")
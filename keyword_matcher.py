@@ -0,0 +1,181 @@
+import re
+from collections import deque, namedtuple
+
+KeywordMatch = namedtuple("KeywordMatch", ["keyword", "start", "end"])
+
+NON_WORD_RE = re.compile(r"\W+")
+
+
+def normalize(text):
+    """Lowercase, turn every run of non-word characters into one space (the V4 rule)."""
+    return NON_WORD_RE.sub(" ", text.lower()).strip()
+
+
+class KeywordMatcher:
+    """All keywords of a list, compiled once into an Aho-Corasick automaton over words.
+
+    V4 tested each keyword as r'\\b<normalized kw>\\b' against the normalized
+    description. After normalization both sides are single-space separated
+    words, so that is exactly "the keyword's words occur as consecutive whole
+    words", which is what the automaton finds, in one pass over the
+    description's words and for every keyword at once. Keywords that
+    normalize to nothing can never be a whole-word match and are dropped.
+
+    labels (same length as keywords) is what gets reported for each
+    keyword, e.g. the concept a generated variant belongs to. fold is
+    applied to every word on both sides before matching (plural folding).
+    With compounds=True, any two adjacent keyword words written as one
+    ("wellhead", "realtime") are split back apart wherever they occur, so
+    run-together spellings match without being patterns of their own.
+    """
+
+    def __init__(self, keywords, labels=None, fold=None, compounds=False):
+        self.keywords = list(keywords)
+        self.labels = list(labels) if labels is not None else self.keywords
+        self.fold = fold
+        self.compounds = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]  # per state: (keyword index, length in words), via the fail chain too
+
+        keyword_words = [self._words(keyword) for keyword in self.keywords]
+        if compounds:
+            for words in keyword_words:
+                for first, second in zip(words, words[1:]):
+                    joined = first + second
+                    self.compounds.setdefault(self.fold(joined) if self.fold else joined, (first, second))
+            keyword_words = [self._expand(words) for words in keyword_words]
+
+        for index, words in enumerate(keyword_words):
+            if not words:
+                continue
+            state = 0
+            for word in words:
+                nxt = self._goto[state].get(word)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][word] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((index, len(words)))
+
+        # Breadth-first failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, nxt in self._goto[state].items():
+                queue.append(nxt)
+                if state:
+                    fail = self._fail[state]
+                    while fail and word not in self._goto[fail]:
+                        fail = self._fail[fail]
+                    self._fail[nxt] = self._goto[fail].get(word, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _words(self, text, normalized=False):
+        words = (text if normalized else normalize(text)).split()
+        if self.fold is not None:
+            words = [self.fold(word) for word in words]
+        return words
+
+    def _expand(self, words):
+        if not self.compounds:
+            return words
+        expanded = []
+        for word in words:
+            expanded.extend(self.compounds.get(word, (word,)))
+        return expanded
+
+    def _scan(self, words):
+        """Yield (keyword index, first word, last word) for every match."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, word in enumerate(words):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for index, length in out[state]:
+                yield index, position - length + 1, position
+
+    def find_all(self, text, normalized=False):
+        """Every keyword occurrence as KeywordMatch(keyword, start, end).
+
+        start/end are character offsets into normalize(text), ordered by
+        where the match ends.
+        """
+        clean = text if normalized else normalize(text)
+        words, spans = [], []
+        pos = 0
+        for word in (clean.split(" ") if clean else []):
+            span = (pos, pos + len(word))
+            pos = span[1] + 1
+            for part in self._expand([self.fold(word) if self.fold is not None else word]):
+                words.append(part)
+                spans.append(span)
+        return [
+            KeywordMatch(self.labels[index], spans[first][0], spans[last][1])
+            for index, first, last in self._scan(words)
+        ]
+
+    def matched(self, text, normalized=False):
+        """Distinct matched labels, in keyword-list order."""
+        hits = {index for index, _, _ in self._scan(self._expand(self._words(text, normalized)))}
+        return list(dict.fromkeys(self.labels[index] for index in sorted(hits)))
+
+    def first(self, text, normalized=False):
+        """The keyword V4's loop would have reported: the earliest one in the list that matches."""
+        best = None
+        for index, _, _ in self._scan(self._expand(self._words(text, normalized))):
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        return None if best is None else self.labels[best]
+
+
+if __name__ == "__main__":
+    # Compare against the V4 per-keyword regex loop on a synthetic corpus
+    import random
+    import sys
+    import time
+
+    from keyword_taxonomy import base_keywords
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    keywords = base_keywords()
+    filler = ("supply of", "procurement", "spares for", "annual maintenance", "pump", "motor", "cable",
+              "pipe", "fitting", "assembly", "nos", "set", "hydraulic", "electrical", "(", ")", "-", "/")
+    rng = random.Random(7)
+    corpus = []
+    for _ in range(count):
+        words = [rng.choice(filler) for _ in range(rng.randint(4, 14))]
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords).upper())
+        corpus.append(" ".join(words))
+
+    def v4_first(desc):
+        desc_clean = normalize(desc)
+        for kw in keywords:
+            if re.search(r"\b" + re.escape(normalize(kw)) + r"\b", desc_clean):
+                return kw
+        return None
+
+    sample = corpus[: max(1, count // 20)]
+    started = time.perf_counter()
+    expected = [v4_first(desc) for desc in sample]
+    v4_secs = (time.perf_counter() - started) * (len(corpus) / len(sample))
+
+    started = time.perf_counter()
+    matcher = KeywordMatcher(keywords)
+    compile_secs = time.perf_counter() - started
+    started = time.perf_counter()
+    got = [matcher.first(desc) for desc in corpus]
+    ac_secs = time.perf_counter() - started
+
+    mismatches = sum(1 for a, b in zip(expected, got) if a != b)
+    print(f"{len(keywords)} keywords, {count} descriptions, {sum(g is not None for g in got)} matched")
+    print(f"V4 regex loop : {v4_secs:8.2f}s (extrapolated from {len(sample)})")
+    print(f"KeywordMatcher: {ac_secs:8.2f}s + {compile_secs * 1000:.1f} ms compile "
+          f"-> {v4_secs / ac_secs:.0f}x, {mismatches} mismatches on the sample")
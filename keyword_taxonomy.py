@@ -0,0 +1,124 @@
+from keyword_matcher import KeywordMatcher, normalize
+
+# One entry per concept: the concept's own name plus any synonyms, written
+# once, singular and space-separated. Plurals, hyphenated and run-together
+# spellings ("gate-valves", "wellhead", "realtime") are derived by the
+# engine, never listed. Order matters: when a description hits several
+# concepts, the earliest one is reported first.
+CONCEPTS = {
+    "hose": [],
+    "pdc bit": [],
+    "bit": [],
+    "gate valve": [],
+    "ball valve": [],
+    "check valve": [],
+    "choke": [],
+    "well head": [],
+    "well test equipment": [],
+    "christmas tree": ["x mas tree", "christmas", "x mas"],
+    "blow out preventer": ["bop"],
+    "manifold": [],
+    "well contain": [],
+    "on shore": [],
+    "off shore": [],
+    "subsea application": [],
+    "hi lo safety valve": [],
+    "charter hire rig": [],
+    "remote monitoring": ["remote monitor"],
+    "real time monitoring": [],
+    "well stimulation": [],
+    "acidizing": ["acidising", "acidization"],
+    "hf hcl": ["hf and hcl", "hydrofluoric acid hydrochloric acid"],
+    "mopu": [],
+    "engineering service": [],
+    "lost circulation control additive": ["lcca"],
+    "cement additive": [],
+    "down hole gauge": [],
+    "tubing encapsulated cable": ["tec", "t e c"],
+    "control line": [],
+    "drone": [],
+    "free floating piper": [],
+    "piper": [],
+    "carbon mapping": [],
+    "carbon footprint": [],
+    "ccus": ["carbon capture utilization and storage"],
+    "live rig monitoring": [],
+    "analytic": [],
+    "production testing service": [],
+    "heavy weight drill pipe": [],
+    "drill collar": [],
+    "enhanced oil recovery": ["eor"],
+    "electric submersible pump": ["esp"],
+}
+
+
+def fold_plural(word):
+    """Map a word to its singular stem so "valves"/"valve" and "assemblies"/"assembly" compare equal.
+
+    Deliberately crude and applied to both keywords and descriptions, so it
+    only has to be consistent, not correct English.
+    """
+    if len(word) <= 3 or word[-1] != "s" or word.endswith(("ss", "us", "is")):
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if word.endswith(("sses", "ches", "shes", "xes", "zes")):
+        return word[:-2]
+    return word[:-1]
+
+
+def spelling_variants(phrase):
+    """The normalized phrase, plus each spelling with one pair of adjacent words run together.
+
+    Only needed by substring matchers; the compiled matcher handles run-together words itself.
+    """
+    words = normalize(phrase).split()
+    variants = [" ".join(words)]
+    for i in range(len(words) - 1):
+        variants.append(" ".join(words[:i] + [words[i] + words[i + 1]] + words[i + 2:]))
+    return variants
+
+
+def concept_patterns(concepts=CONCEPTS):
+    """(pattern, concept) pairs in concept order: normalized, plural-folded, without duplicates."""
+    pairs = {}
+    for concept, synonyms in concepts.items():
+        for phrase in [concept] + list(synonyms):
+            key = " ".join(fold_plural(word) for word in normalize(phrase).split())
+            if key:
+                pairs.setdefault(key, concept)
+    return list(pairs.items())
+
+
+def compile_concepts(concepts=CONCEPTS):
+    """A KeywordMatcher that folds plurals, hyphens and run-together words and reports concepts."""
+    pairs = concept_patterns(concepts)
+    return KeywordMatcher([p for p, _ in pairs], labels=[c for _, c in pairs], fold=fold_plural, compounds=True)
+
+
+def user_concepts(keywords_str):
+    """Comma-separated keywords typed into a GUI, each as its own concept."""
+    return {k.strip().lower(): [] for k in keywords_str.split(",") if k.strip()}
+
+
+def base_keywords(concepts=CONCEPTS):
+    """Flat list of surface spellings, for generating benchmark corpora and mock fixtures."""
+    keywords = []
+    for concept, synonyms in concepts.items():
+        for phrase in [concept] + list(synonyms):
+            for variant in spelling_variants(phrase):
+                words = variant.split()
+                keywords.append(variant)
+                if len(words) > 1:
+                    keywords.append("-".join(words))
+    return list(dict.fromkeys(keywords))
+
+
+if __name__ == "__main__":
+    patterns = concept_patterns()
+    print(f"{len(CONCEPTS)} concepts -> {len(patterns)} folded patterns "
+          f"({len(base_keywords())} surface spellings for substring matchers)")
+    matcher = compile_concepts()
+    for desc in ("Supply of GATE-VALVES 2 inch", "Wellhead & X-mas tree spares", "Blowout-Preventers (BOP)",
+                 "Realtime monitoring of rigs", "PDC bits 8.5in", "Assemblies"):
+        print(f"{desc!r:40} -> {matcher.matched(desc)}")
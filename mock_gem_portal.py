@@ -0,0 +1,392 @@
+# A local stand-in for bidplus.gem.gov.in, for measuring the scrapers without the live site:
+#   python mock_gem_portal.py [--port 8766] [--records 500] [--latency 0.3] [--page-latency 0.5]
+# It serves an advance-search page with the same ids, select2-style dropdowns,
+# searchBid() and "#bidCard .card" markup the scrapers rely on, plus the
+# search-bids JSON endpoint behind it. Tenders are generated from a seed, so
+# every run sees the same data; bid end dates are spread over --days days
+# from --first-day and searches filter on them like the real site does.
+import argparse
+import html
+import json
+import random
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from bench_keywords import make_corpus
+from gem_http import CSRF_COOKIE, CSRF_FIELD, MINISTRY, PAGE_SIZE
+from keyword_taxonomy import base_keywords
+
+ORGANIZATIONS = [
+    "OIL AND NATURAL GAS CORPORATION LIMITED",
+    "OIL INDIA LIMITED",
+    "GAIL (INDIA) LIMITED",
+    "INDIAN OIL CORPORATION LIMITED",
+]
+OTHER_MINISTRIES = ["MINISTRY OF DEFENCE", "MINISTRY OF RAILWAYS", "MINISTRY OF POWER"]
+DEPARTMENTS = ["Department of Petroleum and Natural Gas", "Drilling Services", "Production Operations"]
+
+
+def make_fixtures(records=500, seed=7, first_day="2025-01-01", days=30, organizations=ORGANIZATIONS):
+    """organization -> list of search-bids docs, each field wrapped in a list like Solr returns it."""
+    keywords = base_keywords()
+    start = datetime.strptime(first_day, "%Y-%m-%d")
+    fixtures = {}
+    serial = 5_000_000
+    for i, org in enumerate(organizations):
+        rng = random.Random(seed + i)
+        docs = []
+        for n, desc in enumerate(make_corpus(records, keywords, seed + i)):
+            serial += 1
+            end = start + timedelta(days=n * days // max(records, 1), hours=15, minutes=rng.choice((0, 30)))
+            begin = end - timedelta(days=rng.randint(7, 21), hours=4)
+            docs.append({
+                "id": [str(serial)],
+                "b_id": [str(serial + 2_000_000)],
+                "b_bid_number": [f"GEM/{end.year}/B/{serial}"],
+                "b_category_name": [desc],
+                "b_total_quantity": [rng.randint(1, 500)],
+                "ba_official_details_minName": [MINISTRY],
+                "ba_official_details_deptName": [rng.choice(DEPARTMENTS)],
+                "final_start_date_sort": [begin.strftime("%Y-%m-%dT%H:%M:%SZ")],
+                "final_end_date_sort": [end.strftime("%Y-%m-%dT%H:%M:%SZ")],
+            })
+        fixtures[org] = docs
+    return fixtures
+
+
+def _parse_day(value):
+    for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y"):
+        try:
+            return datetime.strptime(value.strip(), fmt).date()
+        except (ValueError, AttributeError):
+            continue
+    return None
+
+
+def search(fixtures, payload):
+    """(num_found, docs on the requested page) for a ministry-search payload."""
+    if payload.get("ministry") != MINISTRY:
+        return 0, []
+    docs = fixtures.get(payload.get("organization"), [])
+    low, high = _parse_day(payload.get("bidEndFromMin", "")), _parse_day(payload.get("bidEndToMin", ""))
+    if low or high:
+        def in_window(doc):
+            day = datetime.strptime(doc["final_end_date_sort"][0][:10], "%Y-%m-%d").date()
+            return (low is None or day >= low) and (high is None or day <= high)
+        docs = [doc for doc in docs if in_window(doc)]
+    page = max(1, int(payload.get("page") or 1))
+    return len(docs), docs[(page - 1) * PAGE_SIZE: page * PAGE_SIZE]
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>GeM Bidding (mock)</title>
+<style>
+  .tab-pane { display: none; } .tab-pane.active { display: block; }
+  select.select2-hidden-accessible { display: none; }
+  .select2 { display: inline-block; min-width: 420px; border: 1px solid #aaa; padding: 4px; cursor: pointer; }
+  .select2-results { display: none; list-style: none; margin: 0; padding: 0; border: 1px solid #aaa; max-width: 420px; }
+  .select2-results.open { display: block; }
+  .select2-results li { padding: 3px 6px; cursor: pointer; }
+  .card { border: 1px solid #ddd; margin: 6px 0; padding: 6px; }
+  .pagination { list-style: none; display: flex; gap: 4px; padding: 0; }
+  .page-item.active .page-link { font-weight: bold; }
+</style>
+</head>
+<body>
+<form id="searchForm">
+  <input type="hidden" name="__CSRF_FIELD__" value="__CSRF_TOKEN__">
+</form>
+<ul class="nav nav-tabs">
+  <li><a id="bid-tab" href="#" onclick="showTab('bid-search'); return false;">Search by Bid</a></li>
+  <li><a id="ministry-tab" href="#" onclick="showTab('ministry-search'); return false;">Search by Ministry / Organization</a></li>
+</ul>
+<div class="tab-pane active" id="bid-search"><input type="text" id="searchBidRA"></div>
+<div class="tab-pane" id="ministry-search">
+  <div>
+    <select id="ministry" class="select2-hidden-accessible"><option value=""></option>__MINISTRY_OPTIONS__</select>
+    <span class="select2 select2-container" onclick="toggleDropdown('ministry')"><span class="select2-selection__rendered">Select Ministry</span></span>
+    <ul class="select2-results" id="ministry-results">__MINISTRY_ITEMS__</ul>
+  </div>
+  <div>
+    <select id="organization" class="select2-hidden-accessible"><option value=""></option></select>
+    <span class="select2 select2-container" onclick="toggleDropdown('organization')"><span class="select2-selection__rendered">Select Organization</span></span>
+    <ul class="select2-results" id="organization-results"></ul>
+  </div>
+  <div>
+    <input type="text" id="bidendFromMinistrySearch" class="datepicker" readonly placeholder="Bid End Date From">
+    <input type="text" id="bidendToMinistrySearch" class="datepicker" readonly placeholder="Bid End Date To">
+  </div>
+  <button type="button" id="searchByBid" onclick="searchBid('ministry-search')">Search</button>
+</div>
+<div id="results-holder"></div>
+<script>
+const ORGANIZATIONS = __ORGANIZATIONS__;
+const OPTION_LATENCY_MS = __OPTION_LATENCY_MS__;
+let lastQuery = null;
+
+function showTab(id) {
+  document.querySelectorAll('.tab-pane').forEach(p => p.classList.toggle('active', p.id === id));
+}
+
+function toggleDropdown(id) {
+  document.getElementById(id + '-results').classList.toggle('open');
+}
+
+function fillOptions(id, values) {
+  const select = document.getElementById(id), list = document.getElementById(id + '-results');
+  select.innerHTML = '<option value=""></option>';
+  list.innerHTML = '';
+  values.forEach(v => {
+    const opt = document.createElement('option');
+    opt.value = v; opt.textContent = v;
+    select.appendChild(opt);
+    const li = document.createElement('li');
+    li.className = 'select2-results__option';
+    li.textContent = v;
+    li.onclick = () => pick(id, v);
+    list.appendChild(li);
+  });
+}
+
+function pick(id, value) {
+  document.getElementById(id).value = value;
+  const box = document.getElementById(id).nextElementSibling;
+  box.querySelector('.select2-selection__rendered').textContent = value;
+  document.getElementById(id + '-results').classList.remove('open');
+  // select2 reports a pick as a change event on the underlying <select>
+  document.getElementById(id).dispatchEvent(new Event('change', {bubbles: true}));
+}
+
+// The real site loads the organization list over AJAX once a ministry is picked
+document.getElementById('ministry').addEventListener('change', e => {
+  const value = e.target.value;
+  setTimeout(() => fillOptions('organization', ORGANIZATIONS[value] || []), OPTION_LATENCY_MS);
+});
+
+document.querySelectorAll('#ministry-results li').forEach(li => {
+  li.onclick = () => pick('ministry', li.textContent);
+});
+
+function cardDate(value) {
+  if (!value) return 'N/A';
+  const m = /^(\\d{4})-(\\d{2})-(\\d{2})T(\\d{2}):(\\d{2})/.exec(value);
+  if (!m) return value;
+  let hour = parseInt(m[4], 10);
+  const ampm = hour >= 12 ? 'PM' : 'AM';
+  hour = hour % 12 || 12;
+  return `${m[3]}-${m[2]}-${m[1]} ${hour}:${m[5]} ${ampm}`;
+}
+
+function escapeHtml(text) {
+  return String(text).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+}
+
+function renderCard(doc) {
+  const first = (field, fallback) => (doc[field] && doc[field].length) ? doc[field][0] : fallback;
+  const desc = escapeHtml(first('b_category_name', ''));
+  return `<div class="card">
+  <div class="block_header"><p class="bid_no pull-left">BID NO: <a class="bid_no_hover" href="showbidDocument/${first('b_id', '')}">${escapeHtml(first('b_bid_number', ''))}</a></p></div>
+  <div class="card-body"><div class="row">
+    <div class="col-md-4">
+      <div class="row"><strong>Items:</strong> <a data-content="${desc}">${desc}</a></div>
+      <div class="row"><strong>Quantity:</strong> ${first('b_total_quantity', '')}</div>
+    </div>
+    <div class="col-md-5">
+      <div class="row"><strong>Department Name And Address:</strong><br>${escapeHtml(first('ba_official_details_minName', ''))}<br>${escapeHtml(first('ba_official_details_deptName', ''))}</div>
+    </div>
+    <div class="col-md-3">
+      <div class="row"><strong>Start Date:</strong> <span class="start_date">${cardDate(first('final_start_date_sort'))}</span></div>
+      <div class="row"><strong>End Date:</strong> <span class="end_date">${cardDate(first('final_end_date_sort'))}</span></div>
+    </div>
+  </div></div>
+</div>`;
+}
+
+function renderPagination(page, totalPages) {
+  const items = [];
+  const link = (n, label, cls) => `<li class="page-item"><a href="#page-${n}" class="page-link ${cls || ''}" onclick="loadPage(${n}); return false;">${label}</a></li>`;
+  items.push(page > 1 ? link(page - 1, 'Prev', 'prev') : '<li class="page-item disabled"><span class="page-link prev">Prev</span></li>');
+  const shown = new Set([1, totalPages]);
+  for (let n = Math.max(1, page - 2); n <= Math.min(totalPages, page + 2); n++) shown.add(n);
+  let previous = 0;
+  Array.from(shown).sort((a, b) => a - b).forEach(n => {
+    if (n - previous > 1) items.push('<li class="page-item disabled"><span class="ellipse">…</span></li>');
+    items.push(n === page ? `<li class="page-item active"><span class="page-link current">${n}</span></li>` : link(n, n));
+    previous = n;
+  });
+  items.push(page < totalPages ? link(page + 1, 'Next', 'next') : '<li class="page-item disabled"><span class="page-link next">Next</span></li>');
+  return `<ul class="pagination" id="light-pagination">${items.join('')}</ul>`;
+}
+
+function loadPage(page) {
+  const body = new URLSearchParams();
+  body.append('payload', JSON.stringify(Object.assign({}, lastQuery, {page: page})));
+  body.append('__CSRF_FIELD__', document.querySelector('input[name="__CSRF_FIELD__"]').value);
+  return fetch('search-bids', {method: 'POST', body: body, headers: {'X-Requested-With': 'XMLHttpRequest'}})
+    .then(resp => resp.json())
+    .then(data => {
+      const inner = data.response.response;
+      const totalPages = Math.max(1, Math.ceil(inner.numFound / __PAGE_SIZE__));
+      const from = inner.numFound ? (page - 1) * __PAGE_SIZE__ + 1 : 0;
+      const to = (page - 1) * __PAGE_SIZE__ + inner.docs.length;
+      document.getElementById('results-holder').innerHTML = `<div id="result">
+  <span class="pos-bottom">Showing ${from} to ${to} of ${inner.numFound} records</span>
+  <div id="bidCard">${inner.docs.map(renderCard).join('')}</div>
+  ${renderPagination(page, totalPages)}
+</div>`;
+    });
+}
+
+function searchBid(type) {
+  lastQuery = {
+    searchType: type,
+    ministry: document.getElementById('ministry').value,
+    buyerState: '',
+    organization: document.getElementById('organization').value,
+    department: '',
+    bidEndFromMin: document.getElementById('bidendFromMinistrySearch').value,
+    bidEndToMin: document.getElementById('bidendToMinistrySearch').value
+  };
+  return loadPage(1);
+}
+</script>
+</body>
+</html>
+"""
+
+
+def render_page(csrf_token, organizations=ORGANIZATIONS, option_latency=0.2):
+    ministries = [MINISTRY] + OTHER_MINISTRIES
+    replacements = {
+        "__CSRF_FIELD__": CSRF_FIELD,
+        "__CSRF_TOKEN__": csrf_token,
+        "__MINISTRY_OPTIONS__": "".join(f'<option value="{html.escape(m)}">{html.escape(m)}</option>' for m in ministries),
+        "__MINISTRY_ITEMS__": "".join(f'<li class="select2-results__option">{html.escape(m)}</li>' for m in ministries),
+        "__ORGANIZATIONS__": json.dumps({MINISTRY: list(organizations)}),
+        "__OPTION_LATENCY_MS__": str(int(option_latency * 1000)),
+        "__PAGE_SIZE__": str(PAGE_SIZE),
+    }
+    page = PAGE_TEMPLATE
+    for key, value in replacements.items():
+        page = page.replace(key, value)
+    return page
+
+
+class MockGemHandler(BaseHTTPRequestHandler):
+    """advance-search, search-bids and showbidDocument, backed by make_fixtures() data."""
+
+    fixtures = {}
+    csrf_token = "mock-token"
+    latency = 0.0        # seconds before every search-bids answer
+    page_latency = 0.0   # seconds before the advance-search page
+    option_latency = 0.2
+    stats = None
+
+    def _send(self, status, body, content_type, headers=()):
+        body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _count(self, key):
+        if self.stats is not None:
+            with self.stats["lock"]:
+                self.stats[key] = self.stats.get(key, 0) + 1
+
+    def do_GET(self):
+        path = urlparse(self.path).path.rstrip("/")
+        if path.endswith("advance-search"):
+            self._count("pages")
+            time.sleep(self.page_latency)
+            self._send(200, render_page(self.csrf_token, list(self.fixtures), self.option_latency),
+                       "text/html; charset=utf-8",
+                       [("Set-Cookie", f"{CSRF_COOKIE}={self.csrf_token}; Path=/")])
+        elif "showbidDocument/" in path:
+            self._send(200, f"<html><body>Bid document {html.escape(path.rsplit('/', 1)[1])}</body></html>",
+                       "text/html; charset=utf-8")
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if not urlparse(self.path).path.rstrip("/").endswith("search-bids"):
+            self.send_error(404)
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        if form.get(CSRF_FIELD, [None])[0] != self.csrf_token:
+            self.send_error(403, "CSRF token mismatch")
+            return
+        try:
+            payload = json.loads(form["payload"][0])
+        except (KeyError, ValueError):
+            self.send_error(400, "missing payload")
+            return
+        self._count("searches")
+        time.sleep(self.latency)
+        num_found, docs = search(self.fixtures, payload)
+        body = {"code": 200, "response": {"response": {"numFound": num_found, "start": 0, "docs": docs}}}
+        self._send(200, json.dumps(body), "application/json")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_portal(records=500, latency=0.0, page_latency=0.0, option_latency=0.2, seed=7,
+                      first_day="2025-01-01", days=30, host="127.0.0.1", port=0):
+    """Serve the mock portal on a background thread; returns (server, base_url).
+
+    port=0 picks a free port. Request counts are kept in server.stats.
+    """
+    stats = {"lock": threading.Lock()}
+    handler = type("BoundMockGemHandler", (MockGemHandler,), {
+        "fixtures": make_fixtures(records, seed, first_day, days),
+        "csrf_token": secrets.token_hex(16),
+        "latency": latency,
+        "page_latency": page_latency,
+        "option_latency": option_latency,
+        "stats": stats,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.stats = stats
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a local mock of the GeM advance-search portal.")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--records", type=int, default=500, help="tenders per organization")
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds before each search-bids response")
+    parser.add_argument("--page-latency", type=float, default=0.5, help="seconds before the advance-search page")
+    parser.add_argument("--option-latency", type=float, default=0.2, help="seconds to load the organization list")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--first-day", default="2025-01-01")
+    parser.add_argument("--days", type=int, default=30, help="bid end dates are spread over this many days")
+    args = parser.parse_args(argv)
+
+    server, base_url = start_mock_portal(args.records, args.latency, args.page_latency, args.option_latency,
+                                         args.seed, args.first_day, args.days, port=args.port)
+    last_day = datetime.strptime(args.first_day, "%Y-%m-%d") + timedelta(days=args.days)
+    print(f"Mock GeM portal on {base_url}advance-search ({args.records} tenders per organization, "
+          f"bid end dates {args.first_day} to {last_day:%Y-%m-%d}). Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
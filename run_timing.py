@@ -0,0 +1,187 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Stage names shared by the GeM and CPPP scrapers, in the order a run goes through them
+DRIVER_STARTUP = "driver startup"
+NAVIGATION = "navigation"
+FORM_SETUP = "form setup"
+CAPTCHA_WAIT = "captcha wait"  # CPPP only: the user typing the CAPTCHA, not the scraper
+SEARCH_TRIGGER = "search trigger"
+PAGE_WAIT = "page wait"
+EXTRACTION = "extraction"
+MATCHING = "matching"
+EXPORT = "export"
+STAGES = [DRIVER_STARTUP, NAVIGATION, FORM_SETUP, CAPTCHA_WAIT, SEARCH_TRIGGER, PAGE_WAIT, EXTRACTION, MATCHING, EXPORT]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class RunTimer:
+    """Timing spans for one scrape run, written out as a JSON run report.
+
+    Wrap each stage in `with timer.span(stage, page=n):` and route fixed
+    waits through `timer.sleep(secs)`, which counts them against the stage
+    they happen in. Page workers may share one timer.
+    """
+
+    def __init__(self, source, run_id=None, params=None):
+        self.source = source
+        self.run_id = run_id
+        self.params = dict(params or {})
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self._finished = None
+        self.spans = []   # (stage, page, offset, secs)
+        self.sleeps = []  # (stage, page, secs)
+        self.parts = {}   # name -> report of a sub-run (e.g. one organization of a ministry sweep)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _current(self):
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else (None, None)
+
+    def add(self, stage, secs, page=None, offset=None):
+        """Record a span measured elsewhere (e.g. between two yields of a generator)."""
+        if offset is None:
+            offset = time.perf_counter() - self._started - secs
+        with self._lock:
+            self.spans.append((stage, page, offset, secs))
+
+    @contextmanager
+    def span(self, stage, page=None):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append((stage, page))
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            secs = time.perf_counter() - started
+            stack.pop()
+            self.add(stage, secs, page, started - self._started)
+
+    def sleep(self, secs):
+        """time.sleep(secs), booked as fixed-sleep time of the enclosing span."""
+        stage, page = self._current()
+        time.sleep(secs)
+        with self._lock:
+            self.sleeps.append((stage or "other", page, secs))
+
+    def add_part(self, name, timer):
+        """Keep a finished sub-run's totals under `name` in this run's report."""
+        timer.finish()
+        report = timer.report()
+        part = {
+            "total_secs": report["total_secs"],
+            "pages": report["pages"]["count"],
+            "page_p95_secs": report["pages"]["p95_secs"],
+            "stages": {stage: info["total_secs"] for stage, info in report["stages"].items()},
+        }
+        with self._lock:
+            self.parts[name] = part
+
+    def finish(self):
+        if self._finished is None:
+            self._finished = time.perf_counter()
+
+    def report(self):
+        """Totals per stage, per-page p50/p95 and how much of the run was fixed sleeps."""
+        total = (self._finished or time.perf_counter()) - self._started
+        with self._lock:
+            spans, sleeps = list(self.spans), list(self.sleeps)
+
+        stages = {}
+        for stage, page, _, secs in spans:
+            stages.setdefault(stage, []).append(secs)
+        sleep_by_stage = {}
+        for stage, _, secs in sleeps:
+            sleep_by_stage[stage] = sleep_by_stage.get(stage, 0.0) + secs
+
+        per_page = {}
+        for stage, page, _, secs in spans:
+            if page is not None and stage in (PAGE_WAIT, EXTRACTION):
+                per_page[page] = per_page.get(page, 0.0) + secs
+
+        order = {stage: i for i, stage in enumerate(STAGES)}
+        fixed_sleep = sum(secs for _, _, secs in sleeps)
+        report = {
+            "source": self.source,
+            "run_id": self.run_id,
+            "params": self.params,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "total_secs": round(total, 3),
+            "stages": {
+                stage: {
+                    "count": len(times),
+                    "total_secs": round(sum(times), 3),
+                    "p50_secs": round(percentile(times, 50), 3),
+                    "p95_secs": round(percentile(times, 95), 3),
+                    "fixed_sleep_secs": round(sleep_by_stage.get(stage, 0.0), 3),
+                }
+                for stage, times in sorted(stages.items(), key=lambda kv: order.get(kv[0], len(order)))
+            },
+            "pages": {
+                "count": len(per_page),
+                "p50_secs": round(percentile(list(per_page.values()), 50), 3) if per_page else None,
+                "p95_secs": round(percentile(list(per_page.values()), 95), 3) if per_page else None,
+                "slowest": sorted(((round(s, 3), p) for p, s in per_page.items()), reverse=True)[:5],
+            },
+            "fixed_sleep_secs": round(fixed_sleep, 3),
+            "fixed_sleep_share": round(fixed_sleep / total, 3) if total else 0.0,
+        }
+        if self.parts:
+            report["parts"] = dict(self.parts)
+        return report
+
+    def summary(self):
+        """One log line: total time, the biggest stages and the share spent in time.sleep."""
+        report = self.report()
+        top = sorted(report["stages"].items(), key=lambda kv: -kv[1]["total_secs"])[:4]
+        pages = report["pages"]
+        line = f"Run took {report['total_secs']:.1f}s: " + ", ".join(
+            f"{stage} {info['total_secs']:.1f}s" for stage, info in top
+        )
+        if pages["count"]:
+            line += f"; per page p50 {pages['p50_secs']:.2f}s / p95 {pages['p95_secs']:.2f}s"
+        return line + f"; {report['fixed_sleep_secs']:.1f}s ({report['fixed_sleep_share']:.0%}) in fixed sleeps."
+
+    def save(self, folder):
+        """Write the report to folder/<source>-<run_id>.json and return the path."""
+        self.finish()
+        os.makedirs(folder, exist_ok=True)
+        name = self.run_id or self.started_at.strftime("%Y%m%d-%H%M%S-%f")
+        path = os.path.join(folder, f"{self.source}-{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+
+if __name__ == "__main__":
+    # python run_timing.py run-reports/gem-*.json   compare saved run reports
+    import glob
+    import sys
+
+    paths = sorted({p for pattern in sys.argv[1:] for p in glob.glob(pattern)})
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        pages = report["pages"]
+        print(f"{os.path.basename(path)}: {report['total_secs']:.1f}s total, {pages['count']} pages "
+              f"(p50 {pages['p50_secs'] or 0:.2f}s, p95 {pages['p95_secs'] or 0:.2f}s), "
+              f"{report['fixed_sleep_secs']:.1f}s fixed sleep ({report['fixed_sleep_share']:.0%})")
+        for stage, info in report["stages"].items():
+            print(f"    {stage:<16} {info['total_secs']:8.2f}s  x{info['count']:<4} "
+                  f"p50 {info['p50_secs']:.2f}s  p95 {info['p95_secs']:.2f}s  sleep {info['fixed_sleep_secs']:.2f}s")
+        for name, part in report.get("parts", {}).items():
+            print(f"    [{name}] {part['total_secs']:.2f}s, {part['pages']} pages")
@@ -0,0 +1,342 @@
+import csv
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+
+import pandas as pd
+from openpyxl import Workbook
+
+# Fields that make a GeM bid "changed" when they differ from what we stored last time
+FINGERPRINT_FIELDS = ("Item Description", "Quantity", "Department", "Start Date", "End Date")
+
+GEM_DATE_FORMATS = ("%d-%m-%Y %I:%M %p", "%d-%m-%Y")
+CPPP_DATE_FORMATS = ("%d-%b-%Y %I:%M %p", "%d-%b-%Y")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tenders (
+    source       TEXT NOT NULL,             -- 'gem' or 'cppp'
+    tender_id    TEXT NOT NULL,             -- BID NO, or the CPPP tender link
+    organization TEXT NOT NULL,
+    title        TEXT,
+    end_date     TEXT,                      -- ISO 8601, for range queries
+    fingerprint  TEXT NOT NULL,
+    record       TEXT NOT NULL,             -- the scraped dict as JSON, exported as-is
+    run_id       TEXT NOT NULL,             -- last run that saw this tender
+    seq          INTEGER NOT NULL,          -- position within that run
+    first_seen   TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_seen    TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source, tender_id, organization)
+);
+CREATE INDEX IF NOT EXISTS idx_tenders_tender_id ON tenders (tender_id);
+CREATE INDEX IF NOT EXISTS idx_tenders_organization ON tenders (organization);
+CREATE INDEX IF NOT EXISTS idx_tenders_end_date ON tenders (end_date);
+CREATE INDEX IF NOT EXISTS idx_tenders_run ON tenders (run_id, seq);
+
+CREATE TABLE IF NOT EXISTS matches (
+    source       TEXT NOT NULL,
+    tender_id    TEXT NOT NULL,
+    organization TEXT NOT NULL,
+    keyword      TEXT NOT NULL,
+    run_id       TEXT NOT NULL,
+    matched_at   TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source, tender_id, organization, keyword)
+);
+CREATE INDEX IF NOT EXISTS idx_matches_keyword ON matches (keyword);
+CREATE INDEX IF NOT EXISTS idx_matches_run ON matches (run_id);
+"""
+
+
+def record_fingerprint(tender, fields=FINGERPRINT_FIELDS):
+    joined = "\x1f".join(str(tender.get(field, "")) for field in fields)
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+
+
+def iso_date(text, formats):
+    """Parse a portal date string into ISO 8601; None when it doesn't parse."""
+    for fmt in formats:
+        try:
+            return datetime.strptime((text or "").strip(), fmt).isoformat(sep=" ")
+        except ValueError:
+            continue
+    return None
+
+
+def cppp_tender_id(tender):
+    """CPPP rows have no bid number; the tender link is the stable identifier."""
+    link = tender.get("Link")
+    return link if link not in (None, "No Link") else tender.get("Title", "")
+
+
+def new_run_id():
+    return datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+
+
+class TenderStore:
+    """Local SQLite system of record for everything the GeM and CPPP scrapers collect.
+
+    Tenders are upserted in batches keyed by (source, id, organization) and
+    keyword hits go to a separate matches table; the Excel/CSV files are
+    exported from here rather than built from in-memory lists.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    # ─── Writes ──────────────────────────────────────────────────────────
+
+    def _upsert(self, rows, batch_size=500):
+        """Upsert any iterable of rows, committing every batch_size rows."""
+        count = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                self._upsert_batch(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._upsert_batch(batch)
+            count += len(batch)
+        return count
+
+    def _upsert_batch(self, rows):
+        with self._lock:
+            self.conn.executemany(
+                """INSERT INTO tenders
+                       (source, tender_id, organization, title, end_date, fingerprint, record, run_id, seq)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (source, tender_id, organization) DO UPDATE SET
+                       title = excluded.title,
+                       end_date = excluded.end_date,
+                       fingerprint = excluded.fingerprint,
+                       record = excluded.record,
+                       run_id = excluded.run_id,
+                       seq = excluded.seq,
+                       last_seen = CURRENT_TIMESTAMP""",
+                rows,
+            )
+            self.conn.commit()
+
+    def _next_seq(self, run_id):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COALESCE(MAX(seq), -1) + 1 FROM tenders WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return row[0]
+
+    def upsert_gem(self, tenders, organization, run_id):
+        """Insert or refresh GeM bids (dicts as built by the card extractors).
+
+        A bid's own "Organization" field (set by ministry sweeps) wins over `organization`.
+        """
+        start = self._next_seq(run_id)
+        rows = (
+            (
+                "gem", t["BID NO"], t.get("Organization") or organization, t.get("Item Description"),
+                iso_date(t.get("End Date"), GEM_DATE_FORMATS), record_fingerprint(t),
+                json.dumps(t, ensure_ascii=False), run_id, start + i,
+            )
+            for i, t in enumerate(tenders) if t.get("BID NO") not in (None, "N/A")
+        )
+        return self._upsert(rows)
+
+    def upsert_cppp(self, tenders, run_id):
+        """Insert or refresh CPPP (etenders.gov.in) rows."""
+        start = self._next_seq(run_id)
+        fields = ("Title", "Closing Date", "Opening Date", "Tender Value")
+        rows = (
+            (
+                "cppp", cppp_tender_id(t), t.get("Organisation Chain", ""), t.get("Title"),
+                iso_date(t.get("Closing Date"), CPPP_DATE_FORMATS), record_fingerprint(t, fields),
+                json.dumps(t, ensure_ascii=False), run_id, start + i,
+            )
+            for i, t in enumerate(tenders)
+        )
+        return self._upsert(rows)
+
+    def record_matches(self, source, matches, run_id):
+        """matches: iterable of (tender_id, organization, keyword)."""
+        rows = [(source, tender_id, org, kw, run_id) for tender_id, org, kw in matches]
+        with self._lock:
+            self.conn.executemany(
+                """INSERT INTO matches (source, tender_id, organization, keyword, run_id)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (source, tender_id, organization, keyword) DO UPDATE SET
+                       run_id = excluded.run_id,
+                       matched_at = CURRENT_TIMESTAMP""",
+                rows,
+            )
+            self.conn.commit()
+
+    # ─── Incremental sync ────────────────────────────────────────────────
+
+    def classify(self, tenders, organization):
+        """Return the GeM tenders that are new or whose fingerprint changed."""
+        keyed = [t for t in tenders if t.get("BID NO") not in (None, "N/A")]
+        if not keyed:
+            return list(tenders)
+        bid_nos = [t["BID NO"] for t in keyed]
+        placeholders = ",".join("?" * len(bid_nos))
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT tender_id, fingerprint FROM tenders "
+                f"WHERE source = 'gem' AND organization = ? AND tender_id IN ({placeholders})",
+                [organization, *bid_nos],
+            ).fetchall()
+        known = dict(rows)
+        return [
+            t for t in tenders
+            if t.get("BID NO") in (None, "N/A") or known.get(t["BID NO"]) != record_fingerprint(t)
+        ]
+
+    # ─── Reads / exports ─────────────────────────────────────────────────
+
+    def _stream(self, sql, params, batch_size=500):
+        """Yield rows in batches without holding the whole result set in memory.
+
+        File databases get their own read connection (WAL lets it run next
+        to the writer); in-memory ones fall back to the shared connection.
+        """
+        if self.path == ":memory:":
+            with self._lock:
+                rows = self.conn.execute(sql, params).fetchall()
+            yield from rows
+            return
+        reader = sqlite3.connect(self.path)
+        try:
+            cursor = reader.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            reader.close()
+
+    def iter_run(self, run_id, source="gem"):
+        """Every tender a run saw, in the order it was scraped."""
+        for (record,) in self._stream(
+            "SELECT record FROM tenders WHERE source = ? AND run_id = ? ORDER BY seq",
+            (source, run_id),
+        ):
+            yield json.loads(record)
+
+    def iter_matches(self, run_id=None, source="gem", since=None, keyword=None, organization=None):
+        """Matched tenders with a "Matched Keyword" field (first keyword per tender)."""
+        sql = [
+            "SELECT t.record, m.keyword FROM matches m",
+            "JOIN tenders t ON t.source = m.source AND t.tender_id = m.tender_id"
+            " AND t.organization = m.organization",
+            "WHERE m.source = ?",
+        ]
+        params = [source]
+        if run_id is not None:
+            sql.append("AND m.run_id = ?")
+            params.append(run_id)
+        if since is not None:
+            sql.append("AND m.matched_at >= ?")
+            params.append(since)
+        if keyword is not None:
+            sql.append("AND m.keyword = ?")
+            params.append(keyword)
+        if organization is not None:
+            sql.append("AND m.organization = ?")
+            params.append(organization)
+        sql.append("ORDER BY t.run_id, t.seq, m.rowid")
+        seen = set()
+        for record, kw in self._stream(" ".join(sql), params):
+            tender = json.loads(record)
+            key = tender.get("BID NO") or tender.get("Link") or record
+            if key in seen:
+                continue
+            seen.add(key)
+            tender["Matched Keyword"] = kw
+            yield tender
+
+    def run_frame(self, run_id, source="gem"):
+        return pd.DataFrame(list(self.iter_run(run_id, source)))
+
+    def matches_frame(self, **filters):
+        return pd.DataFrame(list(self.iter_matches(**filters)))
+
+    def save_cppp_run(self, tenders, keywords, run_id):
+        """Upsert a CPPP run and record which keyword each title matched."""
+        self.upsert_cppp(tenders, run_id)
+        matches = []
+        for t in tenders:
+            title = (t.get("Title") or "").lower()
+            kw = next((kw for kw in keywords if kw.lower() in title), None)
+            if kw:
+                matches.append((cppp_tender_id(t), t.get("Organisation Chain", ""), kw))
+        self.record_matches("cppp", matches, run_id)
+
+    def export_run(self, run_id, filename, source="gem"):
+        return write_records(self.iter_run(run_id, source), filename)
+
+    def export_matches(self, filename, **filters):
+        return write_records(self.iter_matches(**filters), filename)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def write_records(records, filename):
+    """Stream dicts into an .xlsx (write-only workbook) or .csv file; returns the row count.
+
+    The header comes from the first record, so memory stays flat no matter
+    how many rows are written.
+    """
+    records = iter(records)
+    first = next(records, None)
+    header = list(first) if first is not None else []
+    count = 0
+
+    if filename.lower().endswith(".csv"):
+        with open(filename, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=header, restval="", extrasaction="ignore")
+            writer.writeheader()
+            if first is not None:
+                writer.writerow(first)
+                count = 1
+                for record in records:
+                    writer.writerow(record)
+                    count += 1
+        return count
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(header)
+    if first is not None:
+        ws.append([first.get(col, "") for col in header])
+        count = 1
+        for record in records:
+            ws.append([record.get(col, "") for col in header])
+            count += 1
+    wb.save(filename)
+    return count
+
+
+if __name__ == "__main__":
+    # Export past matches without opening a pile of spreadsheets:
+    #   python tender_store.py tenders.db matches.xlsx [since YYYY-MM-DD] [keyword]
+    if len(sys.argv) < 3:
+        print("usage: tender_store.py DB OUTPUT.xlsx|.csv [SINCE] [KEYWORD]")
+        sys.exit(1)
+    store = TenderStore(sys.argv[1])
+    count = store.export_matches(
+        sys.argv[2],
+        since=sys.argv[3] if len(sys.argv) > 3 else None,
+        keyword=sys.argv[4] if len(sys.argv) > 4 else None,
+    )
+    print(f"Exported {count} matched tenders to '{sys.argv[2]}'")
+    store.close()
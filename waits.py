@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+PROFILE_PATH = os.path.join(os.path.expanduser("~"), ".askara_tender_search", "waits.json")
+
+MIN_SAMPLES = 5      # observations needed before a wait's timeout is learned
+HISTORY = 50         # observations kept per wait
+SAFETY = 4.0         # learned timeout = p95 * SAFETY + SLACK
+SLACK = 1.0
+MIN_OPTIONAL = 2.0   # an optional wait never gives up sooner than this
+
+# True once the search has rendered: at least one card, or an empty-result message
+RESULTS_READY_JS = """
+if (document.querySelector('#bidCard .card')) return true;
+const result = document.getElementById('result');
+return !!result && /no\\s+(record|result|bid|data)|of\\s+0\\s+(record|result|entries)/i.test(result.innerText);
+"""
+
+
+def _load_profile(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def results_ready(driver):
+    return driver.execute_script(RESULTS_READY_JS)
+
+
+def document_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def attribute_changed(locator, name, old_value):
+    """Condition: the element at locator exists and its attribute differs from old_value."""
+    def check(driver):
+        try:
+            return driver.find_element(*locator).get_attribute(name) != old_value
+        except Exception:
+            return False
+    return check
+
+
+class Waits:
+    """Condition-based waits whose timeouts are learned from how long they actually take.
+
+    Every named wait records its latency (kept in the profile across runs).
+    A required wait never gives up sooner than its default timeout, but
+    stretches to p95 * SAFETY when the site has been slower than that, up to
+    3x the default. An optional wait (the element may legitimately never
+    appear, e.g. a CAPTCHA) gives up after the learned time instead of
+    the default. Either way it returns as soon as its condition holds, which
+    is what replaces the fixed sleeps.
+    """
+
+    def __init__(self, profile_path=PROFILE_PATH, poll=0.1):
+        self.profile_path = profile_path
+        self.poll = poll
+        self.history = {name: list(samples)[-HISTORY:] for name, samples in _load_profile(profile_path).items()}
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def learned(self, name):
+        """p95 * SAFETY + SLACK of the recorded latencies, or None with too few of them."""
+        with self._lock:
+            samples = sorted(self.history.get(name, []))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return p95 * SAFETY + SLACK
+
+    def timeout(self, name, default, required=True):
+        learned = self.learned(name)
+        if learned is None:
+            return default
+        if required:
+            return min(max(default, learned), default * 3)
+        return min(max(MIN_OPTIONAL, learned), default)
+
+    def observe(self, name, secs):
+        with self._lock:
+            samples = self.history.setdefault(name, [])
+            samples.append(round(secs, 3))
+            del samples[:-HISTORY]
+
+    def until(self, driver, name, condition, default=10, required=True):
+        """WebDriverWait(...).until(condition) under a learned timeout; raises TimeoutException."""
+        timeout = self.timeout(name, default, required)
+        started = time.perf_counter()
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=self.poll).until(condition)
+        except TimeoutException:
+            with self._lock:
+                self.timeouts += 1
+            if required:
+                # A required wait that timed out was at least this slow; remember it so the next one is more patient
+                self.observe(name, time.perf_counter() - started)
+            raise
+        self.observe(name, time.perf_counter() - started)
+        return result
+
+    def summary(self):
+        with self._lock:
+            names = sorted(self.history)
+        parts = []
+        for name in names:
+            learned = self.learned(name)
+            if learned is not None:
+                parts.append(f"{name} {learned:.1f}s")
+        if not parts:
+            return None
+        return "Learned wait timeouts: " + ", ".join(parts) + (f" ({self.timeouts} timed out)" if self.timeouts else "")
+
+    def save(self):
+        with self._lock:
+            data = {name: samples for name, samples in self.history.items()}
+        os.makedirs(os.path.dirname(self.profile_path), exist_ok=True)
+        tmp = self.profile_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.profile_path)